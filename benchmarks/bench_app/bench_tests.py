@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.test import TestCase
+from ttoolly.models import FormAddTestMixIn, FormEditTestMixIn
+
+from .models import (
+    BOOL_FIELDS,
+    CHAR_FIELDS,
+    CHAR_MAX_LENGTH,
+    CHILD_CHAR_FIELDS,
+    CHILD_INT_FIELDS,
+    DATE_FIELDS,
+    EMAIL_FIELDS,
+    EMAIL_MAX_LENGTH,
+    FILE_FIELDS,
+    FILE_NAME_MAX_LENGTH,
+    FLOAT_FIELDS,
+    INT_FIELDS,
+    INT_MAX_VALUE,
+    INT_MIN_VALUE,
+    REQUIRED_CHAR_FIELDS,
+    ChildModel,
+    ParentModel,
+    RelatedItem,
+    WideModel,
+)
+
+
+def get_fields_params(chars, ints, floats, emails, bools, dates, files, prefix='', required=REQUIRED_CHAR_FIELDS):
+    """Ttoolly attributes for fields created by models.get_wide_fields"""
+    names = lambda fields: [prefix + name for name in fields]
+    return dict(
+        all_fields=names(chars) + names(ints) + names(floats) + names(emails) + names(bools) + names(dates)
+        + names(files),
+        date_fields=names(dates),
+        digital_fields=names(ints) + names(floats),
+        email_fields=names(emails),
+        int_fields=names(ints),
+        max_fields_length=dict(
+            [(name, CHAR_MAX_LENGTH) for name in names(chars)]
+            + [(name, INT_MAX_VALUE) for name in names(ints)]
+            + [(name, float(INT_MAX_VALUE)) for name in names(floats)]
+            + [(name, EMAIL_MAX_LENGTH) for name in names(emails)]
+            + [(name, FILE_NAME_MAX_LENGTH) for name in names(files)]
+        ),
+        min_fields_length=dict(
+            [(name, INT_MIN_VALUE) for name in names(ints)] + [(name, float(INT_MIN_VALUE)) for name in names(floats)]
+        ),
+        not_str_fields=names(bools),
+        default_params=dict(
+            [(name, 'value') for name in names(chars) if name in names(required)]
+            + [(name, 1) for name in names(ints)]
+            + [(name, 1.5) for name in names(floats)]
+        ),
+        file_fields_params={name: {} for name in names(files)},
+    )
+
+
+def merge_params(*params):
+    result = {}
+    for p in params:
+        for k, v in p.items():
+            if isinstance(v, list):
+                result[k] = result.get(k, []) + v
+            elif isinstance(v, dict):
+                result[k] = dict(result.get(k, {}), **v)
+            else:
+                result[k] = v
+    return result
+
+
+def create_objects():
+    items = [RelatedItem.objects.create(name='item %d' % i) for i in range(3)]
+    for i in range(2):
+        obj = WideModel.objects.create(**{name: 'value' for name in REQUIRED_CHAR_FIELDS})
+        obj.many_related.set(items)
+        parent = ParentModel.objects.create(**{name: 'value' for name in REQUIRED_CHAR_FIELDS})
+        ChildModel.objects.create(parent=parent, **{name: 'value' for name in CHILD_CHAR_FIELDS[:1]})
+
+
+WIDE_PARAMS = get_fields_params(CHAR_FIELDS, INT_FIELDS, FLOAT_FIELDS, EMAIL_FIELDS, BOOL_FIELDS, DATE_FIELDS, FILE_FIELDS)
+WIDE_PARAMS['all_fields'] += ['foreign_key', 'many_related']
+PARENT_PARAMS = merge_params(
+    get_fields_params(CHAR_FIELDS[:20], INT_FIELDS[:10], FLOAT_FIELDS[:5], EMAIL_FIELDS[:2], BOOL_FIELDS[:2], (), ()),
+    get_fields_params(
+        CHILD_CHAR_FIELDS, CHILD_INT_FIELDS, (), (), (), (), (), prefix='children-0-', required=CHILD_CHAR_FIELDS[:1]
+    ),
+)
+MANAGEMENT_FORM_PARAMS = {
+    'children-TOTAL_FORMS': 1,
+    'children-INITIAL_FORMS': 0,
+    'children-MIN_NUM_FORMS': 0,
+    'children-MAX_NUM_FORMS': 1000,
+}
+PARENT_PARAMS['default_params'].update(MANAGEMENT_FORM_PARAMS)
+
+
+class TestWideModel(FormAddTestMixIn, FormEditTestMixIn, TestCase):
+    choice_fields = ('foreign_key',)
+    multiselect_fields = ('many_related',)
+    obj = WideModel
+    required_fields = REQUIRED_CHAR_FIELDS
+    url_add = 'widemodel-create'
+    url_edit = 'widemodel-update'
+    all_fields = WIDE_PARAMS['all_fields']
+    date_fields = WIDE_PARAMS['date_fields']
+    default_params = WIDE_PARAMS['default_params']
+    digital_fields = WIDE_PARAMS['digital_fields']
+    email_fields = WIDE_PARAMS['email_fields']
+    file_fields_params = WIDE_PARAMS['file_fields_params']
+    int_fields = WIDE_PARAMS['int_fields']
+    max_fields_length = WIDE_PARAMS['max_fields_length']
+    min_fields_length = WIDE_PARAMS['min_fields_length']
+    not_str_fields = WIDE_PARAMS['not_str_fields']
+
+    @classmethod
+    def setUpTestData(cls):
+        create_objects()
+
+    def setUp(self):
+        pks = list(RelatedItem.objects.values_list('pk', flat=True))
+        self.choice_fields_values = {'foreign_key': pks, 'many_related': pks}
+
+
+class TestParentModel(FormAddTestMixIn, FormEditTestMixIn, TestCase):
+    obj = ParentModel
+    required_fields = REQUIRED_CHAR_FIELDS + ['children-0-%s' % CHILD_CHAR_FIELDS[0]] + list(MANAGEMENT_FORM_PARAMS.keys())
+    url_add = 'parentmodel-create'
+    url_edit = 'parentmodel-update'
+    all_fields = PARENT_PARAMS['all_fields']
+    date_fields = PARENT_PARAMS['date_fields']
+    default_params = PARENT_PARAMS['default_params']
+    digital_fields = PARENT_PARAMS['digital_fields']
+    email_fields = PARENT_PARAMS['email_fields']
+    file_fields_params = PARENT_PARAMS['file_fields_params']
+    int_fields = PARENT_PARAMS['int_fields']
+    max_fields_length = PARENT_PARAMS['max_fields_length']
+    min_fields_length = PARENT_PARAMS['min_fields_length']
+    not_str_fields = PARENT_PARAMS['not_str_fields']
+    # id of edited child is set in update_params_for_obj
+    required_fields_edit = required_fields + ['children-0-id']
+
+    @classmethod
+    def setUpTestData(cls):
+        create_objects()
+
+    def update_params_for_obj(self, obj):
+        """Existing child is edited by inline form, new child is not added on every edit"""
+        child = obj.children.first()
+        if child:
+            self.default_params_edit.update({'children-0-id': child.pk, 'children-INITIAL_FORMS': 1})
+        else:
+            self.default_params_edit.pop('children-0-id', None)
+            self.default_params_edit['children-INITIAL_FORMS'] = 0
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django import forms
+
+from .models import FILE_FIELDS, FILE_NAME_MAX_LENGTH, ChildModel, ParentModel, WideModel
+
+
+class WideModelForm(forms.ModelForm):
+    class Meta:
+        model = WideModel
+        fields = '__all__'
+
+    def __init__(self, *args, **kwargs):
+        super(WideModelForm, self).__init__(*args, **kwargs)
+        # model field max_length includes upload_to
+        for name in FILE_FIELDS:
+            self.fields[name].max_length = FILE_NAME_MAX_LENGTH
+
+
+class ParentModelForm(forms.ModelForm):
+    class Meta:
+        model = ParentModel
+        fields = '__all__'
+
+
+ChildFormSet = forms.inlineformset_factory(
+    ParentModel, ChildModel, fields='__all__', extra=1, max_num=1, can_delete=False
+)
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from collections import OrderedDict
+
+from django.core.validators import MaxValueValidator, MinValueValidator
+from django.db import models
+
+CHAR_FIELDS = ['char%d' % i for i in range(50)]
+REQUIRED_CHAR_FIELDS = CHAR_FIELDS[:10]
+INT_FIELDS = ['int%d' % i for i in range(30)]
+FLOAT_FIELDS = ['float%d' % i for i in range(10)]
+EMAIL_FIELDS = ['email%d' % i for i in range(5)]
+BOOL_FIELDS = ['bool%d' % i for i in range(5)]
+DATE_FIELDS = ['date%d' % i for i in range(5)]
+FILE_FIELDS = ['file%d' % i for i in range(2)]
+CHILD_CHAR_FIELDS = ['child_char%d' % i for i in range(5)]
+CHILD_INT_FIELDS = ['child_int%d' % i for i in range(5)]
+
+CHAR_MAX_LENGTH = 50
+EMAIL_MAX_LENGTH = 254
+FILE_NAME_MAX_LENGTH = 100
+UPLOAD_TO = 'tmp/'
+INT_MIN_VALUE = -1000
+INT_MAX_VALUE = 1000
+
+
+def get_wide_fields(chars=CHAR_FIELDS, ints=INT_FIELDS, floats=FLOAT_FIELDS, emails=EMAIL_FIELDS, bools=BOOL_FIELDS,
+                    dates=DATE_FIELDS, files=FILE_FIELDS, required=REQUIRED_CHAR_FIELDS):
+    fields = OrderedDict()
+    for name in chars:
+        fields[name] = models.CharField(max_length=CHAR_MAX_LENGTH, blank=name not in required)
+    for name in ints:
+        fields[name] = models.IntegerField(
+            null=True, blank=True, validators=[MinValueValidator(INT_MIN_VALUE), MaxValueValidator(INT_MAX_VALUE)]
+        )
+    for name in floats:
+        fields[name] = models.FloatField(
+            null=True,
+            blank=True,
+            validators=[MinValueValidator(float(INT_MIN_VALUE)), MaxValueValidator(float(INT_MAX_VALUE))],
+        )
+    for name in emails:
+        fields[name] = models.EmailField(max_length=EMAIL_MAX_LENGTH, blank=True)
+    for name in bools:
+        fields[name] = models.BooleanField(default=False)
+    for name in dates:
+        fields[name] = models.DateField(null=True, blank=True)
+    for name in files:
+        # stored name contains upload_to
+        fields[name] = models.FileField(
+            null=True, blank=True, upload_to=UPLOAD_TO, max_length=len(UPLOAD_TO) + FILE_NAME_MAX_LENGTH
+        )
+    return fields
+
+
+def create_model(name, fields, **meta):
+    attrs = dict(fields)
+    attrs['__module__'] = __name__
+    attrs['Meta'] = type(str('Meta'), (object,), dict(ordering=['pk'], **meta))
+    attrs['__str__'] = lambda self: '%s: %s' % (name, self.pk)
+    return type(str(name), (models.Model,), attrs)
+
+
+RelatedItem = create_model(str('RelatedItem'), {'name': models.CharField(max_length=50)})
+
+WideModel = create_model(
+    str('WideModel'),
+    dict(
+        get_wide_fields(),
+        foreign_key=models.ForeignKey(RelatedItem, null=True, blank=True, on_delete=models.CASCADE),
+        many_related=models.ManyToManyField(RelatedItem, related_name='wide_models', blank=True),
+    ),
+)
+
+ParentModel = create_model(
+    str('ParentModel'),
+    get_wide_fields(CHAR_FIELDS[:20], INT_FIELDS[:10], FLOAT_FIELDS[:5], EMAIL_FIELDS[:2], BOOL_FIELDS[:2], (), ()),
+)
+
+ChildModel = create_model(
+    str('ChildModel'),
+    dict(
+        get_wide_fields(CHILD_CHAR_FIELDS, CHILD_INT_FIELDS, (), (), (), (), (), required=CHILD_CHAR_FIELDS[:1]),
+        parent=models.ForeignKey(ParentModel, related_name='children', on_delete=models.CASCADE),
+    ),
+)
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+try:
+    from django.urls import re_path as url
+except ImportError:
+    # Django < 4.0
+    from django.conf.urls import url
+
+from .views import ParentModelCreateView, ParentModelUpdateView, WideModelCreateView, WideModelUpdateView
+
+urlpatterns = [
+    url(r'^wide/create/$', WideModelCreateView.as_view(), name='widemodel-create'),
+    url(r'^wide/(?P<pk>\d+)/update/$', WideModelUpdateView.as_view(), name='widemodel-update'),
+    url(r'^parent/create/$', ParentModelCreateView.as_view(), name='parentmodel-create'),
+    url(r'^parent/(?P<pk>\d+)/update/$', ParentModelUpdateView.as_view(), name='parentmodel-update'),
+]
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.views.generic.edit import CreateView, UpdateView
+
+from .forms import ChildFormSet, ParentModelForm, WideModelForm
+from .models import ParentModel, WideModel
+
+
+class WideModelCreateView(CreateView):
+    model = WideModel
+    form_class = WideModelForm
+    template_name = 'bench_app/form.html'
+    success_url = '.'
+
+
+class WideModelUpdateView(UpdateView):
+    model = WideModel
+    form_class = WideModelForm
+    template_name = 'bench_app/form.html'
+    success_url = '.'
+
+
+class ParentModelFormsetMixIn(object):
+    model = ParentModel
+    form_class = ParentModelForm
+    template_name = 'bench_app/form.html'
+    success_url = '.'
+
+    def get_context_data(self, **kwargs):
+        context = super(ParentModelFormsetMixIn, self).get_context_data(**kwargs)
+        context.setdefault('formset', ChildFormSet(instance=self.object))
+        return context
+
+    def post(self, request, *args, **kwargs):
+        self.object = self.get_object() if 'pk' in kwargs else None
+        form = self.get_form()
+        formset = ChildFormSet(request.POST, request.FILES, instance=self.object)
+        if form.is_valid() and formset.is_valid():
+            self.object = form.save()
+            formset.instance = self.object
+            formset.save()
+            return super(ParentModelFormsetMixIn, self).form_valid(form)
+        return self.render_to_response(self.get_context_data(form=form, formset=formset))
+
+
+class ParentModelCreateView(ParentModelFormsetMixIn, CreateView):
+    pass
+
+
+class ParentModelUpdateView(ParentModelFormsetMixIn, UpdateView):
+    pass
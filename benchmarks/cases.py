@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from collections import OrderedDict
+
+from django import forms
+from django.core.files.base import ContentFile
+from django.template import Context
+from django.test import TestCase
+from django.test.utils import ContextList
+from past.builtins import xrange
+
+try:
+    from django.urls import include, re_path as url
+except ImportError:
+    # Django < 4.0
+    from django.conf.urls import include, url
+
+BENCHMARKS = OrderedDict()
+
+
+def benchmark(name, number=1):
+    """
+    Register benchmark. Decorated function prepares data and returns callable for measure
+    """
+
+    def decorator(fn):
+        BENCHMARKS[name] = (fn, number)
+        return fn
+
+    return decorator
+
+
+def get_test_instance(mixin, **attrs):
+    attrs['runTest'] = lambda self: None
+    return type(str('Benchmark%s' % mixin.__name__), (mixin, TestCase), attrs)()
+
+
+class FakeResponse(object):
+    status_code = 200
+
+    def __init__(self, context):
+        self.context = context
+
+
+def get_big_form(fields_count=200, data=None):
+    fields = {'field_%d' % i: forms.CharField(max_length=10) for i in xrange(fields_count)}
+    fields.update({'hidden_%d' % i: forms.CharField(widget=forms.HiddenInput) for i in xrange(fields_count // 10)})
+    form = type(str('BigForm'), (forms.Form,), fields)(data=data if data is not None else {})
+    form.is_valid()
+    return form
+
+
+def get_big_context(subcontexts_count=500, keys_count=20):
+    form = get_big_form()
+    context = ContextList()
+    for n in xrange(subcontexts_count):
+        c = Context({'key_%d' % i: i for i in xrange(keys_count)})
+        c.update({'widget': {'name': 'field_%d' % n, 'attrs': {}}})
+        context.append(c)
+    context.append(Context({'form': form, 'forms': {'form': form}}))
+    return FakeResponse(context)
+
+
+for size, number in ((10 ** 4, 100), (10 ** 5, 10), (10 ** 6, 1)):
+
+    @benchmark('get_randname_%d' % size, number=number)
+    def bench_get_randname(size=size):
+        from ttoolly.utils import get_randname
+
+        return lambda: get_randname(size)
+
+
+for img_format in ('BMP', 'GIF', 'JPEG', 'PNG', 'TIFF'):
+
+    @benchmark('get_random_img_content_%s' % img_format.lower(), number=5)
+    def bench_get_random_img_content(img_format=img_format):
+        from ttoolly.utils import get_random_img_content
+
+        return lambda: get_random_img_content(img_format, size='100K', width=500, height=500)
+
+
+@benchmark('deepcopy_with_file_params', number=20)
+def bench_deepcopy():
+    from ttoolly.models import GlobalTestMixIn
+
+    btc = get_test_instance(GlobalTestMixIn)
+    params = {'field_%d' % i: 'value_%d' % i for i in xrange(200)}
+    params.update({'list_%d' % i: ['value_%d' % j for j in xrange(10)] for i in xrange(20)})
+    params.update({'file_%d' % i: ContentFile(b'x' * 100000, name='file_%d.txt' % i) for i in xrange(20)})
+
+    def run():
+        btc.deepcopy(params)
+        del btc.files[:]
+
+    return run
+
+
+@benchmark('assert_object_fields', number=20)
+def bench_assert_object_fields():
+    from test_project.test_app.models import OtherModel, SomeModel
+    from ttoolly.models import FormTestMixIn
+
+    other = [OtherModel.objects.create(other_text_field='text %d' % i) for i in xrange(5)]
+    obj = SomeModel.objects.create(
+        char_field='char', text_field='text', int_field=10, digital_field=1.5, email_field='qwe@qwe.qwe',
+        foreign_key_field=other[0],
+    )
+    obj.many_related_field.set(other)
+    params = {
+        'char_field': 'char',
+        'text_field': 'text',
+        'int_field': 10,
+        'digital_field': 1.5,
+        'email_field': 'qwe@qwe.qwe',
+        'foreign_key_field': other[0].pk,
+        'many_related_field': [o.pk for o in other],
+    }
+    ftc = get_test_instance(FormTestMixIn, obj=SomeModel, default_params=params)
+    return lambda: ftc.assert_object_fields(obj, params)
+
+
+@benchmark('get_all_form_errors_big_context', number=20)
+def bench_get_all_form_errors():
+    from ttoolly.utils import get_all_form_errors
+
+    response = get_big_context()
+    return lambda: get_all_form_errors(response)
+
+
+@benchmark('get_fields_list_from_response_big_context', number=20)
+def bench_get_fields_list_from_response():
+    from ttoolly.utils import get_fields_list_from_response
+
+    response = get_big_context()
+    return lambda: get_fields_list_from_response(response)
+
+
+@benchmark('get_all_urls', number=1)
+def bench_get_all_urls():
+    from ttoolly.utils import get_all_urls
+
+    def view(request):
+        pass
+
+    urlpatterns = [
+        url(
+            r'^section%d/' % i,
+            include(
+                [url(r'^page%d/(?P<pk>\d+)/(?P<slug>[\w-]+)/$' % j, view, name='page%d' % j) for j in xrange(20)]
+            ),
+        )
+        for i in xrange(50)
+    ]
+    return lambda: get_all_urls(urlpatterns)
+
+
+@benchmark('filter_tests_by_tags_rule', number=5)
+def bench_filter_tests_by_tags_rule():
+    import unittest
+
+    from ttoolly.for_runner import algebra
+    from ttoolly.runner import filter_tests_by_tags_rule
+
+    tags = ('fast', 'slow', 'add', 'edit', 'negative', 'positive')
+    suite = unittest.TestSuite()
+    for n in xrange(50):
+        methods = {}
+        for i in xrange(100):
+
+            def test(self):
+                pass
+
+            test.tags = set([tags[i % len(tags)], tags[(i + n) % len(tags)]])
+            methods['test_%d' % i] = test
+        test_class = type(str('TestClass%d' % n), (unittest.TestCase,), methods)
+        suite.addTests(unittest.defaultTestLoader.loadTestsFromTestCase(test_class))
+    parsed_rule = algebra.parse('(add or edit) and not slow')
+    return lambda: filter_tests_by_tags_rule(suite, parsed_rule)
+
+
+@benchmark('create_test_classes', number=5)
+def bench_create_test_classes():
+    from ttoolly.models import FormAddTestMixIn, FormEditTestMixIn
+
+    def run():
+        for n in xrange(20):
+            cls = type(str('AddTestClass%d' % n), (FormAddTestMixIn, TestCase), {})
+            for i in xrange(5):
+                cls = type(str('AddTestClass%d_%d' % (n, i)), (cls,), {'test_%d' % i: lambda self: None})
+            type(str('EditTestClass%d' % n), (FormEditTestMixIn, TestCase), {})
+
+    return run
+
+
+@benchmark('use_in_all_tests', number=5)
+def bench_use_in_all_tests():
+    from ttoolly.models import FormAddTestMixIn, FormEditTestMixIn
+    from ttoolly.utils.decorators import use_in_all_tests
+
+    def decorator(fn):
+        return lambda self, *args, **kwargs: fn(self, *args, **kwargs)
+
+    def run():
+        for n in xrange(20):
+            cls = type(str('TestClass%d' % n), (FormAddTestMixIn, FormEditTestMixIn, TestCase), {})
+            use_in_all_tests(decorator)(cls)
+
+    return run
+
+
+@benchmark('import_ttoolly_models', number=1)
+def bench_import_ttoolly_models():
+    import os
+    import subprocess
+    import sys
+
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    code = 'import django; django.setup(); import ttoolly.models'
+    return lambda: subprocess.check_call([sys.executable, '-c', code], env=env)
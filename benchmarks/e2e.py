@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+End-to-end benchmark: runs ttoolly generated tests over wide forms from benchmarks.bench_app
+
+Usage: python -m benchmarks.e2e [test labels ...] [--output results.json] [--tracemalloc] [--top N]
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import argparse
+import json
+import os
+import sys
+import timeit
+import unittest
+from collections import OrderedDict
+
+DEFAULT_LABELS = ['benchmarks.bench_app.bench_tests']
+
+
+class RequestsCounter(object):
+    """
+    Counts started requests (request_started signal): requests of test client, AsyncClient and direct view calls
+    (direct_view_call). Form validation subcases (form_class_add, form_class_edit) send no requests
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __enter__(self):
+        from django.core.signals import request_started
+
+        request_started.connect(self.on_request_started, dispatch_uid='ttoolly-e2e-requests-counter')
+        return self
+
+    def on_request_started(self, **kwargs):
+        self.count += 1
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        from django.core.signals import request_started
+
+        request_started.disconnect(dispatch_uid='ttoolly-e2e-requests-counter')
+
+
+class BenchmarkResult(unittest.TextTestResult):
+    requests_counter = None
+
+    def __init__(self, *args, **kwargs):
+        super(BenchmarkResult, self).__init__(*args, **kwargs)
+        self.tests_stats = OrderedDict()
+
+    def startTest(self, test):
+        self._test_start = (timeit.default_timer(), self.requests_counter.count)
+        super(BenchmarkResult, self).startTest(test)
+
+    def stopTest(self, test):
+        super(BenchmarkResult, self).stopTest(test)
+        start_time, start_requests = self._test_start
+        self.tests_stats[test.id()] = {
+            'time': timeit.default_timer() - start_time,
+            'requests': self.requests_counter.count - start_requests,
+        }
+
+
+def get_peak_memory():
+    """Peak resident memory of process in Mb"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    value = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return value / 1024 / 1024 if sys.platform == 'darwin' else value / 1024
+
+
+def run(labels, verbosity=1, use_tracemalloc=False):
+    from django.test.utils import setup_databases, setup_test_environment, teardown_databases, teardown_test_environment
+
+    if use_tracemalloc:
+        import tracemalloc
+
+        tracemalloc.start()
+    setup_test_environment()
+    old_config = setup_databases(verbosity=0, interactive=False)
+    try:
+        suite = unittest.defaultTestLoader.loadTestsFromNames(labels)
+        with RequestsCounter() as counter:
+            BenchmarkResult.requests_counter = counter
+            runner = unittest.TextTestRunner(
+                stream=sys.stderr if verbosity > 1 else open(os.devnull, 'w'),
+                resultclass=BenchmarkResult,
+                verbosity=verbosity,
+            )
+            start = timeit.default_timer()
+            result = runner.run(suite)
+            total_time = timeit.default_timer() - start
+    finally:
+        teardown_databases(old_config, verbosity=0)
+        teardown_test_environment()
+
+    tests_count = len(result.tests_stats)
+    stats = OrderedDict(
+        [
+            ('total_time', total_time),
+            ('tests', tests_count),
+            ('time_per_test', total_time / tests_count if tests_count else 0),
+            ('requests', counter.count),
+            ('failures', len(result.failures)),
+            ('errors', len(result.errors)),
+            ('skipped', len(result.skipped)),
+            ('peak_memory_mb', get_peak_memory()),
+        ]
+    )
+    if use_tracemalloc:
+        stats['peak_traced_memory_mb'] = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        tracemalloc.stop()
+    stats['tests_stats'] = result.tests_stats
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='ttoolly end-to-end benchmark')
+    parser.add_argument('labels', nargs='*', default=DEFAULT_LABELS, help='Test labels')
+    parser.add_argument('--output', help='Save results to json')
+    parser.add_argument('--top', type=int, default=10, help='Show N slowest tests. Default 10')
+    parser.add_argument('--tracemalloc', action='store_true', help='Measure peak of python allocations (slower)')
+    parser.add_argument('-v', '--verbosity', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'benchmarks.settings')
+    import django
+
+    django.setup()
+    stats = run(args.labels, args.verbosity, args.tracemalloc)
+
+    for key, value in stats.items():
+        if key != 'tests_stats':
+            print('%-25s %s' % (key, '%.3f' % value if isinstance(value, float) else value))
+    print('\n%-100s %10s %10s' % ('slowest tests', 'time, s', 'requests'))
+    for test_id, data in sorted(stats['tests_stats'].items(), key=lambda item: item[1]['time'], reverse=True)[
+        : args.top
+    ]:
+        print('%-100s %10.3f %10d' % (test_id, data['time'], data['requests']))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(stats, f, indent=2)
+            f.write('\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+Usage: python -m benchmarks.run [names regexp ...] [--save] [--repeat N] [--max-ratio X]
+
+Results are compared in units of calibration workload, measured in the same run right before every repeat,
+so baselines do not depend on speed of machine (but can depend on versions of python and libraries)
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import argparse
+from copy import deepcopy
+import json
+import os
+import re
+import sys
+import timeit
+
+BASELINES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines.json')
+CALIBRATION_DATA = [{'key_%d' % i: ['value_%d' % j for j in range(10)]} for i in range(100)]
+
+
+def load_baselines(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def measure(fn, number, repeat):
+    """
+    (best time in seconds, median of times in calibration units).
+    Calibration workload is measured right before every repeat, so changes of machine load affect both times
+    """
+    times = []
+    relative = []
+    for _ in range(repeat):
+        unit = min(timeit.repeat(calibration_workload, number=20, repeat=3)) / 20
+        value = timeit.timeit(fn, number=number) / number
+        times.append(value)
+        relative.append(value / unit)
+    return min(times), sorted(relative)[len(relative) // 2]
+
+
+def calibration_workload():
+    """Pure python work with dicts, lists and strings, independent of ttoolly code"""
+    return sorted(json.dumps(el, sort_keys=True) for el in deepcopy(CALIBRATION_DATA))
+
+
+def run_benchmarks(names=None, repeat=5):
+    """
+    {name: (seconds, calibration units)}
+    """
+    from .cases import BENCHMARKS
+
+    results = {}
+    for name, (fn, number) in BENCHMARKS.items():
+        if names and not any(re.findall(n, name) for n in names):
+            continue
+        results[name] = measure(fn(), number, repeat)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='ttoolly benchmarks')
+    parser.add_argument('names', nargs='*', help='Regexps for benchmark names')
+    parser.add_argument('--repeat', type=int, default=5, help='Best time and median in calibration units of N runs are used. Default 5')
+    parser.add_argument('--baselines', default=BASELINES_PATH, help='Path to baselines json')
+    parser.add_argument('--save', action='store_true', help='Save results as baselines')
+    parser.add_argument(
+        '--max-ratio', type=float, default=1.5, help='Fail if result is slower than baseline * max-ratio. Default 1.5'
+    )
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'benchmarks.settings')
+    import django
+    from django.test.utils import setup_databases, setup_test_environment, teardown_databases, teardown_test_environment
+
+    django.setup()
+    setup_test_environment()
+    old_config = setup_databases(verbosity=0, interactive=False)
+    try:
+        results = run_benchmarks(args.names, args.repeat)
+    finally:
+        teardown_databases(old_config, verbosity=0)
+        teardown_test_environment()
+
+    baselines = load_baselines(args.baselines)
+    regressions = []
+    print('%-45s %14s %10s %10s %8s' % ('benchmark', 'result, ms', 'units', 'baseline', 'ratio'))
+    for name, (value, relative) in sorted(results.items()):
+        baseline = baselines.get(name)
+        ratio = relative / baseline if baseline else None
+        print(
+            '%-45s %14.3f %10.3f %10s %8s'
+            % (name, value * 1000, relative, '%.3f' % baseline if baseline else '-', '%.2f' % ratio if ratio else '-')
+        )
+        if ratio and ratio > args.max_ratio:
+            regressions.append(name)
+
+    if args.save:
+        baselines.update({name: relative for name, (_, relative) in results.items()})
+        with open(args.baselines, 'w') as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print('Baselines saved to %s' % args.baselines)
+    elif regressions:
+        print('Slower than baseline * %s: %s' % (args.max_ratio, ', '.join(regressions)))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
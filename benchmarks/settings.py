@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from test_project.settings import *  # noqa
+from tests.settings_test import *  # noqa
+
+COLORIZE_TESTS = False
+INSTALLED_APPS += ('benchmarks.bench_app',)  # noqa
+ROOT_URLCONF = 'benchmarks.urls'
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'loggers': {'django.request': {'level': 'ERROR'}},
+}
@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from test_project.urls import urlpatterns as test_project_urlpatterns
+
+from .bench_app.urls import urlpatterns as bench_app_urlpatterns
+
+urlpatterns = test_project_urlpatterns + bench_app_urlpatterns
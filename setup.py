@@ -32,7 +32,9 @@ setup(
     author_email="pefremova@gmail.com",
     keywords=["django", "testing", "test tool"],
     include_package_data=True,
-    packages=find_packages(exclude=["tests", "test_project"]),
+    packages=find_packages(
+        exclude=["benchmarks", "benchmarks.*", "tests", "tests.*", "test_project", "test_project.*"]
+    ),
     install_requires=install_requires,
     classifiers=(
         "Framework :: Django",
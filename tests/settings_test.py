@@ -1,9 +1,17 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
+import atexit
+import shutil
+import tempfile
+
 DATABASES = {
     'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'},
 }
 
 TEST_RUNNER = 'ttoolly.runner.RegexpTestSuiteRunner'
 COLORIZE_TESTS = True
+
+# uploaded files of test objects
+MEDIA_ROOT = tempfile.mkdtemp(prefix='ttoolly_media_')
+atexit.register(shutil.rmtree, MEDIA_ROOT, ignore_errors=True)
@@ -3,29 +3,43 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import ast
 from collections import OrderedDict
-from copy import copy
+from copy import copy, deepcopy
 from datetime import date, datetime, time
 import hashlib
 import imghdr
+from io import StringIO
+import json
 import os
 import os.path
+import pickle
+import random
 import re
 from shutil import rmtree
+import subprocess
 import sys
 import tempfile
 import unittest
 
 from builtins import str
 from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.core.signals import request_started
 from django.core.files.base import File, ContentFile
+from django.db import models
 from django.db.models.fields.files import FieldFile
 from django.http import HttpResponse
 from django.test import TestCase
+from django.test.signals import setting_changed
+from django.test.utils import isolate_apps
+from future.utils import viewitems
 from past.builtins import xrange
 from test_project.test_app.models import OtherModel, SomeModel
 from ttoolly import utils
-from ttoolly.models import FormTestMixIn, GlobalTestMixIn
+from ttoolly.models import FormTestMixIn, GlobalTestMixIn, UserPermissionsTestMixIn
+from ttoolly.runner import JournalResultMixIn, RegexpTestSuiteRunner, get_rerun_label
 from ttoolly.utils import FILE_TYPES, to_bytes
+from ttoolly.utils.decorators import form_validation_subcases
 import xml.etree.cElementTree as et
 
 
@@ -43,10 +57,16 @@ class custom_override_settings(object):
         self.wrapped = copy(settings._wrapped)
         for key, new_value in self.options.items():
             setattr(settings, key, new_value)
+            setting_changed.send(sender=settings._wrapped.__class__, setting=key, value=new_value, enter=True)
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        from django.conf import settings
+
         settings._wrapped = self.wrapped
         del self.wrapped
+        for key in self.options:
+            new_value = getattr(settings, key, None)
+            setting_changed.send(sender=settings._wrapped.__class__, setting=key, value=new_value, enter=False)
 
 
 class TestWithSettingsOwerride(unittest.TestCase):
@@ -75,6 +95,73 @@ class TestGlobalTestMixInMethods(TestWithSettingsOwerride):
     def tearDown(self):
         rmtree(TEMP_DIR)
 
+    def test_class_config_restored_after_test(self):
+        file_value = ContentFile(b'qwerty', 'test.txt')
+
+        class ConfigTestCase(GlobalTestMixIn, TestCase):
+            values_dict = {'field1': [1, 2]}
+            values_list = ['value1']
+            files_dict = {'file': file_value}
+
+            def test_1_change(self):
+                self.values_dict['field1'].append(3)
+                self.values_dict['field2'] = 'new'
+                self.values_list.append('value2')
+                self.assertIsNot(self.files_dict, ConfigTestCase.files_dict)
+                self.files_dict['file'] = None
+
+            def test_2_check(self):
+                self.assertEqual(self.values_dict, {'field1': [1, 2]})
+                self.assertEqual(self.values_list, ['value1'])
+                self.assertIs(self.values_list, ConfigTestCase.values_list)
+                self.assertIsNot(self.files_dict, ConfigTestCase.files_dict)
+
+        values_dict = ConfigTestCase.values_dict
+        result = unittest.TestResult()
+        unittest.TestSuite([ConfigTestCase('test_1_change'), ConfigTestCase('test_2_check')]).run(result)
+        self.assertEqual(result.errors + result.failures, [])
+        self.assertIs(ConfigTestCase.values_dict, values_dict)
+        self.assertEqual(ConfigTestCase.files_dict, {'file': file_value})
+
+    def test_test_methods_wrapped_once(self):
+        class SomeCases(object):
+            def test_some(self):
+                pass
+
+        class FirstTestCase(GlobalTestMixIn, SomeCases, TestCase):
+            pass
+
+        wrapped = SomeCases.__dict__['test_some']
+        self.assertEqual([d.__name__ for d in wrapped.decorators], ['check_errors'])
+
+        class SecondTestCase(FirstTestCase):
+            pass
+
+        self.assertIs(SomeCases.__dict__['test_some'], wrapped)
+
+        def test_other(self):
+            pass
+
+        SomeCases.test_other = test_other
+
+        class ThirdTestCase(FirstTestCase):
+            pass
+
+        self.assertIs(SomeCases.__dict__['test_some'], wrapped)
+        self.assertEqual([d.__name__ for d in SomeCases.__dict__['test_other'].decorators], ['check_errors'])
+
+        def test_new(self):
+            pass
+
+        # same count of attributes in class __dict__
+        del SomeCases.test_other
+        SomeCases.test_new = test_new
+
+        class FourthTestCase(FirstTestCase):
+            pass
+
+        self.assertEqual([d.__name__ for d in SomeCases.__dict__['test_new'].decorators], ['check_errors'])
+
     def test_assert_form_equal_positive(self):
         fields_list_1 = ['test1', 'test2']
         fields_list_2 = ['test2', 'test1']
@@ -457,6 +544,38 @@ class TestGlobalTestMixInMethods(TestWithSettingsOwerride):
         self.btc.default_params_edit = {'some_test': f}
         self.assertFalse(self.btc.is_file_field('some_test'))
 
+    def test_get_subcases_resets_current_subcase(self):
+        for field in self.btc.get_subcases(['field1', 'field2']):
+            self.assertEqual(self.btc._current_subcase, 'field1')
+            break
+        self.assertIsNone(self.btc._current_subcase)
+        with self.assertRaises(ValueError):
+            for field in self.btc.get_subcases(['field1']):
+                raise ValueError
+        self.assertIsNone(self.btc._current_subcase)
+
+    def test_get_subcases_with_empty_tuple(self):
+        self.assertEqual(list(self.btc.get_subcases(((), ('field1', 1)))), [(), ('field1', 1)])
+        self.btc.selected_subcases = {'field': ['field2']}
+        self.assertEqual(list(self.btc.get_subcases(((), ('field1', 1)))), [()])
+
+    def test_is_field_with_changed_settings(self):
+        self.btc.digital_fields = ['some_field', 'inline-0-field']
+        self.assertTrue(self.btc.is_digital_field('some_field'))
+        self.assertTrue(self.btc.is_digital_field('inline-2-field'))
+        self.assertFalse(self.btc.is_digital_field('other_field'))
+        self.btc.digital_fields.append('other_field')
+        self.assertFalse(self.btc.is_digital_field('other_field'))
+        self.btc.digital_fields = self.btc.digital_fields
+        self.assertTrue(self.btc.is_digital_field('other_field'))
+        self.btc.digital_fields = ('some_field',)
+        self.assertFalse(self.btc.is_digital_field('inline-2-field'))
+        self.btc.digital_fields_edit = ['inline-0-field']
+        self.assertTrue(self.btc.is_digital_field('inline-2-field'))
+        self.btc.digital_fields_edit = ['new_field']
+        self.assertFalse(self.btc.is_digital_field('inline-2-field'))
+        self.assertTrue(self.btc.is_digital_field('new_field'))
+
     def test_get_field_by_name(self):
         self.assertEqual(self.btc.get_field_by_name(SomeModel, 'text_field'), SomeModel._meta.get_field('text_field'))
         self.assertEqual(
@@ -918,6 +1037,7 @@ class TestGlobalTestMixInMethods(TestWithSettingsOwerride):
     def test_errors_append_empty(self):
         self.btc.errors = []
         self.btc.errors_append()
+        self.assertFalse(self.btc.has_errors())
         self.assertEqual(self.btc.errors, [])
 
     def test_errors_append_with_text(self):
@@ -953,6 +1073,26 @@ class TestGlobalTestMixInMethods(TestWithSettingsOwerride):
         self.assertIn("int('q')\nValueError: invalid literal for int() with base 10: 'q'\n", self.btc.errors[0])
         self.assertTrue(self.btc.errors[0].startswith('\x1B[38;5;11mTest text:\n\x1B[0m'))
 
+    def test_errors_append_without_locals(self):
+        self.btc.errors = []
+        with self.settings(COLORIZE_TESTS=False):
+            try:
+                int('q')
+            except Exception:
+                self.btc.errors_append(text='Test text')
+        self.assertEqual(len(self.btc._errors), 1)
+        error = self.btc._errors[0]
+        self.assertIsInstance(error, utils.LazyError)
+        self.assertTrue(all(frame.locals is None for frame in error.exception.stack))
+        self.assertTrue(self.btc.has_errors())
+        self.assertIsInstance(self.btc._errors[0], utils.LazyError)
+        self.assertTrue(self.btc.errors[0].startswith('Test text:\n'))
+        self.assertIsInstance(self.btc._errors[0], str)
+        self.assertIsNone(error.exception)
+        with self.assertRaises(AssertionError) as ar:
+            self.btc.formatted_assert_errors()
+        self.assertIn("int('q')\nValueError: invalid literal for int() with base 10: 'q'\n", str(ar.exception))
+
     def test_custom_errors_append(self):
         self.btc.errors = []
         some_errors = []
@@ -1401,6 +1541,51 @@ class TestFormTestMixInMethods(TestWithSettingsOwerride):
             {'field1': ['Тестовое сообщение об ошибке qwe'], 'field2': ['Второе сообщение']},
         )
 
+    def test_get_error_message_with_locals_from_test(self):
+        value = 'qwe'
+        self.assertEqual(
+            self.ftc.get_error_message('wrong_value', 'some_field'),
+            {'some_field': ['Выберите корректный вариант. qwe нет среди допустимых значений.']},
+        )
+        self.assertEqual(
+            self.ftc.get_error_message('required', 'some_field', locals={'length': 10, 'value': '{}'}),
+            {'some_field': ['Обязательное поле.']},
+        )
+
+    def test_get_error_message_with_changed_settings(self):
+        self.assertEqual(self.ftc.get_error_message('required', 'some_field'), {'some_field': ['Обязательное поле.']})
+        with self.settings(ERROR_MESSAGES={'required': 'Заполните поле {field}'}):
+            self.assertEqual(
+                self.ftc.get_error_message('required', 'some_field'), {'some_field': ['Заполните поле some_field']}
+            )
+        self.assertEqual(self.ftc.get_error_message('required', 'some_field'), {'some_field': ['Обязательное поле.']})
+
+    def test_get_error_messages_lookup(self):
+        custom_error_messages = {'some_field': {'required': 'Заполните поле', 'wrong_value': {'other_field': 'Ошибка'}}}
+        self.ftc.custom_error_messages = custom_error_messages
+        self.assertEqual(self.ftc.get_error_field('wrong_value', 'some_field'), 'other_field')
+        self.assertEqual(self.ftc.get_error_message('required', 'some_field'), {'some_field': ['Заполните поле']})
+        lookup = self.ftc.get_error_messages_lookup()
+        self.assertEqual(lookup['lookup'][('message', 'required', 'some_field')], ('required', 'Заполните поле'))
+        self.assertEqual(lookup['lookup'][('field', 'wrong_value', 'some_field', '__all__')], 'other_field')
+
+        self.assertIs(self.ftc.get_error_messages_lookup(), lookup)
+
+        self.ftc.custom_error_messages['some_field']['required'] = ['Новое сообщение']
+        self.ftc.custom_error_messages = self.ftc.custom_error_messages
+        self.assertIsNot(self.ftc.get_error_messages_lookup(), lookup)
+        self.assertEqual(self.ftc.get_error_message('required', 'some_field'), {'some_field': ['Новое сообщение']})
+        self.ftc.custom_error_messages['some_field']['required'] = 'Заполните поле'
+
+        self.ftc.custom_error_messages = {}
+        self.assertIsNot(self.ftc.get_error_messages_lookup(), lookup)
+        self.assertEqual(self.ftc.get_error_field('wrong_value', 'some_field'), 'some_field')
+        self.assertEqual(self.ftc.get_error_message('required', 'some_field'), {'some_field': ['Обязательное поле.']})
+        with self.settings(ERROR_MESSAGES={'required': 'Заполните поле {field}'}):
+            self.assertEqual(
+                self.ftc.get_error_message('required', 'some_field'), {'some_field': ['Заполните поле some_field']}
+            )
+
     def test_get_object_fields(self):
         some_element = SomeModel()
         other_element = OtherModel()
@@ -1561,6 +1746,241 @@ class TestFormTestMixInMethods(TestWithSettingsOwerride):
             {'max_values': {sys.float_info.max, 100}, 'min_values': {-sys.float_info.max}},
         )
 
+    def test_get_fuzzing_cases(self):
+        self.ftc.obj = SomeModel
+        self.ftc.all_fields_add = ['char_field', 'int_field']
+        self.ftc.digital_fields_add = ['int_field']
+        self.ftc.int_fields_add = ['int_field']
+        self.ftc.required_fields_add = ['char_field']
+        self.ftc.min_fields_length = {'char_field': 3}
+        self.ftc.max_fields_length = {'char_field': 10, 'int_field': 100}
+        cases = self.ftc.get_fuzzing_cases('add')
+        self.assertEqual(
+            sorted([(field, description, is_valid) for field, description, _, is_valid in cases]),
+            [
+                ('char_field', 'empty value', False),
+                ('char_field', 'length < min', False),
+                ('char_field', 'length > max', False),
+                ('char_field', 'max length', True),
+                ('char_field', 'min length', True),
+                ('char_field', 'random value', True),
+                ('int_field', 'max value', True),
+                ('int_field', 'min value', True),
+                ('int_field', 'random value', True),
+                ('int_field', 'value < min', False),
+                ('int_field', 'value > max', False),
+                ('int_field', 'wrong value', False),
+            ],
+        )
+        values = {(field, description): generator() for field, description, generator, _ in cases}
+        self.assertEqual(len(values[('char_field', 'length > max')]), 11)
+        self.assertEqual(len(values[('char_field', 'length < min')]), 2)
+        self.assertTrue(3 <= len(values[('char_field', 'random value')]) <= 10)
+        self.assertEqual(values[('int_field', 'value > max')], 101)
+        self.assertEqual(values[('int_field', 'value < min')], -2147483649)
+
+    def test_get_compatible_fields_groups(self):
+        self.ftc._depend_one_of_fields_add = {'field1': ['field2'], 'field2': ['field1']}
+        self.ftc.only_if_value_add = {'field3': {'field4': 1}, 'field5': {'field4': 2}, 'field6': {'field1': 1}}
+        self.assertEqual(
+            self.ftc.get_compatible_fields_groups(['field1', 'field2', 'field3', 'field4', 'field5', 'field6'], 'add'),
+            [['field1', 'field3'], ['field2', 'field4', 'field6'], ['field5']],
+        )
+
+    def test_get_independent_fields(self):
+        self.ftc._depend_one_of_fields_add = {'field1': ['field2'], 'field2': ['field1']}
+        self.ftc.required_if_add = {'field3': 'field4'}
+        self.ftc.required_if_value_add = {('field5',): [{'field6': 1}]}
+        self.ftc.only_if_value_add = {'field7': {'field8': 1}}
+        self.assertEqual(
+            self.ftc.get_independent_fields(['field%s' % i for i in xrange(1, 11)], 'add'), ['field9', 'field10']
+        )
+
+    def test_get_fields_dependencies(self):
+        self.ftc.required_if_add = {'field1': 'field2'}
+        self.ftc.only_if_value_add = {'field3': {'field4': 1}}
+        self.ftc.required_if_value_add = {'field5': [{'field6': 1}], 'field6': {'field7': 2}}
+        dependencies = self.ftc.get_fields_dependencies('_add')
+        self.assertEqual(dependencies['required_if'], {'field1': ('field2',)})
+        self.assertEqual(dependencies['only_if_value'], {'field4': [('field3', {'field4': 1})]})
+        self.assertEqual(
+            dependencies['required_if_value'],
+            {'field6': [('field5', {'field6': 1})], 'field7': [('field6', {'field7': 2})]},
+        )
+        self.assertEqual(
+            dependencies['required_if_value_order'], [('field6', ({'field7': 2},)), ('field5', ({'field6': 1},))]
+        )
+        self.assertIs(self.ftc.get_fields_dependencies('_add'), dependencies)
+        self.ftc.required_if_add = {'field1': ('field2', 'field8')}
+        self.assertEqual(self.ftc.get_fields_dependencies('_add')['required_if'], {'field1': ('field2', 'field8')})
+
+    def test_fill_with_related(self):
+        self.ftc._testMethodName = 'test_add_object_some_positive'
+        self.ftc.clean_depend_fields_add = lambda params, field: None
+        self.ftc.required_if_add = {'field1': 'field2'}
+        self.ftc.only_if_value_add = {'field3': {'field4': 1}}
+        self.ftc.required_if_value_add = {'field5': [{'field6': 1}], 'field6': {'field7': 2}}
+        params = {'field3': 'qwe', 'field4': 1, 'field5': '', 'field6': ''}
+        self.ftc.fill_with_related(params, 'field1', 'value1')
+        self.assertEqual(params['field1'], 'value1')
+        self.assertTrue(params['field2'])
+        self.ftc.fill_with_related(params, 'field4', 2)
+        self.assertEqual(params['field3'], '')
+        self.ftc.fill_with_related(params, 'field7', 2)
+        self.assertTrue(params['field6'])
+        self.assertEqual(params['field5'], '')
+        params['field6'] = ''
+        params['field7'] = 2
+        self.ftc.fill_required_if(params)
+        self.assertTrue(params['field6'])
+
+    def test_get_default_params(self):
+        self.ftc.all_unique = {('test_field',): 'test_field'}
+        self.ftc.file_fields_params_add = {'file_field': {}}
+        file_value = ContentFile(b'qwerty', 'test.txt')
+        self.ftc.default_params_add = {'test_field': 'qwe', 'list_field': [1, 2], 'file_field': file_value}
+        template = self.ftc.get_params_template('add')
+        self.assertEqual(template['values'], {'test_field': 'qwe', 'list_field': [1, 2], 'file_field': None})
+        self.assertEqual(template['file_keys'], {'file_field': False})
+        self.assertEqual(template['mutable_keys'], ['list_field'])
+        self.assertEqual(template['unique_keys'], {'test_field'})
+
+        params = self.ftc.get_default_params('add')
+        self.assertEqual(list(params.keys()), ['test_field', 'list_field', 'file_field'])
+        self.assertNotEqual(params['test_field'], 'qwe')
+        self.assertEqual(params['list_field'], [1, 2])
+        self.assertIsNot(params['list_field'], template['values']['list_field'])
+        self.assertTrue(params['file_field'])
+        self.assertIsNot(params['file_field'], file_value)
+        self.assertIs(self.ftc.get_params_template('add'), template)
+
+        self.ftc.default_params_add['list_field'] = [3]
+        self.assertEqual(self.ftc.get_params_template('add')['values']['list_field'], [3])
+        self.assertEqual(self.ftc.get_default_params('add')['list_field'], [3])
+
+        self.ftc.all_unique = {('list_field',): 'list_field'}
+        self.assertEqual(self.ftc.get_params_template('add')['unique_keys'], {'list_field'})
+        self.assertEqual(self.ftc.get_default_params('add')['test_field'], 'qwe')
+
+    def test_get_default_params_with_overridden_update_params(self):
+        class FormTestCase(self.ftc.__class__):
+            def update_params(self, params):
+                params['test_field'] = 'updated'
+
+        test = FormTestCase()
+        test.default_params_add = {'test_field': 'qwe', 'other_field': 1}
+        self.assertEqual(test.get_default_params('add'), {'test_field': 'updated', 'other_field': 1})
+
+    def test_form_config_prepared_once_per_class(self):
+        prepared = []
+
+        class FormTestCase(FormTestMixIn, TestCase):
+            default_params = {'field1': 'value1', 'field2': 2}
+            unique_fields = ('field1',)
+
+            def _prepare_form_config(self):
+                prepared.append(self)
+                super(FormTestCase, self)._prepare_form_config()
+
+            def runTest(self):
+                pass
+
+        first = FormTestCase()
+        second = FormTestCase()
+        self.assertEqual(len(prepared), 1)
+        for name in ('default_params_add', 'all_fields_edit', 'unique_fields_add', 'date_fields'):
+            self.assertIs(getattr(second, name), getattr(first, name))
+        self.assertEqual(second.all_fields_add, ['field1', 'field2'])
+
+        FormTestCase.default_params = {'field3': 'value3'}
+        third = FormTestCase()
+        self.assertEqual(len(prepared), 2)
+        self.assertEqual(third.all_fields_add, ['field3'])
+
+    def test_prepared_form_config_restored_after_test(self):
+        class FormTestCase(FormTestMixIn, TestCase):
+            default_params = {'field1': 'value1', 'field2': [1, 2]}
+
+            def test_1_change(self):
+                self.default_params_add['field1'] = 'new'
+                self.default_params_add['field2'].append(3)
+                self.all_fields_edit.append('field3')
+                self.all_fields_add = ['field4']
+
+            def test_2_check(self):
+                self.assertEqual(self.default_params_add, {'field1': 'value1', 'field2': [1, 2]})
+                self.assertEqual(self.all_fields_edit, ['field1', 'field2'])
+                self.assertEqual(self.all_fields_add, ['field1', 'field2'])
+
+        first = FormTestCase('test_1_change')
+        second = FormTestCase('test_2_check')
+        self.assertIs(first.default_params_add, second.default_params_add)
+        result = unittest.TestResult()
+        unittest.TestSuite([first, second]).run(result)
+        self.assertEqual(result.errors + result.failures, [])
+
+    def test_state_released_after_test(self):
+        class FormTestCase(FormTestMixIn, TestCase):
+            default_params = {'field1': 'value1', 'field2': 2}
+
+            def test_1(self):
+                self.assertEqual(self.all_fields_add, ['field1', 'field2'])
+                self.errors.append('error')
+                self.errors = []
+
+        first = FormTestCase('test_1')
+        suite = unittest.TestSuite([first, FormTestCase('test_1')])
+        result = unittest.TestResult()
+        suite.run(result)
+        self.assertEqual(result.errors + result.failures, [])
+        self.assertEqual(suite._tests, [None, None])
+        for name in ('all_fields_add', 'default_params_edit', '_fields_index', '_shared_config', '_config_copies'):
+            self.assertNotIn(name, first.__dict__)
+        self.assertEqual(first.errors, [])
+
+        result = unittest.TestResult()
+        first(result)
+        self.assertEqual(result.errors + result.failures, [])
+
+    def test_state_kept_without_release_state(self):
+        class FormTestCase(FormTestMixIn, TestCase):
+            default_params = {'field1': 'value1', 'field2': 2}
+
+            def test_1(self):
+                pass
+
+        test = FormTestCase('test_1')
+        result = unittest.TestResult()
+        with self.settings(TEST_RELEASE_STATE=False):
+            test(result)
+        self.assertEqual(result.errors + result.failures, [])
+        self.assertEqual(test.__dict__['all_fields_add'], ['field1', 'field2'])
+
+    def test_check_fields_by_bisection(self):
+        checked_groups = []
+
+        def check(group):
+            checked_groups.append(group)
+            self.assertNotIn('field6', group)
+            self.assertNotIn('field2', group)
+
+        self.ftc.errors = []
+        self.ftc.check_fields_by_bisection(
+            ['field%s' % i for i in xrange(1, 9)], check, lambda field: 'Error in %s' % field
+        )
+        self.assertEqual(len(self.ftc.errors), 2)
+        self.assertIn('Error in field2:', self.ftc.errors[0])
+        self.assertIn('Error in field6:', self.ftc.errors[1])
+        self.assertEqual(len(checked_groups), 11)
+        self.assertEqual(checked_groups[0], ['field%s' % i for i in xrange(1, 9)])
+
+    def test_check_fields_by_bisection_failed(self):
+        checked_groups = []
+        self.ftc.errors = []
+        self.ftc.check_fields_by_bisection(['field1', 'field2', 'field3'], checked_groups.append, str, failed=True)
+        self.assertEqual(checked_groups, [['field1'], ['field2', 'field3']])
+        self.assertEqual(self.ftc.errors, [])
+
     def test_get_value_for_field(self):
         res = self.ftc.get_value_for_field(15, 'some_field_name')
         self.assertIsInstance(res, str)
@@ -1668,6 +2088,39 @@ class TestUtils(TestWithSettingsOwerride):
     def tearDown(self):
         rmtree(TEMP_DIR)
 
+    def test_get_model_meta(self):
+        meta = utils.get_model_meta(SomeModel)
+        self.assertIs(utils.get_model_meta(SomeModel()), meta)
+        self.assertIs(meta.get_field('int_field'), SomeModel._meta.get_field('int_field'))
+        self.assertEqual(meta.values_ranges['int_field'], ((2147483647, sys.maxsize), (-2147483647 - 1, -sys.maxsize - 1)))
+        self.assertIn('one_to_one_related_name', utils.get_model_meta(OtherModel).related_objects)
+        with self.assertRaises(TypeError):
+            meta.fields['int_field'] = None
+
+        with isolate_apps('test_project.test_app'):
+
+            class NewModel(models.Model):
+                some = models.ForeignKey(SomeModel, on_delete=models.CASCADE)
+
+        self.assertIsNot(utils.get_model_meta(SomeModel), meta)
+
+    def test_heavy_modules_not_imported(self):
+        code = (
+            'import sys, django; django.setup(); import ttoolly.models, ttoolly.runner; '
+            'print(",".join(m for m in ("psycopg2", "lxml", "freezegun", "pytz") if m in sys.modules))'
+        )
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE='test_project.settings')
+        output = subprocess.check_output(
+            [sys.executable, '-c', code], env=env, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        )
+        self.assertEqual(output.decode('utf-8').strip(), '')
+
+    def test_parse_field_name(self):
+        self.assertEqual(utils.parse_field_name('some_field'), ('some_field', None, None, 'some_field'))
+        self.assertEqual(utils.parse_field_name('inline-12-field'), ('inline', 12, 'field', 'inline-0-field'))
+        self.assertEqual(utils.normalize_field_name('inline-12-field'), 'inline-0-field')
+        self.assertEqual(utils.normalize_field_name(('some', 'field')), ('some', 'field'))
+
     def test_get_fixtures_data(self):
         f = open(os.path.join(TEMP_DIR, 'test.json'), 'a')
         f.write(
@@ -2106,9 +2559,878 @@ class TestUtils(TestWithSettingsOwerride):
         self.assertEqual(utils.get_url_for_negative('/qwe/3/zzz/4/', args=(2, 5)), '/qwe/2/zzz/5/')
         self.assertEqual(utils.get_url_for_negative('/qwe/3/w/', args=('a',)), '/qwe/a/w/')
 
+    def test_get_keys_from_context(self):
+        from django.template.context import Context
+
+        context = Context({'a': 1})
+        context.update({'b': 2})
+        context.dicts.append(Context({'c': 3}))
+        self.assertTrue({'a', 'b', 'c'}.issubset(utils.get_keys_from_context(context)))
+        self.assertEqual(sorted(utils.get_keys_from_context({'d': 4})), ['d'])
+
+    def test_store_rendered_forms(self):
+        from django import forms
+        from django.forms.formsets import formset_factory
+        from django.template.context import Context
+
+        class SomeForm(forms.Form):
+            field = forms.CharField()
+
+        form = SomeForm()
+        formset = formset_factory(SomeForm)()
+        store = {}
+        utils.store_rendered_forms(
+            store, None, None, 'page.html', Context({'form': form, 'formsets': [formset], 'title': 'qwe', 'messages': []})
+        )
+        utils.store_rendered_forms(store, None, None, 'widget.html', Context({'widget': {'name': 'field'}}))
+        self.assertEqual(store['templates'], ['page.html', 'widget.html'])
+        self.assertEqual(len(store['context']), 1)
+        self.assertEqual(
+            store['context'][0].flatten(),
+            {'form': form, 'formsets': [formset], 'messages': [], 'True': True, 'False': False, 'None': None},
+        )
+
+    def test_store_rendered_forms_without_forms(self):
+        from django.template.context import Context
+
+        store = {}
+        utils.store_rendered_forms(store, None, None, 'page.html', Context({'title': 'qwe'}))
+        self.assertEqual(len(store['context']), 1)
+        self.assertEqual(store['context'][0].flatten(), {'True': True, 'False': False, 'None': None})
+
+    def test_forms_only_capture(self):
+        from django.test import Client, client
+
+        original = client.store_rendered_templates
+        with utils.forms_only_capture():
+            self.assertIs(client.store_rendered_templates, utils.store_rendered_forms)
+            response = Client().get('/somemodel/create/')
+            self.assertIn('form', response.context)
+            self.assertNotIn('view', response.context)
+            self.assertIn('foreign_key_field', utils.get_fields_list_from_response(response)['all_fields'])
+        self.assertIs(client.store_rendered_templates, original)
+
+        with self.assertRaises(ValueError):
+            with utils.forms_only_capture():
+                raise ValueError
+        self.assertIs(client.store_rendered_templates, original)
+
+    def test_store_rendered_forms_same_context(self):
+        from django import forms
+        from django.template.context import Context
+
+        store = {}
+        context = Context({'form': forms.Form()})
+        utils.store_rendered_forms(store, None, None, 'page.html', context)
+        with context.push(title='qwe'):
+            utils.store_rendered_forms(store, None, None, 'include.html', context)
+        self.assertEqual(store['templates'], ['page.html', 'include.html'])
+        self.assertEqual(len(store['context']), 1)
+
+    def test_store_rendered_forms_different_contexts(self):
+        """
+        Forms are deduplicated by themselves, not by context, ids of freed contexts can be reused
+        """
+        from django import forms
+        from django.template.context import Context
+
+        store = {}
+        first_form = forms.Form()
+        second_form = forms.Form()
+        for template, form in (('first.html', first_form), ('second.html', second_form), ('third.html', first_form)):
+            utils.store_rendered_forms(store, None, None, template, Context({'form': form}))
+        self.assertEqual([context['form'] for context in store['context']], [first_form, second_form])
+
     def test_unicode_to_readable(self):
         self.assertEqual(utils.unicode_to_readable(''), '')
         self.assertEqual(utils.unicode_to_readable('qwe u"\u0430"'), 'qwe u"а"')
         self.assertEqual(utils.unicode_to_readable(b'qwe u"\u0430\u043"'), 'qwe u"а\\u043"')
         self.assertEqual(utils.unicode_to_readable('qwe u"а"'), 'qwe u"а"')
         self.assertEqual(utils.unicode_to_readable("тест u\'\\u0442\\u0435\\u0441\\u04421\'"), "тест u'тест1'")
+
+
+class TestUserPermissionsTestMixIn(TestWithSettingsOwerride):
+    def tearDown(self):
+        rmtree(TEMP_DIR, ignore_errors=True)
+
+    def test_profile_views(self):
+        class PermissionsTestCase(UserPermissionsTestMixIn, TestCase):
+            allowed_links = ('somemodel-create', ('somemodel-create', 'second call'))
+            links_404 = (('somemodel-update', (999999,)),)
+            profile_views = True
+            profile_views_dir = TEMP_DIR
+
+            def test_unallowed_links_with_404_response(self):
+                for el in self.links_404:
+                    url_name, args, custom_message = self._get_values(el)
+                    response = self.get_method(self.get_url(url_name, args), follow=True)
+                    self.assertEqual(response.status_code, 404)
+
+        result = unittest.TestResult()
+        unittest.TestLoader().loadTestsFromTestCase(PermissionsTestCase).run(result)
+        self.assertEqual(result.errors + result.failures, [])
+        self.assertEqual(
+            sorted(os.listdir(TEMP_DIR)),
+            ['PermissionsTestCase.txt', 'somemodel-create.prof', 'somemodel-update.prof'],
+        )
+        with open(os.path.join(TEMP_DIR, 'PermissionsTestCase.txt')) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(lines[0].split()[:2], ['url', 'name'])
+        self.assertEqual(sorted([line.split()[:2] for line in lines[1:]]), [['somemodel-create', '2'], ['somemodel-update', '1']])
+
+    def test_profile_views_disabled(self):
+        class PermissionsTestCase(UserPermissionsTestMixIn, TestCase):
+            allowed_links = ('somemodel-create',)
+            profile_views_dir = TEMP_DIR
+
+        result = unittest.TestResult()
+        unittest.TestLoader().loadTestsFromTestCase(PermissionsTestCase).run(result)
+        self.assertEqual(result.errors + result.failures, [])
+        self.assertFalse(os.path.exists(TEMP_DIR) and os.listdir(TEMP_DIR))
+
+
+class TestRegexpTestSuiteRunner(TestWithSettingsOwerride):
+    class SampleTestCase(unittest.TestCase):
+        def test_1_success(self):
+            pass
+
+        def test_2_failure(self):
+            self.fail('failure message')
+
+        def test_3_skip(self):
+            self.skipTest('skip reason')
+
+    label = 'tests.tests.TestRegexpTestSuiteRunner.SampleTestCase'
+
+    def setUp(self):
+        if not os.path.exists(TEMP_DIR):
+            os.makedirs(TEMP_DIR)
+        self.journal = os.path.join(TEMP_DIR, 'journal')
+
+    def tearDown(self):
+        rmtree(TEMP_DIR, ignore_errors=True)
+
+    def get_runner(self, **kwargs):
+        params = {'verbosity': 0, 'tags_rule': None, 'parallelism': None, 'journal': self.journal}
+        params.update(kwargs)
+        return RegexpTestSuiteRunner(**params)
+
+    def run_suite(self, runner, suite):
+        result = runner.get_resultclass()(unittest.runner._WritelnDecorator(sys.stderr), True, 0)
+        result.startTestRun()
+        suite.run(result)
+        result.stopTestRun()
+        return result
+
+    def read_journal(self):
+        with open(self.journal) as f:
+            return [json.loads(line) for line in f.read().splitlines()]
+
+    def test_journal(self):
+        runner = self.get_runner()
+        self.run_suite(runner, runner.build_suite([self.label]))
+        entries = self.read_journal()
+        self.assertEqual(
+            [(el['id'].split('.')[-1], el['outcome']) for el in entries],
+            [('test_1_success', 'success'), ('test_2_failure', 'failure'), ('test_3_skip', 'skip')],
+        )
+        self.assertIn('failure message', entries[1]['details'])
+        self.assertEqual(entries[2]['details'], 'skip reason')
+
+    def test_journal_truncated_without_resume(self):
+        runner = self.get_runner()
+        self.run_suite(runner, runner.build_suite([self.label]))
+        runner = self.get_runner()
+        self.run_suite(runner, runner.build_suite([self.label + '.test_1_success']))
+        self.assertEqual([el['id'].split('.')[-1] for el in self.read_journal()], ['test_1_success'])
+
+    def test_resume(self):
+        runner = self.get_runner()
+        self.run_suite(runner, runner.build_suite([self.label + '.test_1_success', self.label + '.test_2_failure']))
+        runner = self.get_runner(resume=True)
+        suite = runner.build_suite([self.label])
+        self.assertEqual([el._testMethodName for el in suite], ['test_3_skip'])
+        result = self.run_suite(runner, suite)
+        self.assertEqual(result.testsRun, 3)
+        self.assertEqual([el.id() for el, _ in result.failures], [self.label + '.test_2_failure'])
+        self.assertIn('failure message', result.failures[0][1])
+        self.assertEqual([el.id() for el, _ in result.skipped], [self.label + '.test_3_skip'])
+        self.assertEqual(len(self.read_journal()), 3)
+
+    def test_subcases_label(self):
+        label = 'tests.tests_for_project.TestSomeModel.test_add_object_values_length_gt_max_negative'
+        runner = self.get_runner(journal='')
+        suite = runner.build_suite([label + '[char_field,email_field]'])
+        self.assertEqual([el.id() for el in suite], [label])
+        self.assertEqual(list(suite)[0].selected_subcases, {'field': {'char_field', 'email_field'}})
+
+    def test_subcases_option(self):
+        runner = self.get_runner(journal='', subcases=['field=char_field'])
+        suite = runner.build_suite([self.label])
+        self.assertEqual([el.selected_subcases for el in suite], [{'field': {'char_field'}}] * 3)
+
+    def test_subcases_option_without_value(self):
+        for subcase in ('char_field', 'field=', '=char_field'):
+            with self.assertRaises(CommandError) as ar:
+                call_command('test', self.label, '--subcase', subcase, verbosity=0)
+            self.assertEqual(str(ar.exception), 'Subcase should be set as key=value1,value2, got "%s"' % subcase)
+
+    def test_run_subcases(self):
+        from tests.tests_for_project import TestSomeModel
+
+        requests = []
+
+        class SubcasesTestCase(TestSomeModel):
+            def send_add_request(self, params):
+                requests.append(params)
+                return super(SubcasesTestCase, self).send_add_request(params)
+
+            def get_error_message(self, message_type, field, *args, **kwargs):
+                if field == 'email_field':
+                    return {}
+                return super(SubcasesTestCase, self).get_error_message(message_type, field, *args, **kwargs)
+
+        test = SubcasesTestCase('test_add_object_values_length_gt_max_negative')
+        result = unittest.TestResult()
+        test(result)
+        self.assertEqual(len(requests), 4)
+        self.assertEqual(len(result.failures), 1)
+        self.assertEqual(
+            get_rerun_label(test),
+            "'%s.SubcasesTestCase.test_add_object_values_length_gt_max_negative[email_field]'" % __name__,
+        )
+
+        requests[:] = []
+        test = SubcasesTestCase('test_add_object_values_length_gt_max_negative')
+        test.selected_subcases = {'field': {'char_field'}}
+        result = unittest.TestResult()
+        test(result)
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(result.failures, [])
+
+    def test_subcases_label_with_parallel(self):
+        from tests.tests_for_project import TestSomeModel
+
+        class SubcasesTestCase(TestSomeModel):
+            def get_error_message(self, message_type, field, *args, **kwargs):
+                if field == 'email_field':
+                    return {}
+                return super(SubcasesTestCase, self).get_error_message(message_type, field, *args, **kwargs)
+
+        class WorkerResult(unittest.TestResult):
+            def addFailure(self, test, err):
+                super(WorkerResult, self).addFailure(test, err)
+                # exception is sent from worker process to main process with pickle
+                self.err = (err[0], pickle.loads(pickle.dumps(err[1])), None)
+
+        test_name = 'test_add_object_values_length_gt_max_negative'
+        result = WorkerResult()
+        SubcasesTestCase(test_name)(result)
+        self.assertEqual(len(result.failures), 1)
+        err = result.err
+
+        runner = self.get_runner(journal='', parallel=2)
+        test = SubcasesTestCase(test_name)
+        runner.get_resultclass()(unittest.runner._WritelnDecorator(sys.stderr), True, 0).addFailure(test, err)
+        self.assertEqual(get_rerun_label(test), "'%s.SubcasesTestCase.%s[email_field]'" % (__name__, test_name))
+
+    def test_journal_disabled_by_default(self):
+        runner = RegexpTestSuiteRunner(verbosity=0, tags_rule=None, parallelism=None)
+        self.assertFalse(runner.journal)
+        self.assertFalse(issubclass(runner.get_resultclass() or unittest.TextTestResult, JournalResultMixIn))
+        with self.settings(TEST_JOURNAL=self.journal):
+            runner = RegexpTestSuiteRunner(verbosity=0, tags_rule=None, parallelism=None)
+        self.assertEqual(runner.journal, self.journal)
+
+    def test_journal_disabled(self):
+        runner = self.get_runner(journal='')
+        runner.build_suite([self.label])
+        self.assertFalse(os.path.exists(self.journal))
+        self.assertFalse(issubclass(runner.get_resultclass() or unittest.TextTestResult, JournalResultMixIn))
+
+
+class TestTestsManifest(TestWithSettingsOwerride):
+    def test_manifest(self):
+        out = StringIO()
+        call_command('tests_manifest', 'tests.tests_for_project.TestSomeModel', stdout=out)
+        manifest = json.loads(out.getvalue())
+        tests = {el['id'].split('.')[-1]: el for el in manifest['tests']}
+        self.assertEqual(
+            tests['test_view_list_with_filter_positive'],
+            {
+                'id': 'tests.tests_for_project.TestSomeModel.test_view_list_with_filter_positive',
+                'run': False,
+                'skip_reason': "Need all these params: ('url_list', 'filter_params')",
+                'requests': 0,
+            },
+        )
+        self.assertTrue(tests['test_add_object_all_fields_filled_positive']['run'])
+        self.assertEqual(tests['test_add_object_all_fields_filled_positive']['requests'], 1)
+        self.assertEqual(tests['test_add_object_wrong_values_in_digital_negative']['requests'], 18)
+        self.assertEqual(tests['test_add_object_values_length_gt_max_negative']['requests'], 4)
+        self.assertEqual(tests['test_edit_object_with_wrong_choices_negative']['requests'], 9)
+        self.assertEqual(list(manifest['classes'].keys()), ['tests.tests_for_project.TestSomeModel'])
+        self.assertEqual(manifest['total']['tests'], len([el for el in tests.values() if el['run']]))
+        self.assertEqual(manifest['total']['requests'], sum(el['requests'] for el in tests.values()))
+
+    def test_manifest_estimate_by_params(self):
+        from tests.tests_for_project import TestSomeModel
+        from ttoolly.management.commands.tests_manifest import get_manifest
+
+        class EstimateTestCase(TestSomeModel):
+            one_of_fields = (('char_field', 'text_field'),)
+            fuzzing_time_budget = 1
+
+        @unittest.skip('Skipped class')
+        class SkippedTestCase(TestSomeModel):
+            pass
+
+        test_names = (
+            'test_add_object_max_length_values_positive',
+            'test_add_object_some_file_extensions_positive',
+            'test_add_object_fuzzing',
+        )
+        manifest = get_manifest([EstimateTestCase(name) for name in test_names] + [SkippedTestCase(test_names[0])])
+        tests = {'.'.join(el['id'].split('.')[-2:]): el for el in manifest['tests']}
+        # combined request and one request for every group of fields, which can't be filled together
+        self.assertEqual(tests['EstimateTestCase.test_add_object_max_length_values_positive']['requests'], 3)
+        # 3 image extensions and their upper case, 2 random extensions and empty extension for file_field
+        self.assertEqual(tests['EstimateTestCase.test_add_object_some_file_extensions_positive']['requests'], 9)
+        self.assertIsNone(tests['EstimateTestCase.test_add_object_fuzzing']['requests'])
+        self.assertEqual(
+            tests['SkippedTestCase.test_add_object_max_length_values_positive'],
+            {
+                'id': SkippedTestCase(test_names[0]).id(),
+                'run': False,
+                'skip_reason': 'Skipped class',
+                'requests': 0,
+            },
+        )
+        self.assertEqual(manifest['total']['requests'], 12)
+        self.assertEqual(manifest['total']['time_limited'], 1)
+
+    def test_manifest_estimate_by_modes(self):
+        """
+        Estimate for passing test is equal to count of sent requests in combined, concurrent and form validation modes
+        """
+        from test_project.test_app.forms import SomeModelForm
+        from tests.tests_for_project import TestSomeModel
+
+        requests = []
+
+        def count_request(**kwargs):
+            requests.append(1)
+
+        test_names = (
+            'test_add_object_wrong_values_in_digital_negative',
+            'test_edit_object_with_wrong_choices_negative',
+            'test_add_object_empty_required_fields_negative',
+        )
+        request_started.connect(count_request, dispatch_uid='ttoolly-tests-estimate-requests')
+        try:
+            for params in (
+                {},
+                {'combine_negative_checks': True},
+                {'concurrent_negative_checks': True},
+                {'form_class_add': SomeModelForm, 'form_class_edit': SomeModelForm, 'form_validation_http_every': 4},
+            ):
+                params = dict(params, custom_wrong_values={'digital_field': ('q', 'й'), 'int_field': ('q',)})
+                EstimateTestCase = type(str('EstimateTestCase'), (TestSomeModel,), params)
+                for name in test_names:
+                    estimate = EstimateTestCase(name).get_requests_estimate()
+                    requests[:] = []
+                    result = unittest.TestResult()
+                    unittest.TestSuite([EstimateTestCase(name)]).run(result)
+                    self.assertEqual(result.errors + result.failures, [])
+                    self.assertEqual(estimate, len(requests), '%s %s' % (name, params))
+        finally:
+            request_started.disconnect(dispatch_uid='ttoolly-tests-estimate-requests')
+
+    def test_filter_suite_ignores_class_skip(self):
+        """
+        Skipped classes are reported by unittest itself, filter_suite_by_decorators doesn't remove them
+        """
+        from tests.tests_for_project import TestSomeModel
+        from ttoolly.runner import filter_suite_by_decorators
+
+        @unittest.skip('Skipped class')
+        class SkippedTestCase(TestSomeModel):
+            pass
+
+        suite = filter_suite_by_decorators(
+            unittest.TestSuite([SkippedTestCase('test_add_object_all_fields_filled_positive')]), verbosity=0
+        )
+        self.assertEqual(suite.countTestCases(), 1)
+
+
+class TestCombinedNegativeChecks(TestWithSettingsOwerride):
+    def run_tests(self, combine_negative_checks, *test_names, **kwargs):
+        from tests.tests_for_project import TestSomeModel
+
+        requests = []
+
+        class CombinedTestCase(TestSomeModel):
+            def send_add_request(self, params):
+                requests.append(params)
+                return super(CombinedTestCase, self).send_add_request(params)
+
+            def send_edit_request(self, obj_pk, params):
+                requests.append(params)
+                return super(CombinedTestCase, self).send_edit_request(obj_pk, params)
+
+        CombinedTestCase.combine_negative_checks = combine_negative_checks
+        for k, v in viewitems(kwargs):
+            setattr(CombinedTestCase, k, v)
+        self.result = unittest.TestResult()
+        unittest.TestSuite([CombinedTestCase(name) for name in test_names]).run(self.result)
+        return len(requests)
+
+    def test_combined_wrong_choices(self):
+        test_names = ('test_add_object_with_wrong_choices_negative', 'test_edit_object_with_wrong_choices_negative')
+        self.assertEqual(self.run_tests(False, *test_names), 18)
+        self.assertEqual(self.run_tests(True, *test_names), 6)
+        self.assertEqual(self.result.errors + self.result.failures, [])
+
+    def test_combined_wrong_values_in_digital(self):
+        test_names = ('test_add_object_wrong_values_in_digital_negative',)
+        self.assertEqual(self.run_tests(False, *test_names), 18)
+        self.assertEqual(self.run_tests(True, *test_names), 6)
+        self.assertEqual(self.result.errors + self.result.failures, [])
+
+    def test_combined_length_gt_max(self):
+        test_names = ('test_add_object_values_length_gt_max_negative', 'test_edit_object_values_length_gt_max_negative')
+        self.assertEqual(self.run_tests(False, *test_names), 8)
+        self.assertEqual(self.run_tests(True, *test_names), 2)
+        self.assertEqual(self.result.errors + self.result.failures, [])
+
+    def test_combined_fallback(self):
+        """
+        Fields are checked separately if combined check fails
+        """
+        from tests.tests_for_project import TestSomeModel
+
+        custom_error_messages = dict(TestSomeModel.custom_error_messages, int_field={'wrong_value_int': ['Wrong']})
+        self.assertEqual(
+            self.run_tests(
+                True, 'test_add_object_wrong_values_in_digital_negative', custom_error_messages=custom_error_messages
+            ),
+            6 + 18,
+        )
+        self.assertEqual(len(self.result.failures), 1)
+        self.assertIn('For value "q" in field "int_field"', self.result.failures[0][1])
+        self.assertNotIn('unique_int_field', self.result.failures[0][1])
+
+
+class TestConcurrentNegativeChecks(TestWithSettingsOwerride):
+    def run_tests(self, *test_names, **kwargs):
+        from tests.tests_for_project import TestSomeModel
+
+        requests = []
+
+        class ConcurrentTestCase(TestSomeModel):
+            concurrent_negative_checks = True
+
+            def send_add_request(self, params):
+                requests.append(params)
+                return super(ConcurrentTestCase, self).send_add_request(params)
+
+            def send_edit_request(self, obj_pk, params):
+                requests.append(params)
+                return super(ConcurrentTestCase, self).send_edit_request(obj_pk, params)
+
+        for k, v in viewitems(kwargs):
+            setattr(ConcurrentTestCase, k, v)
+        self.result = unittest.TestResult()
+        unittest.TestSuite([ConcurrentTestCase(name) for name in test_names]).run(self.result)
+        return len(requests)
+
+    def test_concurrent_checks(self):
+        test_names = (
+            'test_add_object_wrong_values_in_digital_negative',
+            'test_edit_object_with_wrong_choices_negative',
+            'test_edit_object_values_length_gt_max_negative',
+        )
+        self.assertEqual(self.run_tests(*test_names), 0)
+        self.assertEqual(self.result.errors + self.result.failures, [])
+        self.assertEqual(self.result.testsRun, 3)
+
+    def test_concurrent_checks_with_writes(self):
+        """
+        Cases are checked serially if tested objects are changed during concurrent requests
+        """
+        from django.test.signals import template_rendered
+
+        def write(**kwargs):
+            SomeModel.objects.filter(pk=-1).update(int_field=1)
+
+        template_rendered.connect(write, dispatch_uid='test-concurrent-write')
+        try:
+            self.assertEqual(
+                self.run_tests(
+                    'test_add_object_wrong_values_in_digital_negative',
+                    custom_wrong_values={'digital_field': ('q',), 'int_field': ('q',), 'unique_int_field': ('q',)},
+                ),
+                3,
+            )
+        finally:
+            template_rendered.disconnect(dispatch_uid='test-concurrent-write')
+        self.assertEqual(self.result.errors + self.result.failures, [])
+
+    def test_concurrent_checks_with_writes_to_other_tables(self):
+        """
+        Any database write during concurrent requests is detected, not only writes to tested model table
+        """
+        from django.test.signals import template_rendered
+
+        def write(**kwargs):
+            OtherModel.objects.filter(pk=-1).update(other_text_field='')
+
+        template_rendered.connect(write, dispatch_uid='test-concurrent-write')
+        try:
+            self.assertEqual(
+                self.run_tests(
+                    'test_add_object_wrong_values_in_digital_negative',
+                    custom_wrong_values={'digital_field': ('q',), 'int_field': ('q',), 'unique_int_field': ('q',)},
+                ),
+                3,
+            )
+        finally:
+            template_rendered.disconnect(dispatch_uid='test-concurrent-write')
+        self.assertEqual(self.result.errors + self.result.failures, [])
+
+    def test_concurrent_checks_on_error(self):
+        """
+        check_on_add_error and check_on_edit_error are used for concurrent responses
+        """
+        from tests.tests_for_project import TestSomeModel
+
+        checked = []
+
+        def check_on_add_error(self, response, initial_obj_count, _locals):
+            checked.append(_locals['field'])
+            TestSomeModel.check_on_add_error(self, response, initial_obj_count, _locals)
+
+        def check_on_edit_error(self, response, obj_for_edit, _locals):
+            checked.append(_locals['field'])
+            TestSomeModel.check_on_edit_error(self, response, obj_for_edit, _locals)
+
+        test_names = (
+            'test_add_object_wrong_values_in_digital_negative',
+            'test_edit_object_with_wrong_choices_negative',
+        )
+        self.assertEqual(
+            self.run_tests(*test_names, check_on_add_error=check_on_add_error, check_on_edit_error=check_on_edit_error),
+            0,
+        )
+        self.assertEqual(self.result.errors + self.result.failures, [])
+        self.assertEqual(len(checked), 18 + 9)
+
+
+class TestFuzzing(TestWithSettingsOwerride):
+    def run_tests(self, *test_names, **kwargs):
+        from tests.tests_for_project import TestSomeModel
+
+        self.requests = []
+
+        class FuzzingTestCase(TestSomeModel):
+            # requests count doesn't depend on speed of tests
+            fuzzing_max_requests = 10
+            fuzzing_time_budget = 600
+
+            def send_add_request(self_, params):
+                self.requests.append(params)
+                return super(FuzzingTestCase, self_).send_add_request(params)
+
+            def send_edit_request(self_, obj_pk, params):
+                self.requests.append(params)
+                return super(FuzzingTestCase, self_).send_edit_request(obj_pk, params)
+
+        for k, v in viewitems(kwargs):
+            setattr(FuzzingTestCase, k, v)
+        self.result = unittest.TestResult()
+        unittest.TestSuite([FuzzingTestCase(name) for name in test_names]).run(self.result)
+
+    def test_batch_generation(self):
+        """
+        Values are generated by fuzzing_batch_size for one prepared object
+        """
+        generated = []
+
+        def get_fuzzing_cases(self, additional):
+            return [('int_field', 'value', lambda: generated.append(1) or 10, True)]
+
+        self.run_tests('test_add_object_fuzzing', fuzzing_batch_size=7, get_fuzzing_cases=get_fuzzing_cases)
+        self.assertEqual(self.result.errors + self.result.failures, [])
+        self.assertEqual(len(self.requests), 10)
+        self.assertEqual(len(generated), 14)
+
+    def test_errors_collection(self):
+        """
+        Unexpected results are grouped by field, value description and result
+        """
+
+        def get_fuzzing_cases(self, additional):
+            return [
+                ('int_field', 'valid value', lambda: 10, True),
+                ('int_field', 'wrong value as valid', lambda: 'q', True),
+                ('int_field', 'valid value as wrong', lambda: 20, False),
+            ]
+
+        self.run_tests('test_edit_object_fuzzing', get_fuzzing_cases=get_fuzzing_cases, fuzzing_seed=1)
+        self.assertEqual(self.result.errors, [])
+        self.assertEqual(len(self.result.failures), 1)
+        text = self.result.failures[0][1]
+        sent_values = [params['int_field'] for params in self.requests]
+        for value, description, result in (
+            ('q', 'wrong value as valid', 'unexpected errors'),
+            (20, 'valid value as wrong', 'unexpected success'),
+        ):
+            self.assertIn(value, sent_values)
+            self.assertIn(
+                'Fuzzing (seed 1): %s for field "int_field" with %s (%d of %d requests)\n(value "%s")'
+                % (result, description, sent_values.count(value), len(sent_values), value),
+                text,
+            )
+        self.assertIn(10, sent_values)
+        self.assertNotIn('with valid value (', text)
+
+    def test_seed_reproducibility(self):
+        """
+        With the same fuzzing_seed the same values are sent, other usage of global random doesn't change them
+        """
+
+        from tests.tests_for_project import TestSomeModel
+
+        def _get_fuzzing_value(self, random_instance, generator):
+            value = TestSomeModel._get_fuzzing_value(self, random_instance, generator)
+            values[-1].append(str(getattr(value, 'name', value)))
+            return value
+
+        values = []
+        for global_seed, fuzzing_seed in ((1, 12345), (2, 12345), (1, 54321)):
+            values.append([])
+            random.seed(global_seed)
+            self.run_tests('test_add_object_fuzzing', fuzzing_seed=fuzzing_seed, _get_fuzzing_value=_get_fuzzing_value)
+            self.assertEqual(self.result.errors, [])
+        self.assertEqual([len(el) for el in values], [50] * 3)
+        self.assertEqual(values[0], values[1])
+        self.assertNotEqual(values[0], values[2])
+
+
+class TestFormValidationMode(TestWithSettingsOwerride):
+    def run_tests(self, reverse=False, **kwargs):
+        from test_project.test_app.forms import SomeModelForm
+        from tests.tests_for_project import TestSomeModel
+
+        requests = []
+
+        class FormValidationTestCase(TestSomeModel):
+            form_class_add = SomeModelForm
+            form_class_edit = SomeModelForm
+
+            def setUp(self):
+                super(FormValidationTestCase, self).setUp()
+                client_post = self.client.post
+
+                def post(*args, **kwargs):
+                    requests.append(self._testMethodName)
+                    return client_post(*args, **kwargs)
+
+                self.client.post = post
+
+        for k, v in viewitems(kwargs):
+            setattr(FormValidationTestCase, k, v)
+        test_names = [
+            'test_add_object_empty_required_fields_negative',
+            'test_add_object_values_length_gt_max_negative',
+            'test_add_object_wrong_values_in_digital_negative',
+            'test_edit_object_value_gt_max_in_digital_negative',
+            'test_edit_object_with_wrong_choices_negative',
+            'test_edit_object_without_required_fields_negative',
+        ]
+        if reverse:
+            test_names.reverse()
+        result = unittest.TestResult()
+        unittest.TestSuite([FormValidationTestCase(name) for name in test_names]).run(result)
+        self.assertEqual(result.errors + result.failures, [])
+        return requests
+
+    def test_form_validation(self):
+        all_requests_count = len(self.run_tests(form_class_add=None, form_class_edit=None))
+        requests_count = len(self.run_tests())
+        self.assertLess(requests_count, all_requests_count / 5)
+        self.assertGreater(requests_count, 0)
+
+    def test_form_validation_without_http_sample(self):
+        requests_count = len(self.run_tests(form_validation_http_every=None))
+        self.assertEqual(requests_count, 0)
+
+    def test_form_validation_http_sample_not_depends_on_order(self):
+        self.assertEqual(sorted(self.run_tests()), sorted(self.run_tests(reverse=True)))
+
+    def test_form_validation_subcase(self):
+        from django import forms
+        from tests.tests_for_project import TestSomeModel
+
+        class SimpleForm(forms.Form):
+            name = forms.CharField(max_length=3)
+
+        class FormValidationTestCase(TestSomeModel):
+            form_class_add = SimpleForm
+            form_validation_http_every = None
+            status_code_success_add = 201
+
+            @form_validation_subcases
+            def test_add_object_some_negative(self):
+                pass
+
+            def test_add_object_other_negative(self):
+                pass
+
+        self.assertFalse(
+            FormValidationTestCase('test_add_object_other_negative').is_form_validation_subcase('add', {'name': 'qwe'})
+        )
+        test = FormValidationTestCase('test_add_object_some_negative')
+        self.assertEqual(test.get_form_validation_response(SimpleForm, {'name': 'qwe'}, 'add').status_code, 201)
+        self.assertEqual(test.get_form_validation_response(SimpleForm, {'name': 'qwer'}, 'add').status_code, 200)
+
+        self.assertTrue(test.is_form_validation_subcase('add', {'name': 'qwe'}))
+        params = {'name': 'qwe', 'inline-TOTAL_FORMS': 1, 'inline-0-field': ''}
+        self.assertFalse(test.is_form_validation_subcase('add', params))
+        test._current_subcase = 'name'
+        self.assertTrue(test.is_form_validation_subcase('add', params))
+        test._current_subcase = 'inline-0-field'
+        self.assertFalse(test.is_form_validation_subcase('add', params))
+
+
+class TestDirectViewCall(TestWithSettingsOwerride):
+    def test_direct_view_call(self):
+        from tests.tests_for_project import TestSomeModel
+
+        requests = []
+
+        class DirectViewCallTestCase(TestSomeModel):
+            direct_view_call = True
+
+            def setUp(self):
+                super(DirectViewCallTestCase, self).setUp()
+                client_post = self.client.post
+
+                def post(*args, **kwargs):
+                    requests.append(args[0])
+                    return client_post(*args, **kwargs)
+
+                self.client.post = post
+
+        test_names = [
+            'test_add_object_all_fields_filled_positive',
+            'test_add_object_empty_file_negative',
+            'test_add_object_some_file_extensions_positive',
+            'test_add_object_wrong_values_in_digital_negative',
+            'test_edit_not_exists_object_negative',
+            'test_edit_object_all_fields_filled_positive',
+            'test_edit_object_with_wrong_choices_negative',
+        ]
+        result = unittest.TestResult()
+        unittest.TestSuite([DirectViewCallTestCase(name) for name in test_names]).run(result)
+        self.assertEqual(result.errors + result.failures, [])
+        # only not resolved urls are sent by client
+        self.assertEqual(set(requests), {'somemodel-update'})
+        self.assertEqual(result.testsRun - len(result.skipped), len(test_names))
+
+    def test_direct_view_call_session_and_redirect(self):
+        from django.http import HttpResponseRedirect
+        from django.test import Client
+        from tests.tests_for_project import TestSomeModel
+        from ttoolly import models as ttoolly_models
+
+        def view(request):
+            request.session['value'] = 1
+            request.session.cycle_key()
+            return HttpResponseRedirect('/somemodel/create/')
+
+        class DirectViewCallTestCase(TestSomeModel):
+            direct_view_call = True
+            additional_params = {'HTTP_X_TEST': 'qwe'}
+
+            def runTest(self):
+                pass
+
+        test = DirectViewCallTestCase()
+        test.client = Client()
+        gets = []
+        client_get = test.client.get
+
+        def get(*args, **kwargs):
+            gets.append(kwargs)
+            return client_get(*args, **kwargs)
+
+        test.client.get = get
+        resolve_view = ttoolly_models.resolve_view
+        ttoolly_models.resolve_view = lambda urlconf, path: (view, (), {})
+        try:
+            response = test.send_post_request('/some/url/', {})
+        finally:
+            ttoolly_models.resolve_view = resolve_view
+        self.assertEqual(response.redirect_chain[0], ('/somemodel/create/', 302))
+        self.assertEqual(gets[0]['HTTP_X_TEST'], 'qwe')
+        self.assertEqual(test.client.session['value'], 1)
+
+    def test_direct_view_call_async_view_closes_request(self):
+        from django.http import HttpResponse
+        from django.test import Client
+        from tests.tests_for_project import TestSomeModel
+        from ttoolly import models as ttoolly_models
+
+        uploaded = []
+
+        async def view(request):
+            uploaded.append(request.FILES['file_field'])
+            return HttpResponse('ok')
+
+        class DirectViewCallTestCase(TestSomeModel):
+            direct_view_call = True
+
+            def runTest(self):
+                pass
+
+        test = DirectViewCallTestCase()
+        test.client = Client()
+        resolve_view = ttoolly_models.resolve_view
+        ttoolly_models.resolve_view = lambda urlconf, path: (view, (), {})
+        try:
+            response = test.send_post_request('/some/url/', {'file_field': ContentFile(b'qwe', name='test.txt')})
+        finally:
+            ttoolly_models.resolve_view = resolve_view
+        self.assertEqual(response.content, b'ok')
+        self.assertTrue(uploaded[0].closed)
+
+
+class TestCaptureFormsOnly(TestWithSettingsOwerride):
+    def test_capture_forms_only(self):
+        from django.test import client
+        from tests.tests_for_project import TestSomeModel
+
+        original = client.store_rendered_templates
+        captured = []
+
+        class CaptureFormsOnlyTestCase(TestSomeModel):
+            capture_forms_only = True
+
+            def setUp(self):
+                super(CaptureFormsOnlyTestCase, self).setUp()
+                captured.append(client.store_rendered_templates)
+
+        test_names = [
+            'test_add_object_all_fields_filled_positive',
+            'test_add_object_empty_required_fields_negative',
+            'test_edit_object_max_length_values_positive',
+            'test_edit_object_with_wrong_choices_negative',
+        ]
+        result = unittest.TestResult()
+        unittest.TestSuite([CaptureFormsOnlyTestCase(name) for name in test_names]).run(result)
+        self.assertEqual(result.errors + result.failures, [])
+        self.assertEqual(result.testsRun - len(result.skipped), len(test_names))
+        self.assertEqual(set(captured), {utils.store_rendered_forms})
+        self.assertIs(client.store_rendered_templates, original)
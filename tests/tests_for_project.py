@@ -96,6 +96,14 @@ class TestSomeModel(FormAddTestMixIn, FormEditTestMixIn, FormDeleteTestMixIn, Te
                 previous_locals = frame[0].f_locals
             previous_locals['ext'] = previous_locals['ext'].lower()
             kwargs['locals'] = previous_locals
+            if '.' + previous_locals['ext'] in Image.EXTENSION:
+                # random wrong extension can be supported by Pillow, then file content is checked
+                return {
+                    field: [
+                        'Загрузите правильное изображение. Файл, который вы загрузили, поврежден или не является '
+                        'изображением.'
+                    ]
+                }
         return super(TestSomeModel, self).get_error_message(message_type, field, *args, **kwargs)
 
     def get_params_according_to_type(self, value, params_value):
@@ -6,10 +6,10 @@ from unittest import TextTestResult
 from django.conf import settings
 from future.utils import PY2
 
-from ttoolly.utils import to_bytes, unicode_to_readable
-
 
 def _getDescription(self, test):
+    from ttoolly.utils import to_bytes
+
     doc_first_line = test.shortDescription()
     full_text = str(test)
     if getattr(settings, 'COLORIZE_TESTS', False):
@@ -36,6 +36,8 @@ TextTestResult.getDescription = _getDescription
 if PY2:
 
     def _printErrorList(self, flavour, errors):
+        from ttoolly.utils import unicode_to_readable
+
         for test, err in errors:
             self.stream.writeln(self.separator1)
             self.stream.writeln("%s: %s" % (flavour, self.getDescription(test)))
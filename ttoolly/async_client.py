@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+Concurrent requests with AsyncClient (python 3, Django >= 3.1)
+"""
+import asyncio
+from contextvars import ContextVar
+
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.test import client as test_client
+from django.test.signals import template_rendered
+
+_rendered_store = ContextVar('ttoolly_rendered_store', default=None)
+
+
+def _store_rendered_templates(signal, sender, template, context, **kwargs):
+    store = _rendered_store.get()
+    if store is not None:
+        test_client.store_rendered_templates(store, signal, sender, template, context, **kwargs)
+
+
+async def _post(client, url, params, extra):
+    store = {}
+    _rendered_store.set(store)
+    response = await client.post(url, params, **extra)
+    # AsyncClient stores templates of all requests sent at the same time, only own templates are used
+    response.templates = store.get('templates', [])
+    response.context = store.get('context')
+    if response.context and len(response.context) == 1:
+        response.context = response.context[0]
+    response.redirect_chain = []
+    return response
+
+
+async def _post_all(cookies, url, params_list, extra):
+    client = AsyncClient()
+    client.cookies = cookies
+    return await asyncio.gather(*[_post(client, url, params, extra) for params in params_list])
+
+
+def send_concurrent_post_requests(cookies, url, params_list, **extra):
+    """
+    POST requests to url for every params from params_list, sent concurrently.
+    Sync views are called one by one in current thread (thread sensitive), so they use current database transaction,
+    and only async views are really processed concurrently
+    """
+    template_rendered.connect(_store_rendered_templates, dispatch_uid='ttoolly-concurrent-requests')
+    try:
+        return async_to_sync(_post_all)(cookies, url, params_list, extra)
+    finally:
+        template_rendered.disconnect(dispatch_uid='ttoolly-concurrent-requests')
+
+
+def call_view(view, request, *args, **kwargs):
+    """
+    Call view from sync code, async view is run in event loop
+    """
+    if asyncio.iscoroutinefunction(view):
+        return async_to_sync(view)(request, *args, **kwargs)
+    return view(request, *args, **kwargs)
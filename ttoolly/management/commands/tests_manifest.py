@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, print_function, unicode_literals
+
+import json
+import warnings
+
+from django.core.management.base import BaseCommand
+
+from ttoolly.runner import RegexpTestSuiteRunner, get_skip_text
+
+
+def get_test_manifest(test):
+    """
+    requests is rough estimate for passing test, None if count of requests is limited only by time
+    """
+    try:
+        if getattr(test.__class__, '__unittest_skip__', False):
+            skip_text = test.__class__.__unittest_skip_why__
+        else:
+            skip_text = get_skip_text(test)
+    except Exception as e:
+        return {'id': test.id(), 'run': None, 'skip_reason': None, 'error': repr(e), 'requests': 0}
+    estimate = getattr(test, 'get_requests_estimate', None)
+    requests = (estimate() if estimate else 1) if skip_text is None else 0
+    return {'id': test.id(), 'run': skip_text is None, 'skip_reason': skip_text, 'requests': requests}
+
+
+def get_manifest(suite):
+    tests = []
+    classes = {}
+    for test in suite:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            test_manifest = get_test_manifest(test)
+        tests.append(test_manifest)
+        class_manifest = classes.setdefault(
+            test.id().rsplit('.', 1)[0], {'tests': 0, 'skipped': 0, 'errors': 0, 'requests': 0, 'time_limited': 0}
+        )
+        if test_manifest['run'] is None:
+            class_manifest['errors'] += 1
+        else:
+            class_manifest['tests' if test_manifest['run'] else 'skipped'] += 1
+        if test_manifest['requests'] is None:
+            class_manifest['time_limited'] += 1
+        else:
+            class_manifest['requests'] += test_manifest['requests']
+    total = {
+        key: sum(class_manifest[key] for class_manifest in classes.values())
+        for key in ('tests', 'skipped', 'errors', 'requests', 'time_limited')
+    }
+    return {'tests': tests, 'classes': classes, 'total': total}
+
+
+class Command(BaseCommand):
+
+    help = (
+        "Write manifest of tests, which will run, with rough estimate of requests count for passing tests, "
+        "without running tests"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('args', metavar='test_label', nargs='*', help='Test labels, as for test command')
+        parser.add_argument('--tags', dest='tags_rule', help='Tags boolean rule. Example: "low AND middle AND NOT high"')
+        parser.add_argument('-o', '--output', dest='output', default=None, help='Output file. Default: stdout')
+
+    def handle(self, *test_labels, **kwargs):
+        runner = RegexpTestSuiteRunner(
+            verbosity=0, interactive=False, tags_rule=kwargs.get('tags_rule'), parallelism=None, journal=''
+        )
+        manifest = get_manifest(runner.build_suite(list(test_labels)))
+        result = json.dumps(manifest, indent=2, sort_keys=True)
+        if kwargs.get('output'):
+            with open(kwargs['output'], 'w') as f:
+                f.write(result)
+        else:
+            self.stdout.write(result)
+        if int(kwargs.get('verbosity')) > 1:
+            self.stderr.write(
+                'Tests: {tests}, skipped: {skipped}, errors: {errors}, requests (rough estimate): {requests}, '
+                'limited by time: {time_limited}'.format(**manifest['total'])
+            )
@@ -1,19 +1,24 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import inspect
+import cProfile
 import json
 import os
+import pstats
 import re
 import sys
 import tempfile
+import timeit
 import warnings
+import zlib
 from copy import copy, deepcopy
 from datetime import date, datetime, time
 from decimal import Decimal
-from random import choice, randint, uniform
+from functools import partial
+from random import Random, choice, getstate, randint, setstate, uniform
 from shutil import rmtree
 from unittest.util import strclass
+from weakref import WeakKeyDictionary, WeakSet
 
 from django import VERSION as DJANGO_VERSION
 from django.apps import apps
@@ -21,16 +26,21 @@ from django.conf import settings
 from django.contrib.auth import get_user
 from django.contrib.auth.tokens import default_token_generator
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.messages.storage import default_storage as default_messages_storage
 from django.core import mail
+from django.core.exceptions import PermissionDenied
+from django.core.signals import request_finished, request_started
 from django.core.files.base import ContentFile
 from django.core.management import call_command
-from django.db import DEFAULT_DB_ALIAS, connections, models, transaction
+from django.db import DEFAULT_DB_ALIAS, close_old_connections, connections, models, transaction
 from django.db.models import DateTimeField, Manager, Q
-from django.http import HttpRequest
+from django.http import Http404, HttpRequest
 from django.template.defaultfilters import filesizeformat
-from django.test import TestCase, TransactionTestCase
+from django.test import RequestFactory, TestCase, TransactionTestCase
+from django.test import client as test_client
+from django.test.signals import setting_changed, template_rendered
 from django.test.testcases import connections_support_transactions
-from django.test.utils import override_settings
+from django.test.utils import CaptureQueriesContext, ContextList, override_settings
 from django.utils.encoding import force_bytes
 
 try:
@@ -40,13 +50,6 @@ except ImportError:
     from django.utils.encoding import force_text
 
 from django.utils.http import urlsafe_base64_encode
-from lxml.html import document_fromstring
-
-try:
-    import psycopg2.extensions
-except ImportError as e:
-    e.msg += '\nNeed to install psycopg2-binary or psycopg2'
-    raise
 
 from builtins import str
 from uuid import UUID
@@ -71,10 +74,15 @@ from .testcases import (
     RemovePositiveCases,
     ResetPasswordNegativeCases,
     ResetPasswordPositiveCases,
+    WRONG_CHOICE_VALUES,
+    WRONG_DIGITAL_VALUES,
+    WRONG_EMAIL_VALUES,
 )
 from .utils import (
     FILE_TYPES,
+    LazyError,
     format_errors,
+    forms_only_capture,
     generate_random_obj,
     generate_sql,
     get_all_field_names_from_model,
@@ -84,16 +92,26 @@ from .utils import (
     get_error,
     get_fields_list_from_response,
     get_fixtures_data,
+    get_model_meta,
+    get_mro_names,
     get_randname,
     get_random_email_value,
     get_random_file,
     get_real_fields_list_from_response,
     get_url,
     get_url_for_negative,
+    normalize_field_name,
+    parse_field_name,
     prepare_custom_file_for_tests,
     unicode_to_readable,
 )
-from .utils.decorators import only_with, only_with_any_files_params, only_with_files_params, only_with_obj
+from .utils.decorators import (
+    get_test_attrs_names,
+    only_with,
+    only_with_any_files_params,
+    only_with_files_params,
+    only_with_obj,
+)
 
 if DJANGO_VERSION < (1, 8):
     raise Exception('Django version should be >= 1.8. Now %s' % str(DJANGO_VERSION))
@@ -101,16 +119,32 @@ if DJANGO_VERSION < (1, 8):
 if sys.version[0] == '2':
     from urllib import urlencode
 
-    from functools32 import wraps
+    from urlparse import urljoin, urlparse
+    from functools32 import lru_cache, wraps
 else:
-    from functools import wraps
-    from urllib.parse import urlencode
+    from functools import lru_cache, wraps
+    from urllib.parse import urlencode, urljoin, urlparse
 
 try:
-    from django.core.urlresolvers import resolve, reverse
+    from django.core.urlresolvers import get_urlconf, resolve, reverse
 except ImportError:
     # Django 2.0
-    from django.urls import resolve, reverse
+    from django.urls import get_urlconf, resolve, reverse
+
+try:
+    from django.core.handlers.exception import response_for_exception
+except ImportError:
+    # Django < 1.10
+    response_for_exception = None
+
+try:
+    from .async_client import call_view, send_concurrent_post_requests
+except (ImportError, SyntaxError):
+    # python 2 or Django < 3.1
+    send_concurrent_post_requests = None
+
+    def call_view(view, request, *args, **kwargs):
+        return view(request, *args, **kwargs)
 
 try:
     from django.db.models.fields import FieldDoesNotExist
@@ -306,6 +340,10 @@ class JsonResponseErrorsMixIn(object):
             return super(JsonResponseErrorsMixIn, self).get_all_form_errors(response)
 
 
+# functions, already wrapped with check_errors, are not checked again for every new class
+_checked_test_functions = WeakSet()
+
+
 class MetaCheckFailures(type):
     def __init__(cls, name, bases, dct):
         def check_errors(fn):
@@ -319,24 +357,19 @@ class MetaCheckFailures(type):
                 tmp.decorators = decorators + (check_errors,)
             return tmp
 
-        def decorate(cls, bases, dct):
-            for attr in cls.__dict__:
-                if (
-                    attr.startswith('test')
-                    and callable(getattr(cls, attr))
-                    and 'check_errors'
-                    not in [
-                        getattr(d, '__name__', d.__class__.__name__)
-                        for d in getattr(getattr(cls, attr), 'decorators', ())
-                    ]
-                ):
-                    setattr(cls, attr, check_errors(getattr(cls, attr)))
-            bases = cls.__bases__
-            for base in bases:
-                decorate(base, base.__bases__, base.__dict__)
-            return cls
-
-        decorate(cls, bases, dct)
+        for klass in cls.__mro__:
+            for attr in get_test_attrs_names(klass):
+                if klass.__dict__[attr] in _checked_test_functions:
+                    continue
+                fn = getattr(klass, attr)
+                if callable(fn) and 'check_errors' not in [
+                    getattr(d, '__name__', d.__class__.__name__) for d in getattr(fn, 'decorators', ())
+                ]:
+                    setattr(klass, attr, check_errors(fn))
+                try:
+                    _checked_test_functions.add(klass.__dict__[attr])
+                except TypeError:
+                    pass
         super(MetaCheckFailures, cls).__init__(name, bases, dct)
 
 
@@ -372,17 +405,93 @@ class DictWithPassword(dict):
         return super(DictWithPassword, self).update(d)
 
 
+_config_attrs = WeakKeyDictionary()
+_frozen_class_config = WeakKeyDictionary()
+_fields_types_attrs = {
+    'choice': (
+        'choice_fields',
+        'choice_fields_add',
+        'choice_fields_edit',
+        'choice_fields_with_value_in_error',
+        'choice_fields_add_with_value_in_error',
+        'choice_fields_edit_with_value_in_error',
+    ),
+    'date': ('date_fields',),
+    'datetime': ('datetime_fields',),
+    'digital': ('digital_fields', 'digital_fields_add', 'digital_fields_edit'),
+    'email': ('email_fields', 'email_fields_add', 'email_fields_edit'),
+    'int': ('int_fields', 'int_fields_add', 'int_fields_edit'),
+    'multiselect': ('multiselect_fields', 'multiselect_fields_add', 'multiselect_fields_edit'),
+    'not_file': ('not_file',),
+}
+_fields_index_attrs = frozenset(name for names in viewvalues(_fields_types_attrs) for name in names)
+
+
+@lru_cache(maxsize=4096)
+def is_file_like_name(field):
+    return bool(re.findall(r'(^|[^a-zA-Z])(file)', field))
+
+
+_error_messages_lookups = WeakKeyDictionary()
+
+
+def clear_error_messages_lookups(setting, **kwargs):
+    if setting == 'ERROR_MESSAGES':
+        _error_messages_lookups.clear()
+
+
+setting_changed.connect(clear_error_messages_lookups, dispatch_uid='ttoolly-clear-error-messages-lookups')
+
+DEFAULT_ERROR_MESSAGES = {
+    'required': 'Обязательное поле.',
+    'max_length': 'Убедитесь, что это значение содержит не более {length} символов (сейчас {current_length}).',
+    'max_length_file': 'Убедитесь, что это имя файла содержит не более {length} символов (сейчас {current_length}).',
+    'max_length_digital': 'Убедитесь, что это значение меньше либо равно {max_value}.',
+    'min_length': 'Убедитесь, что это значение содержит не менее {length} символов (сейчас {current_length}).',
+    'min_length_digital': 'Убедитесь, что это значение больше либо равно {min_value}.',
+    # messages, which depend on values from test, are functions from values
+    'wrong_value': lambda values: 'Выберите корректный вариант. Вашего варианта нет среди допустимых значений.'
+    if 'value' not in values
+    else 'Выберите корректный вариант. {value} нет среди допустимых значений.',
+    'wrong_value_int': 'Введите целое число.',
+    'wrong_value_digital': 'Введите число.',
+    'wrong_value_email': 'Введите правильный адрес электронной почты.',
+    'unique': '{verbose_obj} с таким {verbose_field} уже существует.',
+    'delete_not_exists': 'Произошла ошибка. Попробуйте позже.',
+    'recovery_not_exists': 'Произошла ошибка. Попробуйте позже.',
+    'empty_file': 'Отправленный файл пуст.',
+    'max_count_file': 'Допускается загрузить не более {max_count} файлов.',
+    'max_size_file': 'Размер файла {filename} больше {max_size}.',
+    'wrong_extension': 'Некорректный формат файла {filename}.',
+    'min_dimensions': 'Минимальный размер изображения {min_width}x{min_height}.',
+    'max_dimensions': 'Максимальный размер изображения {max_width}x{max_height}.',
+    'max_sum_size_file': 'Суммарный размер изображений не должен превышать {max_size}.',
+    'one_of': 'Оставьте одно из значений в полях {group}.',
+    'max_block_count': 'Пожалуйста, заполните не более {max_count} форм.',
+    'wrong_login': 'Пожалуйста, введите корректные адрес электронной почты и пароль для аккаунта. '
+    'Оба поля могут быть чувствительны к регистру.',
+    'inactive_user': 'Эта учетная запись отключена.',
+    'wrong_captcha': 'Неверный код',
+    'not_exist': lambda values: '{verbose_obj} с {verbose_field} "{value}" не существует. Возможно оно было удалено?'
+    if values.get('value', '') == ''
+    else '{verbose_obj} с {verbose_pk} "{value}" не существует. Возможно оно было удалено?',
+    'wrong_password_similar': 'Введённый пароль слишком похож на {user_field_name}.',
+    'with_null': 'Данные содержат запрещённый символ: ноль-байт.',
+}
+
+
 class GlobalTestMixIn(with_metaclass(MetaCheckFailures, object)):
     additional_params = None
     all_unique = None
+    capture_forms_only = False
     choice_fields_values = None
     custom_error_messages = None
     custom_wrong_values = None
-    errors = []
     files = []
     longMessage = False
     maxDiff = None
     non_field_error_key = '__all__'
+    selected_subcases = None  # {'field': ['field1', 'field2']}, set by RegexpTestSuiteRunner
     unique_fields = None
     unique_with_case = None
     with_captcha = None
@@ -456,6 +565,7 @@ class GlobalTestMixIn(with_metaclass(MetaCheckFailures, object)):
 
     def for_post_tear_down(self):
         self.del_files()
+        self.restore_shared_config()
 
         def get_settings_value(name, value=None):
             if name.isdigit():
@@ -482,9 +592,30 @@ class GlobalTestMixIn(with_metaclass(MetaCheckFailures, object)):
         modified_settings = getattr(self, '_ttoolly_modified_settings', None)
         if modified_settings:
             modified_settings.disable()
+        if getattr(settings, 'TEST_RELEASE_STATE', True):
+            self.release_test_state()
+
+    def release_test_state(self):
+        """
+        Drop values of finished test: unittest keeps all test instances until the end of run
+        """
+        self.errors = []
+        for name in getattr(self, '_config_copies', ()):
+            self.__dict__.pop(name, None)
+        for name in (
+            '_config_copies',
+            '_fields_dependencies',
+            '_fields_index',
+            '_shared_config',
+            '_test_type',
+            '_ttoolly_modified_settings',
+        ):
+            self.__dict__.pop(name, None)
 
     def for_pre_setup(self):
         self.errors = []
+        self._current_subcase = None
+        self._failed_subcases = []
         d = new_redis_settings()
 
         def update_path(d, name):
@@ -508,10 +639,72 @@ class GlobalTestMixIn(with_metaclass(MetaCheckFailures, object)):
 
         self._ttoolly_modified_settings = override_settings(**d)
         self._ttoolly_modified_settings.enable()
-        for k in [k for k in dir(self) if not k.startswith(('_', 'test_')) and k not in ('files', 'get_obj_manager')]:
+        self._shared_config = []
+        self._config_copies = []
+        frozen_config = _frozen_class_config.setdefault(self.__class__, {})
+        for k in self._get_config_attrs():
+            if k in self.__dict__:
+                continue
             v = getattr(self, k)
-            if isinstance(v, (list, dict)) and not isinstance(getattr(type(self), k, None), property):
+            if not isinstance(v, (list, dict)):
+                continue
+            if k not in frozen_config or frozen_config[k][0] is not v:
+                frozen_config[k] = (v, self._freeze_config_value(v))
+            if frozen_config[k][1] is None:
                 setattr(self, k, self.deepcopy(v) if isinstance(v, dict) else copy(v))
+                self._config_copies.append(k)
+            else:
+                self._shared_config.append(frozen_config[k])
+        if self.capture_forms_only:
+            # cleanups are run after test even if it fails
+            capture = forms_only_capture()
+            capture.__enter__()
+            self.addCleanup(capture.__exit__, None, None, None)
+
+    def _get_config_attrs(self):
+        """
+        Names of attributes, which can be changed in tests. Computed once per class
+        """
+        if self.__class__ not in _config_attrs:
+            _config_attrs[self.__class__] = [
+                k
+                for k in dir(self.__class__)
+                if not k.startswith(('_', 'test_'))
+                and k not in ('files', 'get_obj_manager')
+                and not isinstance(getattr(self.__class__, k, None), property)
+            ]
+        return _config_attrs[self.__class__]
+
+    def _freeze_config_value(self, value):
+        """
+        Copy of shared value for restore after test, None if value can not be restored
+        """
+        file_types = FILE_TYPES + (ContentFile,)
+        values = viewvalues(value) if isinstance(value, dict) else value
+        if any(
+            isinstance(v, file_types) or (isinstance(v, (list, tuple)) and any(isinstance(el, file_types) for el in v))
+            for v in values
+        ):
+            return None
+        try:
+            return deepcopy(value)
+        except Exception:
+            return None
+
+    def restore_shared_config(self):
+        """
+        Restore shared values (class attributes and prepared form config), changed in place by test
+        """
+        for value, frozen_value in getattr(self, '_shared_config', ()):
+            if value != frozen_value:
+                _error_messages_lookups.pop(self.__class__, None)
+                self.__dict__.pop('_fields_index', None)
+                if isinstance(value, (dict, set)):
+                    value.clear()
+                    value.update(deepcopy(frozen_value))
+                else:
+                    value[:] = deepcopy(frozen_value)
+        self._shared_config = []
 
     def assertEqual(self, *args, **kwargs):
         with warnings.catch_warnings(record=True) as warn:
@@ -841,7 +1034,7 @@ class GlobalTestMixIn(with_metaclass(MetaCheckFailures, object)):
 
         local_errors = []
         object_fields = get_all_field_names_from_model(obj)
-        fields_map = {name: self.get_field_by_name(obj, name) for name in object_fields}
+        fields_map = get_model_meta(obj).fields
         object_related_field_names = [
             name
             for name in object_fields
@@ -1063,6 +1256,8 @@ class GlobalTestMixIn(with_metaclass(MetaCheckFailures, object)):
         self.assert_xpath_count_in_html(res, path, count)
 
     def assert_xpath_count_in_html(self, html, path, count, msg=None):
+        from lxml.html import document_fromstring
+
         doc = document_fromstring(html)
         real_count = len(doc.xpath(path))
         error_message = 'Found %s instances of \'%s\' (Should be %s)' % (
@@ -1096,23 +1291,76 @@ class GlobalTestMixIn(with_metaclass(MetaCheckFailures, object)):
                 f.close()
             del f
 
+    @property
+    def errors(self):
+        """
+        Errors of current test. Errors from errors_append are kept without locals and formatted on first access
+        """
+        errors = self.__dict__.setdefault('_errors', [])
+        for i, error in enumerate(errors):
+            if isinstance(error, LazyError):
+                errors[i] = str(error)
+        return errors
+
+    @errors.setter
+    def errors(self, value):
+        self._errors = value
+
+    def has_errors(self):
+        """Check errors of current test without formatting them"""
+        return bool(self.__dict__.get('_errors'))
+
     def errors_append(self, errors=None, text='', color=231):
-        if errors is None:
-            errors = self.errors
+        lazy = errors is None
+        if lazy:
+            errors = self.__dict__.setdefault('_errors', [])
+            if getattr(self, '_failed_subcases', None) is not None:
+                self._failed_subcases.append(self._current_subcase)
         text = (force_text(text) + ':\n') if text else ''
         if isinstance(text, bytes):
             text = text.decode('utf-8')
         if getattr(settings, 'COLORIZE_TESTS', False) and text:
             text = "\x1B[38;5;%dm" % color + text + "\x1B[0m"
-        result = text + get_error()
+        result = LazyError(text) if lazy else text + get_error()
         if result:
             errors.append(result)
         return errors
 
+    def get_subcases(self, iterable):
+        """
+        Values (or tuples with field as first element) for subcases, only fields from selected_subcases if set
+        """
+        selected = (self.selected_subcases or {}).get('field')
+        try:
+            for item in iterable:
+                field = item[0] if isinstance(item, tuple) and item else item
+                if not isinstance(field, basestring):
+                    yield item
+                    continue
+                if selected and field not in selected:
+                    continue
+                self._current_subcase = field
+                yield item
+        finally:
+            self._current_subcase = None
+
+    def get_requests_estimate(self):
+        """
+        Approximate count of requests, which current test will send
+        """
+        return 1
+
     def formatted_assert_errors(self):
+        if not self.has_errors():
+            return
         errors = copy(self.errors)
         self.errors = []
-        self.assertFalse(errors, format_errors(errors))
+        try:
+            self.assertFalse(errors, format_errors(errors))
+        except AssertionError as e:
+            # with --parallel test is run in other process, failed subcases are sent to main process with exception
+            e.failed_subcases = list(getattr(self, '_failed_subcases', None) or [])
+            raise
 
     def generate_random_obj(self, obj_model, additional_params=None, filename=None, **kwargs):
         return generate_random_obj(obj_model, additional_params, filename, **kwargs)
@@ -1134,13 +1382,17 @@ class GlobalTestMixIn(with_metaclass(MetaCheckFailures, object)):
         if message_type in ('inactive_user', 'wrong_login', 'wrong_captcha'):
             return self.non_field_error_key
 
-        error_field = re.sub(r'_(\d|ru)$', '', field)
         if message_type == 'max_length' and self.is_file_field(field):
             message_type = 'max_length_file'
-        elif message_type == 'max_block_count':
+        lookup = self.get_error_messages_lookup()['lookup']
+        key = ('field', message_type, field, self.non_field_error_key)
+        if key in lookup:
+            return lookup[key]
+
+        error_field = re.sub(r'_(\d|ru)$', '', field)
+        if message_type == 'max_block_count':
             error_field = field + '-' + self.non_field_error_key
-        messages_dict = self.deepcopy(getattr(settings, 'ERROR_MESSAGES', {}))
-        messages_dict.update(getattr(self, 'custom_error_messages', {}))
+        messages_dict = self.get_error_messages_lookup()['messages_by_fields']
         error_message = ''
         if field in viewkeys(messages_dict):
             field_dict = messages_dict[field]
@@ -1151,15 +1403,89 @@ class GlobalTestMixIn(with_metaclass(MetaCheckFailures, object)):
 
         if isinstance(error_message, dict):
             error_field = list(error_message.keys())[0]
+        lookup[key] = error_field
         return error_field
 
+    def __setattr__(self, name, value):
+        if name == 'custom_error_messages':
+            # same dict can be assigned again after change in place
+            _error_messages_lookups.pop(self.__class__, None)
+        elif name in _fields_index_attrs:
+            self.__dict__.pop('_fields_index', None)
+        super(GlobalTestMixIn, self).__setattr__(name, value)
+
+    def get_error_messages_lookup(self):
+        """
+        Messages and found (message_type, field) results for get_error_message and get_error_field.
+        Built once per class, again after change of settings.ERROR_MESSAGES or assignment of custom_error_messages
+        """
+        custom_error_messages = getattr(self, 'custom_error_messages', None)
+        cached = _error_messages_lookups.get(self.__class__, None)
+        if cached is not None and cached['custom'] is custom_error_messages:
+            return cached
+        messages_from_settings = getattr(settings, 'ERROR_MESSAGES', None) or {}
+        catalog = dict(DEFAULT_ERROR_MESSAGES)
+        catalog.update(messages_from_settings)
+        messages_by_fields = dict(messages_from_settings)
+        messages_by_fields.update(custom_error_messages or {})
+        cached = {
+            'custom': custom_error_messages,
+            'catalog': catalog,
+            'messages_by_fields': messages_by_fields,
+            'lookup': {},
+        }
+        _error_messages_lookups[self.__class__] = cached
+        return cached
+
+    def get_error_messages_catalog(self):
+        """Default messages with messages from settings.ERROR_MESSAGES"""
+        return self.get_error_messages_lookup()['catalog']
+
+    def get_error_message_template(self, message_type, field):
+        """(message_type, not formatted message) with custom_error_messages for field"""
+        lookup = self.get_error_messages_lookup()['lookup']
+        key = ('message', message_type, tuple(field) if isinstance(field, list) else field)
+        if key in lookup:
+            return lookup[key]
+
+        custom_error_messages = getattr(self, 'custom_error_messages', None) or {}
+        custom_errors = custom_error_messages.get(field if not isinstance(field, (list, tuple)) else tuple(field), {})
+        if isinstance(field, (list, tuple)) and not custom_errors:
+            for fi in field:
+                custom_errors = custom_errors or custom_error_messages.get(fi, {})
+                if custom_errors:
+                    break
+
+        if message_type in viewkeys(custom_errors):
+            result = (message_type, custom_errors[message_type])
+        elif message_type in ('max_length_int', 'max_length_digital', 'max_length_file') and 'max_length' in viewkeys(
+            custom_errors
+        ):
+            """в custom_error_messages для числового или файлового поля задано значение как max_length"""
+            result = (message_type, custom_errors['max_length'])
+        elif message_type in ('min_length_int', 'min_length_digital', 'min_length_file') and 'min_length' in viewkeys(
+            custom_errors
+        ):
+            result = (message_type, custom_errors['min_length'])
+        elif message_type in ('without_required', 'empty_required') and 'required' in viewkeys(custom_errors):
+            result = (message_type, custom_errors['required'])
+        else:
+            catalog = self.get_error_messages_catalog()
+            if message_type in ('without_required', 'empty_required') and message_type not in viewkeys(catalog):
+                message_type = 'required'
+            result = (message_type, catalog.get(message_type, ''))
+        lookup[key] = result
+        return result
+
     def get_error_message(self, message_type, field, *args, **kwargs):
+        """Use locals=locals() for format message with values from test"""
         previous_locals = kwargs.get('locals', {})
         if not previous_locals:
-            for frame in inspect.getouterframes(inspect.currentframe()):
-                if frame[3].startswith('test'):
-                    break
-            previous_locals = frame[0].f_locals
+            frame = sys._getframe(1)
+            while frame.f_back is not None and not frame.f_code.co_name.startswith('test'):
+                frame = frame.f_back
+            previous_locals = frame.f_locals
+        previous_locals = dict(previous_locals)
 
         if 'field' not in viewkeys(previous_locals):
             previous_locals['field'] = field
@@ -1170,7 +1496,7 @@ class GlobalTestMixIn(with_metaclass(MetaCheckFailures, object)):
             previous_locals['verbose_obj'] = previous_locals['verbose_obj'].decode('utf-8')
         previous_locals['verbose_field'] = (
             getattr(self.get_field_by_name(self.obj, field), 'verbose_name', field)
-            if (getattr(self, 'obj', None) and field in get_all_field_names_from_model(self.obj))
+            if (getattr(self, 'obj', None) and field in get_model_meta(self.obj).field_names)
             else field
         )
         if isinstance(previous_locals['verbose_field'], bytes):
@@ -1178,115 +1504,10 @@ class GlobalTestMixIn(with_metaclass(MetaCheckFailures, object)):
         previous_locals['verbose_pk'] = self.obj._meta.pk.verbose_name if getattr(self, 'obj', None) else 'id'
         if isinstance(previous_locals['verbose_pk'], bytes):
             previous_locals['verbose_pk'] = previous_locals['verbose_pk'].decode('utf-8')
-        ERROR_MESSAGES = {
-            'required': 'Обязательное поле.',
-            'max_length': 'Убедитесь, что это значение содержит не '
-            + 'более {length} символов (сейчас {current_length}).'
-            if (previous_locals.get('length', None) is None or not isinstance(previous_locals.get('length'), int))
-            else 'Убедитесь, что это значение содержит не '
-            + 'более {length} символов (сейчас {current_length}).'.format(**previous_locals),
-            'max_length_file': 'Убедитесь, что это имя файла содержит не '
-            + 'более {length} символов (сейчас {current_length}).'
-            if (previous_locals.get('length', None) is None or not isinstance(previous_locals.get('length'), int))
-            else 'Убедитесь, что это имя файла содержит не '
-            + 'более {length} символов (сейчас {current_length}).'.format(**previous_locals),
-            'max_length_digital': 'Убедитесь, что это значение меньше либо равно {max_value}.'
-            if (previous_locals.get('max_value', None) is None)
-            else 'Убедитесь, что это значение меньше либо равно {max_value}.'.format(**previous_locals),
-            'min_length': 'Убедитесь, что это значение содержит не '
-            + 'менее {length} символов (сейчас {current_length}).'
-            if (previous_locals.get('length', None) is None or not isinstance(previous_locals.get('length'), int))
-            else 'Убедитесь, что это значение содержит не '
-            + 'менее {length} символов (сейчас {current_length}).'.format(**previous_locals),
-            'min_length_digital': 'Убедитесь, что это значение больше либо равно {min_value}.'
-            if (previous_locals.get('min_value', None) is None)
-            else 'Убедитесь, что это значение больше либо равно {min_value}.'.format(**previous_locals),
-            'wrong_value': 'Выберите корректный вариант. Вашего ' + 'варианта нет среди допустимых значений.'
-            if 'value' not in previous_locals.keys()
-            else 'Выберите корректный вариант. {value} '.format(**previous_locals) + 'нет среди допустимых значений.',
-            'wrong_value_int': 'Введите целое число.',
-            'wrong_value_digital': 'Введите число.',
-            'wrong_value_email': 'Введите правильный адрес электронной почты.',
-            'unique': '{verbose_obj} с таким {verbose_field} уже существует.'.format(**previous_locals),
-            'delete_not_exists': 'Произошла ошибка. Попробуйте позже.',
-            'recovery_not_exists': 'Произошла ошибка. Попробуйте позже.',
-            'empty_file': 'Отправленный файл пуст.',
-            'max_count_file': 'Допускается загрузить не более {max_count} файлов.'
-            if (previous_locals.get('max_count', None) is None)
-            else 'Допускается загрузить не более {max_count} файлов.'.format(**previous_locals),
-            'max_size_file': 'Размер файла {filename} больше {max_size}.'
-            if (previous_locals.get('filename', None) is None or previous_locals.get('max_size', None) is None)
-            else 'Размер файла {filename} больше {max_size}.'.format(**previous_locals),
-            'wrong_extension': 'Некорректный формат файла {filename}.'
-            if previous_locals.get('filename', None) is None
-            else 'Некорректный формат файла {filename}.'.format(**previous_locals),
-            'min_dimensions': 'Минимальный размер изображения {min_width}x{min_height}.'
-            if (previous_locals.get('min_width', None) is None or previous_locals.get('min_height', None))
-            else 'Минимальный размер изображения {min_width}x{min_height}.'.format(**previous_locals),
-            'max_dimensions': 'Максимальный размер изображения {max_width}x{max_height}.'
-            if (previous_locals.get('max_width', None) is None or previous_locals.get('max_height', None))
-            else 'Максимальный размер изображения {max_width}x{max_height}.'.format(**previous_locals),
-            'max_sum_size_file': 'Суммарный размер изображений не должен превышать {max_size}.'
-            if previous_locals.get('max_size', None) is None
-            else 'Суммарный размер изображений не должен превышать {max_size}.'.format(**previous_locals),
-            'one_of': 'Оставьте одно из значений в полях {group}.'
-            if (previous_locals.get('group', None) is None)
-            else 'Оставьте одно из значений в полях {group}.'.format(**previous_locals),
-            'max_block_count': 'Пожалуйста, заполните не более {max_count} форм.'
-            if previous_locals.get('max_count', None) is None
-            else 'Пожалуйста, заполните не более {max_count} форм.'.format(**previous_locals),
-            'wrong_login': 'Пожалуйста, введите корректные адрес электронной почты и пароль для аккаунта. '
-            'Оба поля могут быть чувствительны к регистру.',
-            'inactive_user': 'Эта учетная запись отключена.',
-            'wrong_captcha': 'Неверный код',
-            'not_exist': '{verbose_obj} с {verbose_field} "{value}" не существует. Возможно оно было удалено?'
-            if previous_locals.get('value', '') == ''
-            else '{verbose_obj} с {verbose_pk} "{value}" не существует. Возможно оно было удалено?'.format(
-                **previous_locals
-            ),
-            'wrong_password_similar': 'Введённый пароль слишком похож на {user_field_name}.'
-            if previous_locals.get('user_field_name', '') == ''
-            else 'Введённый пароль слишком похож на {user_field_name}.'.format(**previous_locals),
-            'with_null': 'Данные содержат запрещённый символ: ноль-байт.',
-        }
 
-        messages_from_settings = getattr(settings, 'ERROR_MESSAGES', {})
-        ERROR_MESSAGES.update(messages_from_settings)
-        custom_errors = self.deepcopy(
-            getattr(self, 'custom_error_messages', {}).get(
-                field if not isinstance(field, (list, tuple)) else tuple(field), {}
-            )
-        )
-
-        if isinstance(field, (list, tuple)) and not custom_errors:
-            for fi in field:
-                custom_errors = custom_errors or self.deepcopy(getattr(self, 'custom_error_messages', {}).get(fi, {}))
-                if custom_errors:
-                    break
-
-        """в custom_error_messages для числового или файлового поля задано значение как max_length"""
-        if (
-            message_type in ('max_length_int', 'max_length_digital', 'max_length_file')
-            and 'max_length' in viewkeys(custom_errors)
-            and message_type not in viewkeys(custom_errors)
-        ):
-            custom_errors[message_type] = custom_errors['max_length']
-
-        if (
-            message_type in ('min_length_int', 'min_length_digital', 'min_length_file')
-            and 'min_length' in viewkeys(custom_errors)
-            and message_type not in viewkeys(custom_errors)
-        ):
-            custom_errors[message_type] = custom_errors['min_length']
-
-        if message_type in ('without_required', 'empty_required'):
-            if 'required' in viewkeys(custom_errors) and message_type not in viewkeys(custom_errors):
-                custom_errors[message_type] = custom_errors['required']
-            elif message_type not in viewkeys(custom_errors) and message_type not in viewkeys(ERROR_MESSAGES):
-                message_type = 'required'
-
-        ERROR_MESSAGES.update(custom_errors)
-        error_message = ERROR_MESSAGES.get(message_type, '')
+        message_type, error_message = self.get_error_message_template(message_type, field)
+        if callable(error_message):
+            error_message = error_message(previous_locals)
         if field is None:
             return (
                 [el.format(**previous_locals) for el in error_message]
@@ -1308,25 +1529,21 @@ class GlobalTestMixIn(with_metaclass(MetaCheckFailures, object)):
 
     def get_field_by_name(self, model, field):
         if re.findall(r'[\w_]+\-\d+\-[\w_]+', field):
-            obj_related_objects = self.get_related_names(model)
-            all_names = get_all_field_names_from_model(model)
             field_name = field.split('-')[0]
-            field_name = field_name if field_name in all_names else obj_related_objects.get(field_name, field_name)
-            related = model._meta.get_field(field_name)
+            if field_name not in get_model_meta(model).field_names:
+                field_name = self.get_related_names(model).get(field_name, field_name)
+            related = get_model_meta(model).get_field(field_name)
             model = getattr(
                 related,
                 'related_model',
                 getattr(getattr(related, 'rel', None), 'to', related.model),
             )
             field = field.split('-')[-1]
-        return model._meta.get_field(field)
+        return get_model_meta(model).get_field(field)
 
     def _get_field_value_by_name(self, obj, field):
         related_names_map = self.get_related_names(obj)
-        field = related_names_map.get(
-            re.sub(r'\-\d+\-', '-0-', field) if isinstance(field, basestring) else field,
-            field,
-        )
+        field = related_names_map.get(normalize_field_name(field), field)
 
         if re.findall(r'[\w_]+\-\d+\-[\w_]+', field):
             model_name, index, field_name = field.split('-')
@@ -1354,18 +1571,7 @@ class GlobalTestMixIn(with_metaclass(MetaCheckFailures, object)):
         return get_fields_list_from_response(response)
 
     def get_object_fields(self, obj):
-        object_fields = []
-        fields = obj._meta.get_fields()
-        for field in fields:
-            if field.__class__.__name__ in (
-                'RelatedObject',
-                'ManyToOneRel',
-                'OneToOneRel',
-            ):
-                object_fields.append(force_text(field.get_accessor_name()))
-            else:
-                object_fields.append(force_text(field.name))
-        return object_fields
+        return list(get_model_meta(obj).object_fields)
 
     def get_params_according_to_type(self, value, params_value):
         if type(value) is type(params_value):
@@ -1470,23 +1676,7 @@ class GlobalTestMixIn(with_metaclass(MetaCheckFailures, object)):
         return res
 
     def get_related_names(self, model):
-        def get_all_related_objects(model):
-            """from django docs"""
-            return [
-                f
-                for f in model._meta.get_fields()
-                if (f.one_to_many or f.one_to_one) and f.auto_created and not f.concrete
-            ]
-
-        obj_related_objects = dict(
-            [
-                (
-                    el.get_accessor_name(),
-                    getattr(el, 'var_name', el.get_accessor_name()),
-                )
-                for el in get_all_related_objects(model)
-            ]
-        )
+        obj_related_objects = dict(get_model_meta(model).related_objects)
 
         if not (getattr(self, 'obj', None)) or isinstance(model, self.obj) or model == self.obj:
             obj_related_objects.update(getattr(self, 'related_names', {}))
@@ -1528,7 +1718,7 @@ class GlobalTestMixIn(with_metaclass(MetaCheckFailures, object)):
 
     def get_value_for_field(self, length, field_name):
         """for fill use name with -0-"""
-        field_name = re.sub(r'\-\d+\-', '-0-', field_name) if isinstance(field_name, basestring) else field_name
+        field_name = normalize_field_name(field_name)
         if self.is_email_field(field_name):
             length = (
                 length
@@ -1544,9 +1734,7 @@ class GlobalTestMixIn(with_metaclass(MetaCheckFailures, object)):
         if self.is_digital_field(field_name):
             if getattr(self, 'obj', None):
                 try:
-                    if 'ForeignKey' in [
-                        b.__name__ for b in self.get_field_by_name(self.obj, field_name).__class__.__mro__
-                    ]:
+                    if 'ForeignKey' in get_mro_names(self.get_field_by_name(self.obj, field_name).__class__):
                         return choice(self.get_field_by_name(self.obj, field_name).related_model._base_manager.all()).pk
                 except FieldDoesNotExist:
                     pass
@@ -1635,35 +1823,33 @@ class GlobalTestMixIn(with_metaclass(MetaCheckFailures, object)):
     def get_url_for_negative(self, *args, **kwargs):
         return get_url_for_negative(*args, **kwargs)
 
+    def _get_fields_of_type(self, field_type):
+        """Fields names from all settings of field_type, built again after assignment of these settings"""
+        index = self.__dict__.setdefault('_fields_index', {})
+        fields = index.get(field_type)
+        if fields is None:
+            fields = [f for name in _fields_types_attrs[field_type] for f in (getattr(self, name, None) or ())]
+            try:
+                fields = frozenset(fields)
+            except TypeError:
+                pass
+            index[field_type] = fields
+        return fields
+
     def is_choice_field(self, field):
-        field = re.sub(r'\-\d+\-', '-0-', field) if isinstance(field, basestring) else field
-        return (
-            (field in (getattr(self, 'choice_fields', ()) or ()))
-            or (field in (getattr(self, 'choice_fields_add', ()) or ()))
-            or (field in (getattr(self, 'choice_fields_edit', ()) or ()))
-            or (field in (getattr(self, 'choice_fields_with_value_in_error', ()) or ()))
-            or (field in (getattr(self, 'choice_fields_add_with_value_in_error', ()) or ()))
-            or (field in (getattr(self, 'choice_fields_edit_with_value_in_error', ()) or ()))
-        )
+        return normalize_field_name(field) in self._get_fields_of_type('choice')
 
     def is_date_field(self, field):
-        field = re.sub(r'\-\d+\-', '-0-', field) if isinstance(field, basestring) else field
-        return field in getattr(self, 'date_fields', ())
+        return normalize_field_name(field) in self._get_fields_of_type('date')
 
     def is_datetime_field(self, field):
-        field = re.sub(r'\-\d+\-', '-0-', field) if isinstance(field, basestring) else field
-        return field in getattr(self, 'datetime_fields', ())
+        return normalize_field_name(field) in self._get_fields_of_type('datetime')
 
     def is_digital_field(self, field):
-        field = re.sub(r'\-\d+\-', '-0-', field) if isinstance(field, basestring) else field
-        return (
-            (field in (getattr(self, 'digital_fields', ()) or ()))
-            or (field in (getattr(self, 'digital_fields_add', ()) or ()))
-            or (field in (getattr(self, 'digital_fields_edit', ()) or ()))
-        )
+        return normalize_field_name(field) in self._get_fields_of_type('digital')
 
     def is_email_field(self, field):
-        field = re.sub(r'\-\d+\-', '-0-', field) if isinstance(field, basestring) else field
+        field = normalize_field_name(field)
         return (
             'email' in field
             and [
@@ -1672,14 +1858,10 @@ class GlobalTestMixIn(with_metaclass(MetaCheckFailures, object)):
                 getattr(self, 'email_fields_edit', None),
             ]
             == [None, None, None]
-        ) or (
-            (field in (getattr(self, 'email_fields', ()) or ()))
-            or (field in (getattr(self, 'email_fields_add', ()) or ()))
-            or (field in (getattr(self, 'email_fields_edit', ()) or ()))
-        )
+        ) or field in self._get_fields_of_type('email')
 
     def is_file_list(self, field):
-        field = re.sub(r'\-\d+\-', '-0-', field) if isinstance(field, basestring) else field
+        field = normalize_field_name(field)
         if not self.is_file_field(field):
             return False
         for param_name in (
@@ -1693,15 +1875,10 @@ class GlobalTestMixIn(with_metaclass(MetaCheckFailures, object)):
         return False
 
     def is_int_field(self, field):
-        field = re.sub(r'\-\d+\-', '-0-', field) if isinstance(field, basestring) else field
-        return (
-            (field in (getattr(self, 'int_fields', ()) or ()))
-            or (field in (getattr(self, 'int_fields_add', ()) or ()))
-            or (field in (getattr(self, 'int_fields_edit', ()) or ()))
-        )
+        return normalize_field_name(field) in self._get_fields_of_type('int')
 
     def is_file_field(self, field):
-        field = re.sub(r'\-\d+\-', '-0-', field) if isinstance(field, basestring) else field
+        field = normalize_field_name(field)
 
         def check_by_params_name(name):
             params = getattr(self, name, None)
@@ -1717,22 +1894,17 @@ class GlobalTestMixIn(with_metaclass(MetaCheckFailures, object)):
                 return True
             return False
 
-        return field not in getattr(self, 'not_file', []) and (
+        return field not in self._get_fields_of_type('not_file') and (
             field in getattr(self, 'file_fields_params_add', {}).keys()
             or field in getattr(self, 'file_fields_params_edit', {}).keys()
-            or (isinstance(field, basestring) and re.findall(r'(^|[^a-zA-Z])(file)', field))
+            or (isinstance(field, basestring) and is_file_like_name(field))
             or check_by_params_name('default_params')
             or check_by_params_name('default_params_add')
             or check_by_params_name('default_params_edit')
         )
 
     def is_multiselect_field(self, field):
-        field = re.sub(r'\-\d+\-', '-0-', field) if isinstance(field, basestring) else field
-        return (
-            (field in (getattr(self, 'multiselect_fields', ()) or ()))
-            or (field in (getattr(self, 'multiselect_fields_add', ()) or ()))
-            or (field in (getattr(self, 'multiselect_fields_edit', ()) or ()))
-        )
+        return normalize_field_name(field) in self._get_fields_of_type('multiselect')
 
     def pop_field_from_params(self, params, field):
         params.pop(field, None)
@@ -1749,8 +1921,18 @@ class GlobalTestMixIn(with_metaclass(MetaCheckFailures, object)):
             params[field] = ''
 
     def update_params(self, params):
-        unique_keys = [k for el in viewkeys(self.all_unique) for k in el if not k.endswith(self.non_field_error_key)]
-        for key in set(viewkeys(params)).intersection(unique_keys):
+        unique_keys = self._get_unique_keys()
+        self._update_unique_params(params, set(viewkeys(params)).intersection(unique_keys))
+        for key, v in viewitems(params):
+            if v and self.is_file_field(key):
+                params[key] = self._get_new_file_value(key, isinstance(v, (list, tuple)))
+        return params
+
+    def _get_unique_keys(self):
+        return [k for el in viewkeys(self.all_unique) for k in el if not k.endswith(self.non_field_error_key)]
+
+    def _update_unique_params(self, params, unique_keys):
+        for key in unique_keys:
             default_value = params[key] or (
                 getattr(self, 'default_params', {})
                 or getattr(self, 'default_params_add', {})
@@ -1785,18 +1967,13 @@ class GlobalTestMixIn(with_metaclass(MetaCheckFailures, object)):
                     n += 1
                     params[key] = self.get_value_for_field(None, key)
 
-        for key, v in viewitems(params):
-            if v and self.is_file_field(key):
-                if isinstance(v, (list, tuple)):
-                    file_value = self.get_value_for_field(None, key)
-                    if not isinstance(file_value, list):
-                        file_value = [
-                            file_value,
-                        ]
-                    params[key] = file_value
-                else:
-                    params[key] = self.get_value_for_field(None, key)
-        return params
+    def _get_new_file_value(self, key, is_list):
+        file_value = self.get_value_for_field(None, key)
+        if is_list and not isinstance(file_value, list):
+            file_value = [
+                file_value,
+            ]
+        return file_value
 
     def update_captcha_params(self, url, params, force=False):
         if self.with_captcha or force:
@@ -1836,6 +2013,34 @@ class LoginMixIn(object):
         self.user_login(username, password, **kwargs)
 
 
+@lru_cache(maxsize=256)
+def resolve_view(urlconf, path):
+    """Resolved view for path or None"""
+    try:
+        return resolve(path, urlconf)
+    except Http404:
+        return None
+
+
+_fields_dependencies = WeakKeyDictionary()
+_params_templates = WeakKeyDictionary()
+_prepared_form_configs = WeakKeyDictionary()
+
+
+class FormValidationResponse(object):
+    """
+    Response for subcases checked by form validation without HTTP request
+    """
+
+    content = b''
+    context_data = None
+
+    def __init__(self, form, status_code):
+        self.context = ContextList([{'form': form}])
+        self.status_code = status_code
+        self.redirect_chain = []
+
+
 class FormCommonMixIn(object):
     obj = None
     all_fields = None
@@ -1852,6 +2057,9 @@ class FormCommonMixIn(object):
     choice_fields_with_value_in_error = []
     choice_fields_add_with_value_in_error = []
     choice_fields_edit_with_value_in_error = []
+    combine_negative_checks = False
+    concurrent_negative_batch_size = 10
+    concurrent_negative_checks = False
     default_params = None
     default_params_add = None
     default_params_edit = None
@@ -1860,6 +2068,7 @@ class FormCommonMixIn(object):
     digital_fields = None
     digital_fields_add = None
     digital_fields_edit = None
+    direct_view_call = False
     disabled_fields = None
     disabled_fields_add = None
     disabled_fields_edit = None
@@ -1871,6 +2080,11 @@ class FormCommonMixIn(object):
     fields_helptext_add = None
     fields_helptext_edit = None
     filter_params = None
+    form_validation_http_every = 10
+    fuzzing_batch_size = 50
+    fuzzing_max_requests = None
+    fuzzing_seed = None
+    fuzzing_time_budget = None
     file_fields_params = None
     """{'field_name': {'extensions': ('jpg', 'txt'),
         'max_count': 3,
@@ -1919,6 +2133,76 @@ class FormCommonMixIn(object):
 
     def __init__(self, *args, **kwargs):
         super(FormCommonMixIn, self).__init__(*args, **kwargs)
+        self._set_form_config()
+
+    def for_pre_setup(self):
+        if self.__dict__.pop('_form_config_released', False):
+            self._set_form_config()
+        super(FormCommonMixIn, self).for_pre_setup()
+        cached = _prepared_form_configs.get(self.__class__)
+        if cached is not None:
+            # prepared values are shared by tests of class, values changed in place are restored after test
+            for name, frozen_value in viewitems(cached[2]):
+                if self.__dict__.get(name) is cached[1][name]:
+                    self._shared_config.append((cached[1][name], frozen_value))
+
+    def release_test_state(self):
+        super(FormCommonMixIn, self).release_test_state()
+        # prepared values are restored from class cache (or prepared again) if test is run again
+        for name in self.__dict__.pop('_form_config_names', ()):
+            self.__dict__.pop(name, None)
+        self.__dict__.pop('_form_validation_requests_count', None)
+        self._form_config_released = True
+
+    def _set_form_config(self):
+        signature = self._get_form_config_signature()
+        cached = _prepared_form_configs.get(self.__class__)
+        if cached is not None and self._is_same_form_config_signature(cached[0], signature):
+            for name, value in viewitems(cached[1]):
+                setattr(self, name, value)
+            self._form_config_names = list(cached[1])
+            return
+        before = dict(self.__dict__)
+        self._prepare_form_config()
+        # settings of fields can be changed in place while prepared
+        self.__dict__.pop('_fields_index', None)
+        prepared = {
+            name: value for name, value in viewitems(self.__dict__) if name not in before or before[name] is not value
+        }
+        self._form_config_names = list(prepared)
+        frozen = {}
+        for name, value in viewitems(prepared):
+            if isinstance(value, (dict, list, set)):
+                frozen[name] = self._freeze_config_value(value)
+                if frozen[name] is None:
+                    # files are closed after every test, so they can not be shared
+                    return
+        _prepared_form_configs[self.__class__] = (signature, prepared, frozen)
+
+    def _get_form_config_signature(self):
+        class_values = tuple(
+            (name, value)
+            for klass in self.__class__.__mro__
+            for name, value in viewitems(vars(klass))
+            if not name.startswith('__')
+            and not callable(value)
+            and not isinstance(value, (property, classmethod, staticmethod))
+        )
+        instance_values = {
+            name: value
+            for name, value in viewitems(self.__dict__)
+            if not name.startswith('_') and hasattr(self.__class__, name)
+        }
+        return class_values, instance_values
+
+    def _is_same_form_config_signature(self, signature, other):
+        return (
+            len(signature[0]) == len(other[0])
+            and all(a[0] == b[0] and a[1] is b[1] for a, b in zip(signature[0], other[0]))
+            and signature[1] == other[1]
+        )
+
+    def _prepare_form_config(self):
         if self.default_params is None:
             self.default_params = {}
         if not self.default_params_add:
@@ -2410,7 +2694,7 @@ class FormCommonMixIn(object):
             while n < 3 and value == self._get_field_value_by_name(obj_for_edit, field):
                 n += 1
                 value = self.get_value_for_field(None, field)
-                mro_names = [b.__name__ for b in field_class.__class__.__mro__]
+                mro_names = get_mro_names(field_class.__class__)
                 if 'DateField' in mro_names:
                     try:
                         value = datetime.strptime(
@@ -2432,7 +2716,7 @@ class FormCommonMixIn(object):
                 params = {}
                 for f_name in self.get_object_fields(value):
                     f = self.get_field_by_name(value, f_name)
-                    mro_names = set([m.__name__ for m in f.__class__.__mro__])
+                    mro_names = get_mro_names(f.__class__)
                     if 'AutoField' in mro_names:
                         continue
                     if (
@@ -2526,16 +2810,140 @@ class FormCommonMixIn(object):
             param, _ = self.get_params_according_to_type(value, '')
             params[field_name] = value
 
+    def get_params_template(self, additional):
+        """
+        Prepared default_params_<additional>: values without files, which are regenerated in update_params.
+        Compiled once per class, rebuilt if default params are changed
+        """
+        default_params = getattr(self, 'default_params_' + additional)
+        class_cache = _params_templates.setdefault(self.__class__, {})
+        template = class_cache.get(additional)
+        if (
+            template is None
+            or template['all_unique'] != self.all_unique
+            or len(default_params) != len(template['values'])
+            or not all(k in default_params and default_params[k] for k in template['file_keys'])
+            or not all(
+                k in default_params and default_params[k] == v
+                for k, v in viewitems(template['values'])
+                if k not in template['file_keys']
+            )
+        ):
+            file_keys = {
+                k: isinstance(v, (list, tuple)) for k, v in viewitems(default_params) if v and self.is_file_field(k)
+            }
+            values = self.deepcopy(
+                type(default_params)((k, None if k in file_keys else v) for k, v in viewitems(default_params))
+            )
+            template = class_cache[additional] = {
+                'all_unique': self.deepcopy(self.all_unique),
+                'values': values,
+                'file_keys': file_keys,
+                'mutable_keys': [
+                    k
+                    for k, v in viewitems(values)
+                    if not isinstance(v, (basestring, bytes, int, float, Decimal, date, time, type(None)))
+                ],
+                'unique_keys': set(viewkeys(values)).intersection(self._get_unique_keys()),
+            }
+        return template
+
+    def get_default_params(self, additional):
+        """
+        Copy of default_params_<additional> with new unique and file values, same as after update_params
+        """
+        if getattr(self.update_params, '__func__', None) is not getattr(
+            GlobalTestMixIn.update_params, '__func__', GlobalTestMixIn.update_params
+        ):
+            # overridden update_params can change any values
+            params = self.deepcopy(getattr(self, 'default_params_' + additional))
+            self.update_params(params)
+            return params
+        template = self.get_params_template(additional)
+        params = copy(template['values'])
+        if template['mutable_keys']:
+            params.update(self.deepcopy({k: params[k] for k in template['mutable_keys']}))
+        self._update_unique_params(params, template['unique_keys'])
+        for key, is_list in viewitems(template['file_keys']):
+            params[key] = self._get_new_file_value(key, is_list)
+        return params
+
+    def get_test_type(self):
+        """
+        '_add', '_edit' or '' by name of current test
+        """
+        cached = self.__dict__.get('_test_type')
+        if cached is None or cached[0] != self._testMethodName:
+            test_name = self.id()
+            test_type = ''
+            if 'test_add_' in test_name:
+                test_type = '_add'
+            elif 'test_edit_' in test_name:
+                test_type = '_edit'
+            cached = self._test_type = (self._testMethodName, test_type)
+        return cached[1]
+
+    def get_fields_dependencies(self, test_type):
+        """
+        required_if, only_if_value and required_if_value indexed by lead fields.
+        Compiled once per class, rebuilt if these attributes differ from class ones
+        """
+        sources = tuple(
+            getattr(self, name + test_type) or {} for name in ('required_if', 'only_if_value', 'required_if_value')
+        )
+        cached = self.__dict__.get('_fields_dependencies', {}).get(test_type)
+        if cached and all(a is b for a, b in zip(cached[0], sources)):
+            return cached[1]
+        class_cache = _fields_dependencies.setdefault(self.__class__, {})
+        if test_type in class_cache and class_cache[test_type][0] == sources:
+            dependencies = class_cache[test_type][1]
+        else:
+            compiled_sources = deepcopy(sources)
+            dependencies = self._compile_fields_dependencies(*compiled_sources)
+            class_cache[test_type] = (compiled_sources, dependencies)
+        self.__dict__.setdefault('_fields_dependencies', {})[test_type] = (sources, dependencies)
+        return dependencies
+
+    def _compile_fields_dependencies(self, required_if, only_if_value, required_if_value):
+        def get_lead_params_list(lead_params_list):
+            return tuple(lead_params_list) if isinstance(lead_params_list, (tuple, list)) else (lead_params_list,)
+
+        dependencies = {
+            'required_if': {
+                field: tuple(related) if isinstance(related, (list, tuple)) else (related,)
+                for field, related in viewitems(required_if)
+            },
+            'only_if_value': {},
+            'required_if_value': {},
+            'required_if_value_order': [],
+            'only_if_values': only_if_value,
+        }
+        for name, source in (('only_if_value', only_if_value), ('required_if_value', required_if_value)):
+            for related_field, lead_params_list in viewitems(source):
+                for lead_params in get_lead_params_list(lead_params_list):
+                    for lead_field in lead_params:
+                        dependencies[name].setdefault(lead_field, []).append((related_field, lead_params))
+
+        # fields, which are leads for other dependent fields, are filled first
+        visited = set()
+
+        def visit(depended_field, lead_params_list):
+            if depended_field in visited:
+                return
+            visited.add(depended_field)
+            for lead_params in lead_params_list:
+                for lead_field in lead_params:
+                    if lead_field in required_if_value:
+                        visit(lead_field, get_lead_params_list(required_if_value[lead_field]))
+            dependencies['required_if_value_order'].append((depended_field, lead_params_list))
+
+        for depended_field, lead_params_list in viewitems(required_if_value):
+            visit(depended_field, get_lead_params_list(lead_params_list))
+        return dependencies
+
     def fill_required_if(self, params):
-        test_name = self.id()
-        test_type = ''
-        if 'test_add_' in test_name:
-            test_type = '_add'
-        elif 'test_edit_' in test_name:
-            test_type = '_edit'
-        for depended_field, lead_params_list in viewitems(getattr(self, 'required_if_value' + test_type) or {}):
-            if not isinstance(lead_params_list, (tuple, list)):
-                lead_params_list = (lead_params_list,)
+        dependencies = self.get_fields_dependencies(self.get_test_type())
+        for depended_field, lead_params_list in dependencies['required_if_value_order']:
             for lead_params in lead_params_list:
                 if all((params.get(k, None) == v for k, v in viewitems(lead_params))):
                     if isinstance(depended_field, tuple):
@@ -2548,48 +2956,537 @@ class FormCommonMixIn(object):
 
     def fill_with_related(self, params, field, value):
         params[field] = value
-        test_name = self.id()
-        test_type = ''
-        if 'test_add_' in test_name:
-            test_type = '_add'
-        elif 'test_edit_' in test_name:
-            test_type = '_edit'
-
-        related = (getattr(self, 'required_if' + test_type) or {}).get(field, ())
-        for related_field in related if isinstance(related, (list, tuple)) else (related,):
+        test_type = self.get_test_type()
+        dependencies = self.get_fields_dependencies(test_type)
+
+        for related_field in dependencies['required_if'].get(field, ()):
             if params.get(related_field, None) in (None, ''):
                 self.fill_with_related(params, related_field, self.get_value_for_field(None, related_field))
 
         getattr(self, 'clean_depend_fields' + test_type)(params, field)
 
-        for related_field, lead_params_list in viewitems(getattr(self, 'only_if_value' + test_type) or {}):
-            if not isinstance(lead_params_list, (tuple, list)):
-                lead_params_list = (lead_params_list,)
-            for lead_params in lead_params_list:
-                if field in viewkeys(lead_params) and lead_params != {
-                    k: v for k, v in viewitems(params) if k in viewkeys(lead_params)
-                }:
-                    self.set_empty_value_for_field(params, related_field)
-
-        for related_field, lead_params_list in viewitems(getattr(self, 'required_if_value' + test_type) or {}):
-            if not isinstance(lead_params_list, (tuple, list)):
-                lead_params_list = (lead_params_list,)
-            for lead_params in lead_params_list:
-                if (
-                    field in viewkeys(lead_params)
-                    and lead_params == {k: v for k, v in viewitems(params) if k in viewkeys(lead_params)}
-                    and params.get(related_field, None) in (None, '')
+        for related_field, lead_params in dependencies['only_if_value'].get(field, ()):
+            if not all(k in params and params[k] == v for k, v in viewitems(lead_params)):
+                self.set_empty_value_for_field(params, related_field)
+
+        for related_field, lead_params in dependencies['required_if_value'].get(field, ()):
+            if all(k in params and params[k] == v for k, v in viewitems(lead_params)) and params.get(
+                related_field, None
+            ) in (None, ''):
+                for rf in self._get_required_from_related(
+                    (related_field if isinstance(related_field, (tuple, list)) else (related_field,),)
                 ):
-                    related_field = self._get_required_from_related(
-                        (related_field,) if isinstance(related_field, (tuple, list)) else ((related_field,))
-                    )
-                    for rf in related_field:
-                        self.fill_with_related(params, rf, self.get_value_for_field(None, rf))
+                    self.fill_with_related(params, rf, self.get_value_for_field(None, rf))
 
-        only_if_values = (getattr(self, 'only_if_value' + test_type) or {}).get(field, {})
+        only_if_values = dependencies['only_if_values'].get(field, {})
 
         params.update(choice(only_if_values) if isinstance(only_if_values, (list, tuple)) else only_if_values)
 
+    def send_post_request(self, url, params):
+        """
+        POST request to url. If direct_view_call is set, view is called without middlewares (if url is resolved)
+        """
+        if not self.direct_view_call:
+            return self.client.post(url, params, follow=True, **self.additional_params)
+        path = urlparse(url).path
+        resolved = resolve_view(get_urlconf() or settings.ROOT_URLCONF, path)
+        if resolved is None:
+            return self.client.post(url, params, follow=True, **self.additional_params)
+        view, args, kwargs = resolved
+
+        request = RequestFactory().post(url, params, **self.additional_params)
+        response = None
+        try:
+            # as in test client, database connections are not closed on request start and finish
+            request_started.disconnect(close_old_connections)
+            try:
+                request_started.send(sender=self.__class__, environ=request.environ)
+            finally:
+                request_started.connect(close_old_connections)
+            request._dont_enforce_csrf_checks = True
+            request.session = self.client.session
+            request.user = get_user(request)
+            request._messages = default_messages_storage(request)
+
+            data = {}
+            on_template_render = partial(test_client.store_rendered_templates, data)
+            signal_uid = 'template-render-%s' % id(request)
+            template_rendered.connect(on_template_render, dispatch_uid=signal_uid)
+            try:
+                try:
+                    response = call_view(view, request, *args, **kwargs)
+                    if callable(getattr(response, 'render', None)) and not response.is_rendered:
+                        response.render()
+                except (Http404, PermissionDenied) as e:
+                    if response_for_exception is None:
+                        raise
+                    response = response_for_exception(request, e)
+            finally:
+                template_rendered.disconnect(dispatch_uid=signal_uid)
+            request._messages.update(response)
+            if request.session.modified:
+                request.session.save()
+            self.client.cookies.update(response.cookies)
+            session_cookie = self.client.cookies.get(settings.SESSION_COOKIE_NAME)
+            session_key = request.session.session_key
+            if session_key and (not session_cookie or session_cookie.value != session_key):
+                # new session was created by view (session middleware sets cookie in usual request)
+                self.client.cookies[settings.SESSION_COOKIE_NAME] = session_key
+                self.client.cookies[settings.SESSION_COOKIE_NAME].update(
+                    {
+                        'max-age': None,
+                        'path': '/',
+                        'domain': settings.SESSION_COOKIE_DOMAIN,
+                        'secure': settings.SESSION_COOKIE_SECURE or None,
+                        'expires': None,
+                    }
+                )
+
+            if response.status_code in (301, 302, 303, 307, 308):
+                redirect_url = urljoin(path, response['Location'])
+                redirect_response = self.client.get(redirect_url, follow=True, **self.additional_params)
+                redirect_response.redirect_chain[:0] = [(redirect_url, response.status_code)]
+                return redirect_response
+            response.client = self.client
+            response.request = request
+            response.templates = data.get('templates', [])
+            response.context = data.get('context')
+            response.redirect_chain = []
+            return response
+        finally:
+            # uploaded files are removed when request is closed
+            request.close()
+            if response is not None and not response.streaming:
+                request_finished.disconnect(close_old_connections)
+                try:
+                    response.close()
+                finally:
+                    request_finished.connect(close_old_connections)
+
+    def is_form_validation_subcase(self, additional, params=None):
+        """
+        Subcases of tests marked with form_validation_subcases are checked by form validation if
+        form_class_add/form_class_edit is set. Every form_validation_http_every request is sent through HTTP.
+        Formsets are not validated, so subcases for inline fields (or unknown subcases with inline fields in params)
+        are sent through HTTP
+        """
+        if not getattr(self, 'form_class_' + additional, None) or not getattr(
+            getattr(self, self._testMethodName, None), 'form_validation_subcases', False
+        ):
+            return False
+        if params and any(
+            isinstance(k, basestring) and (k.endswith('TOTAL_FORMS') or parse_field_name(k)[1] is not None)
+            for k in params
+        ):
+            subcase = getattr(self, '_current_subcase', None)
+            if not isinstance(subcase, basestring) or parse_field_name(subcase)[1] is not None:
+                return False
+        every = self.form_validation_http_every
+        count = self.__dict__.get('_form_validation_requests_count')
+        if count is None:
+            # sampled requests depend only on test, not on order or selection of tests
+            count = zlib.crc32(force_bytes(self.id())) % every if every else 0
+        self._form_validation_requests_count = count + 1
+        return not (every and self._form_validation_requests_count % every == 0)
+
+    def get_form_validation_response(self, form_class, params, additional, **form_kwargs):
+        """
+        Response-like object with validated form in context
+        """
+        request = RequestFactory().post('/', params)
+        try:
+            form = form_class(data=request.POST, files=request.FILES, **form_kwargs)
+            if form.is_valid():
+                return FormValidationResponse(form, getattr(self, 'status_code_success_%s' % additional))
+            return FormValidationResponse(form, self.status_code_error)
+        finally:
+            request.close()
+
+    def get_compatible_fields_groups(self, fields, additional):
+        """
+        Split fields to groups which can be filled together in one request
+        """
+        depend_one_of_fields = getattr(self, '_depend_one_of_fields_' + additional)
+        only_if_value = getattr(self, 'only_if_value_' + additional) or {}
+        groups = []
+        for field in fields:
+            field_values = only_if_value.get(field, {})
+            if isinstance(field_values, (list, tuple)):
+                groups.append(([field], None))
+                continue
+            for group_fields, group_values in groups:
+                if (
+                    group_values is not None
+                    and not set(depend_one_of_fields.get(field, ())).intersection(group_fields)
+                    and not set(viewkeys(field_values)).intersection(group_fields)
+                    and field not in group_values
+                    and all(group_values.get(k, v) == v for k, v in viewitems(field_values))
+                ):
+                    group_fields.append(field)
+                    group_values.update(field_values)
+                    break
+            else:
+                groups.append(([field], dict(field_values)))
+        return [group_fields for group_fields, _ in groups]
+
+    def check_fields_by_bisection(self, fields, check, error_text, failed=False):
+        """
+        Check fields group with one request, if it fails check both halves of group the same way.
+        check(fields) raises exception on fail, error_text(field) is text for error in single field.
+        If failed is True group is already known as failed and only halves are checked
+        """
+        selected_fields = list(self.get_subcases(fields))
+        if len(selected_fields) != len(fields):
+            fields = selected_fields
+            failed = False
+        groups = [list(fields)]
+        if failed and len(fields) > 1:
+            groups = [groups[0][: len(fields) // 2], groups[0][len(fields) // 2 :]]
+        while groups:
+            group = groups.pop(0)
+            sp = transaction.savepoint()
+            mail.outbox = []
+            try:
+                check(group)
+            except Exception:
+                self.savepoint_rollback(sp)
+                if len(group) == 1:
+                    self._current_subcase = group[0]
+                    try:
+                        self.errors_append(text=error_text(group[0]))
+                    finally:
+                        self._current_subcase = None
+                else:
+                    groups[:0] = [group[: len(group) // 2], group[len(group) // 2 :]]
+            finally:
+                mail.outbox = []
+
+    def get_independent_fields(self, fields, additional):
+        """
+        Fields without required_if, required_if_value, only_if_value and one_of_fields interactions
+        """
+
+        def get_names(value):
+            if isinstance(value, dict):
+                return list(viewkeys(value))
+            if isinstance(value, (list, tuple)):
+                return [name for el in value for name in get_names(el)]
+            return [value]
+
+        dependent = set(viewkeys(getattr(self, '_depend_one_of_fields_' + additional)))
+        for name in ('required_if_', 'required_if_value_', 'only_if_value_'):
+            for field, value in viewitems(getattr(self, name + additional) or {}):
+                dependent.update(get_names(field))
+                dependent.update(get_names(value))
+        return [field for field in fields if field not in dependent]
+
+    def get_requests_estimate(self):
+        """
+        Rough count of requests, which current test will send if it passes, by the same params the test iterates.
+        Failed combined checks add bisection requests. fuzzing_max_requests for fuzzing tests, None if they are limited
+        by time only
+        """
+        name = self._testMethodName
+        if 'fuzzing' in name:
+            return self.fuzzing_max_requests
+        additional = 'add' if '_add_' in name else 'edit' if '_edit_' in name else None
+        if additional is None:
+            return 1
+        all_fields = getattr(self, 'all_fields_%s' % additional, None) or ()
+        file_fields_params = getattr(self, 'file_fields_params_%s' % additional, None) or {}
+        unique_fields = getattr(self, 'unique_fields_%s' % additional, None) or ()
+        only_if_value = getattr(self, 'only_if_value_%s' % additional, None) or {}
+        depend_one_of_fields = getattr(self, '_depend_one_of_fields_%s' % additional, None) or {}
+
+        def combined(fields):
+            """One request for all fields, plus one request for every group if fields depend on each other"""
+            fields = list(fields)
+            if not fields:
+                return 0
+            only_if_values = {}
+            need_one_by_one_check = set(fields).intersection(viewkeys(depend_one_of_fields))
+            for field in fields:
+                for k, v in viewitems(only_if_value.get(field, {})):
+                    if only_if_values.get(k, v) != v:
+                        need_one_by_one_check.add(field)
+                if field not in need_one_by_one_check:
+                    only_if_values.update(only_if_value.get(field, {}))
+            if not need_one_by_one_check:
+                return 1
+            return 1 + len(self.get_compatible_fields_groups(fields, additional))
+
+        if 'max_length_values_positive' in name:
+            other_fields = self.get_all_not_str_fields(additional)
+            return combined(k for k in all_fields if normalize_field_name(k) not in other_fields)
+        if 'big_file_positive' in name:
+            return combined(viewkeys(file_fields_params))
+        if 'value_max_in_digital_positive' in name or 'value_min_in_digital_positive' in name:
+            key = 'max_values' if '_max_' in name else 'min_values'
+            return combined(
+                field
+                for field in getattr(self, 'digital_fields_%s' % additional, None) or ()
+                if self.get_digital_values_range(field)[key]
+            )
+        if 'different_unique_values' in name:
+            return max(1, len(set(field for group in unique_fields for field in group)))
+        if 'unique' in name:
+            return len(unique_fields)
+        if 'wrong_file_extensions' in name:
+            return sum(
+                len(field_dict.get('wrong_extensions', ())) + 2
+                for field_dict in viewvalues(file_fields_params)
+                if field_dict.get('extensions', ())
+            )
+        if 'some_file_extensions' in name:
+            return sum(
+                len(extensions) + len([e for e in extensions if e])
+                for extensions in (
+                    field_dict.get('extensions', ()) or ('ext', '') for field_dict in viewvalues(file_fields_params)
+                )
+            )
+        if 'image_dimensions' in name:
+            return len(file_fields_params)
+        if 'file' in name:
+            return len(file_fields_params) or 1
+        subcases = self.get_estimate_subcases(name.split('_object_', 1)[-1], additional)
+        if subcases is not None:
+            return self.get_subcases_requests_estimate(name, additional, *subcases)
+        for name_part, attr in (
+            ('disabled_fields', 'disabled_fields'),
+            ('one_of_fields', 'one_of_fields'),
+            ('intervals', 'intervals'),
+            ('inline_blocks', 'max_blocks'),
+            ('related', 'only_if_value'),
+            ('with_null', 'all_fields'),
+        ):
+            if name_part in name:
+                value = getattr(self, '%s_%s' % (attr, additional), None)
+                if value is None:
+                    value = getattr(self, attr, None)
+                return len([el for el in value or () if not isinstance(el, basestring) or el in all_fields])
+        return 1
+
+    def get_estimate_subcases(self, test_kind, additional):
+        """
+        (field, value) subcases, which negative test iterates, and count of requests for groups of fields.
+        Value is None if test doesn't depend on it. None for other tests
+        """
+        all_fields = getattr(self, 'all_fields_%s' % additional, None) or ()
+        digital_fields = getattr(self, 'digital_fields_%s' % additional, None) or ()
+        if test_kind == 'empty_required_fields_negative':
+            return (
+                [(f, None) for f in getattr(self, 'not_empty_fields_%s' % additional) if 'FORMS' not in f],
+                len(getattr(self, 'not_empty_related_fields_%s' % additional)),
+            )
+        if test_kind == 'without_required_fields_negative':
+            return (
+                [
+                    (f, None)
+                    for f in getattr(self, 'required_fields_%s' % additional)
+                    if 'FORMS' not in f and (additional == 'add' or not re.findall(r'.+?\-\d+\-.+?', f))
+                ],
+                len(getattr(self, 'required_related_fields_%s' % additional)),
+            )
+        if test_kind in ('values_length_gt_max_negative', 'values_length_lt_min_negative'):
+            other_fields = list(digital_fields) + list(self.date_fields or ())
+            fields_length = self.max_fields_length if '_gt_max_' in test_kind else self.min_fields_length
+            return [(k, v) for k, v in viewitems(fields_length) if k in all_fields and k not in other_fields], 0
+        if test_kind == 'with_wrong_choices_negative':
+            fields = set(
+                tuple(getattr(self, 'choice_fields_%s' % additional))
+                + tuple(getattr(self, 'choice_fields_%s_with_value_in_error' % additional))
+            )
+            return [(f, v) for f in fields for v in self.custom_wrong_values.get(f, WRONG_CHOICE_VALUES)], 0
+        if test_kind == 'with_wrong_multiselect_choices_negative':
+            return (
+                [
+                    (f, v)
+                    for f in getattr(self, 'multiselect_fields_%s' % additional)
+                    for v in self.custom_wrong_values.get(f, WRONG_CHOICE_VALUES)
+                ],
+                0,
+            )
+        if test_kind in ('wrong_values_in_digital_negative', 'wrong_values_in_email_negative'):
+            fields, values = (
+                (digital_fields, WRONG_DIGITAL_VALUES)
+                if '_digital_' in test_kind
+                else (getattr(self, 'email_fields_%s' % additional), WRONG_EMAIL_VALUES)
+            )
+            return [(f, v) for f in fields for v in self.custom_wrong_values.get(f, values)], 0
+        if test_kind in ('value_gt_max_in_digital_negative', 'value_lt_min_in_digital_negative'):
+            key, get_list = (
+                ('max_values', self.get_gt_max_list) if '_gt_max_' in test_kind else ('min_values', self.get_lt_min_list)
+            )
+            return [(f, v) for f in digital_fields for v in get_list(f, self.get_digital_values_range(f)[key])], 0
+        if test_kind == 'disabled_fields_values_negative':
+            return [(f, None) for f in getattr(self, 'disabled_fields_%s' % additional)], 0
+        return None
+
+    def get_subcases_requests_estimate(self, test_name, additional, cases, groups_count):
+        """
+        Count of HTTP requests for test subcases (and requests for groups of fields) with current
+        combine_negative_checks, concurrent_negative_checks and form validation settings
+        """
+        cases = list(self.get_subcases(cases))
+        # requests, which can be replaced with form validation
+        requests_count = groups_count
+        http_count = 0
+        if test_name.endswith(
+            ('values_length_gt_max_negative', 'with_wrong_choices_negative', 'wrong_values_in_digital_negative')
+        ) and (self.combine_negative_checks or self.concurrent_negative_checks):
+            if self.combine_negative_checks:
+                independent_fields = self.get_independent_fields(set(case[0] for case in cases), additional)
+                pending = [case for case in cases if case[0] in independent_fields]
+                while len(set(case[0] for case in pending)) > 1:
+                    combined_cases = []
+                    for case in pending:
+                        if case[0] not in [el[0] for el in combined_cases]:
+                            combined_cases.append(case)
+                    pending = [case for case in pending if case not in combined_cases]
+                    cases = [case for case in cases if case not in combined_cases]
+                    requests_count += 1
+            if self.concurrent_negative_checks and send_concurrent_post_requests is not None and not self.with_captcha:
+                http_count += len(cases)
+                cases = []
+        if not getattr(self, 'form_class_' + additional, None) or not getattr(
+            getattr(self, test_name, None), 'form_validation_subcases', False
+        ):
+            return http_count + requests_count + len(cases)
+        # inline fields are always checked with HTTP requests
+        inline_cases = [case for case in cases if parse_field_name(case[0])[1] is not None]
+        requests_count += len(cases) - len(inline_cases)
+        every = self.form_validation_http_every
+        if every:
+            offset = zlib.crc32(force_bytes(self.id())) % every
+            http_count += (offset + requests_count) // every - offset // every
+        return http_count + len(inline_cases)
+
+    def check_combined_negative_cases(self, cases, additional):
+        """
+        Check errors for independent fields in one request.
+        cases is list of (field, value, message_type, message_locals), one request contains one value for every field.
+        Returns list of checked (field, value), other cases should be checked separately
+        """
+        independent_fields = self.get_independent_fields(set(case[0] for case in cases), additional)
+        pending = [case for case in cases if case[0] in independent_fields]
+        checked = []
+        while len(set(case[0] for case in pending)) > 1:
+            combined_cases = []
+            for case in pending:
+                if case[0] not in [el[0] for el in combined_cases]:
+                    combined_cases.append(case)
+            pending = [case for case in pending if case not in combined_cases]
+            sp = transaction.savepoint()
+            try:
+                if additional == 'add':
+                    self.prepare_for_add()
+                    params = self.deepcopy(self.default_params_add)
+                    url = self.get_url(self.url_add)
+                else:
+                    obj_for_edit = self.get_obj_for_edit()
+                    params = self.deepcopy(self.default_params_edit)
+                    url = self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,))
+                self.update_params(params)
+                self.update_captcha_params(url, params)
+                error_message = {}
+                for field, value, message_type, message_locals in combined_cases:
+                    self.fill_with_related(params, field, value)
+                    _locals = dict(message_locals, field=field)
+                    for error_field, messages in viewitems(self.get_error_message(message_type, field, locals=_locals)):
+                        if error_field in error_message:
+                            raise AssertionError('Error messages for different fields in %s' % error_field)
+                        error_message[error_field] = messages
+                if additional == 'add':
+                    initial_obj_count = self.get_obj_manager.count()
+                    response = self.send_add_request(params)
+                    self.check_on_add_error(response, initial_obj_count, locals())
+                else:
+                    obj_for_edit = self.get_obj_manager.get(pk=obj_for_edit.pk)
+                    response = self.send_edit_request(obj_for_edit.pk, params)
+                    self.check_on_edit_error(response, obj_for_edit, locals())
+                self.assert_errors(response, error_message)
+                checked.extend([(case[0], case[1]) for case in combined_cases])
+            except Exception:
+                self.savepoint_rollback(sp)
+            finally:
+                mail.outbox = []
+        return checked
+
+    def check_concurrent_negative_cases(self, cases, additional):
+        """
+        Send requests for cases concurrently with AsyncClient, by concurrent_negative_batch_size requests.
+        cases is list of (field, value, message_type, message_locals).
+        Sync views are called one by one in test thread (they need test database transaction), so only async views
+        are really processed concurrently.
+        If any database write is made during requests, batch is rolled back and remaining cases should be checked
+        serially. Returns list of checked (field, value)
+        """
+        if send_concurrent_post_requests is None or self.with_captcha:
+            return []
+        checked = []
+        manager = self.get_obj_manager
+        for i in xrange(0, len(cases), self.concurrent_negative_batch_size):
+            batch = cases[i : i + self.concurrent_negative_batch_size]
+            sp = transaction.savepoint()
+            obj_for_edit = None
+            try:
+                if additional == 'add':
+                    self.prepare_for_add()
+                    url = self.get_url(self.url_add)
+                else:
+                    obj_for_edit = self.get_obj_for_edit()
+                    url = self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,))
+                params_list = []
+                for field, value, _, _ in batch:
+                    params = self.get_default_params(additional)
+                    getattr(self, 'clean_depend_fields_' + additional)(params, field)
+                    self.fill_with_related(params, field, value)
+                    params_list.append(params)
+                initial_obj_count = manager.count()
+                with CaptureQueriesContext(connections[manager.db]) as queries:
+                    responses = send_concurrent_post_requests(
+                        self.client.cookies, url, params_list, **self.additional_params
+                    )
+                if any(
+                    re.match(r'\s*(INSERT|UPDATE|DELETE)\b', query['sql'], re.I) for query in queries.captured_queries
+                ):
+                    self.savepoint_rollback(sp)
+                    return checked
+            except Exception:
+                self.savepoint_rollback(sp)
+                return checked
+            finally:
+                mail.outbox = []
+            for (field, value, message_type, message_locals), params, response in zip(batch, params_list, responses):
+                try:
+                    if additional == 'add':
+                        self.check_on_add_error(response, initial_obj_count, locals())
+                    else:
+                        self.check_on_edit_error(response, obj_for_edit, locals())
+                    _locals = dict(message_locals, field=field)
+                    self.assert_errors(response, self.get_error_message(message_type, field, locals=_locals))
+                    checked.append((field, value))
+                except Exception:
+                    pass
+        return checked
+
+    def check_batched_negative_cases(self, cases, additional):
+        """
+        Check cases in combine_negative_checks and concurrent_negative_checks modes.
+        Returns list of checked (field, value), other cases should be checked separately
+        """
+        cases = list(self.get_subcases(cases))
+        checked = []
+        if self.combine_negative_checks:
+            checked = self.check_combined_negative_cases(cases, additional)
+        if self.concurrent_negative_checks:
+            checked.extend(
+                self.check_concurrent_negative_cases(
+                    [case for case in cases if (case[0], case[1]) not in checked], additional
+                )
+            )
+        return checked
+
     def get_all_not_str_fields(self, additional=''):
         other_fields = []
         additional = '_' + additional if additional else ''
@@ -2627,29 +3524,204 @@ class FormCommonMixIn(object):
 
     def get_digital_values_range(self, field):
         """use name with -0-"""
-        field = re.sub(r'\-\d+\-', '-0-', field) if isinstance(field, basestring) else field
-        class_name = self.get_field_by_name(self.obj, field).__class__.__name__
+        field = normalize_field_name(field)
+        field_class = self.get_field_by_name(self.obj, field)
+        max_values, min_values = get_model_meta(field_class.model).values_ranges.get(field_class.name, ((), ()))
         max_value_from_params = getattr(self, 'max_fields_length', {}).get(field, None)
-        max_values = [max_value_from_params] if max_value_from_params is not None else []
+        if max_value_from_params is not None:
+            max_values += (max_value_from_params,)
         min_value_from_params = getattr(self, 'min_fields_length', {}).get(field, None)
-        min_values = [min_value_from_params] if min_value_from_params is not None else []
-        if 'SmallInteger' in class_name:
-            max_values.append(32767)
-            if 'Positive' in class_name:
-                min_values.append(0)
-            else:
-                min_values.append(-32767 - 1)
-        elif 'Integer' in class_name:
-            max_values.extend([2147483647, sys.maxsize])
-            if 'Positive' in class_name:
-                min_values.append(0)
-            else:
-                min_values.extend([-2147483647 - 1, -sys.maxsize - 1])
-        elif 'Float' in class_name or 'Decimal' in class_name:
-            max_values.append(sys.float_info.max)
-            min_values.append(-sys.float_info.max)
+        if min_value_from_params is not None:
+            min_values += (min_value_from_params,)
         return {'max_values': set(max_values), 'min_values': set(min_values)}
 
+    def get_fuzzing_cases(self, additional):
+        """
+        Generators for fuzzing: [(field, description, generator, is_valid_value), ...]
+        """
+        all_fields = getattr(self, 'all_fields_%s' % additional)
+        digital_fields = getattr(self, 'digital_fields_%s' % additional) or ()
+        int_fields = getattr(self, 'int_fields_%s' % additional) or ()
+        not_str_fields = self.get_all_not_str_fields(additional)
+        skip_fields = set(
+            tuple(getattr(self, 'disabled_fields_%s' % additional) or ())
+            + tuple(getattr(self, 'hidden_fields_%s' % additional) or ())
+            + ('captcha', 'captcha_0', 'captcha_1')
+        )
+        required_fields = getattr(self, 'required_fields_%s' % additional) or ()
+        cases = []
+        for field in all_fields:
+            if 'FORMS' in field or field in skip_fields or self.is_date_field(field):
+                continue
+            min_length = self.min_fields_length.get(field, None)
+            max_length = self.max_fields_length.get(field, None)
+            if field in required_fields:
+                cases.append((field, 'empty value', lambda: '', False))
+            if self.is_file_field(field):
+                cases.append((field, 'random file', lambda field=field: self.get_value_for_field(None, field), True))
+            elif self.is_email_field(field):
+                cases.extend(
+                    [
+                        (
+                            field,
+                            'random email',
+                            lambda lo=min_length or 6, hi=max_length or 254: get_random_email_value(randint(lo, hi)),
+                            True,
+                        ),
+                        (field, 'wrong email', lambda: choice(WRONG_EMAIL_VALUES), False),
+                    ]
+                )
+            elif self.is_choice_field(field) or self.is_multiselect_field(field):
+                if self.choice_fields_values.get(field, None):
+                    cases.append(
+                        (field, 'random choice', lambda field=field: self.get_value_for_field(None, field), True)
+                    )
+                cases.append((field, 'wrong choice', lambda: get_randname(10, 'w'), False))
+            elif field in digital_fields:
+                values_range = self.get_digital_values_range(field)
+                min_value = max(values_range['min_values'])
+                max_value = min(values_range['max_values'])
+                if field in int_fields:
+                    cases.extend(
+                        [
+                            (field, 'random value', lambda lo=min_value, hi=max_value: randint(lo, hi), True),
+                            (field, 'min value', lambda v=min_value: v, True),
+                            (field, 'max value', lambda v=max_value: v, True),
+                            (field, 'value < min', lambda v=min_value - 1: v, False),
+                            (field, 'value > max', lambda v=max_value + 1: v, False),
+                        ]
+                    )
+                else:
+                    cases.append((field, 'random value', lambda lo=min_value, hi=max_value: uniform(lo, hi), True))
+                cases.append((field, 'wrong value', lambda: choice(WRONG_DIGITAL_VALUES), False))
+            elif field not in not_str_fields:
+                min_length = min_length or 1
+                cases.extend(
+                    [
+                        (
+                            field,
+                            'random value',
+                            lambda lo=min_length, hi=max_length or 1000: get_randname(randint(lo, hi)),
+                            True,
+                        ),
+                        (field, 'min length', lambda v=min_length: get_randname(v), True),
+                    ]
+                )
+                if max_length:
+                    cases.extend(
+                        [
+                            (field, 'max length', lambda v=max_length: get_randname(v), True),
+                            (field, 'length > max', lambda v=max_length + 1: get_randname(v), False),
+                        ]
+                    )
+                if min_length > 1:
+                    cases.append((field, 'length < min', lambda v=min_length - 1: get_randname(v), False))
+        return cases
+
+    def run_fuzzing(self, additional):
+        """
+        Sends generated values during fuzzing_time_budget seconds, but not more than fuzzing_max_requests requests.
+        Every request is rolled back. Values are generated with own random.Random instance with fuzzing_seed
+        (random if None), seed is shown in errors
+        """
+        cases = self.get_fuzzing_cases(additional)
+        if not cases:
+            self.skipTest('No fields for fuzzing')
+        seed = self.fuzzing_seed if self.fuzzing_seed is not None else randint(0, 2**32 - 1)
+        failures, requests_count = self._run_fuzzing_batches(cases, additional, Random(seed))
+        for (field, description, result), data in viewitems(failures):
+            value = force_text(data['value'])
+            text = 'Fuzzing (seed %d): %s for field "%s" with %s (%d of %d requests)\n(value "%s")' % (
+                seed,
+                result,
+                field,
+                description,
+                data['count'],
+                requests_count,
+                value if len(value) <= 1000 else value[:1000] + '...',
+            )
+            if data['details']:
+                text += '\n%s' % force_text(data['details'])
+            self.errors_append(text=text)
+
+    def _get_fuzzing_value(self, random_instance, generator):
+        """
+        Call generator with state of random_instance as state of global random, so values don't depend on other
+        random calls during test
+        """
+        random_state = getstate()
+        setstate(random_instance.getstate())
+        try:
+            return generator()
+        finally:
+            random_instance.setstate(getstate())
+            setstate(random_state)
+
+    def _run_fuzzing_batches(self, cases, additional, random_instance):
+        """
+        Returns ({(field, description, result): {'count': count, 'value': first value, 'details': errors}},
+        requests count)
+        """
+        status_code_success = getattr(self, 'status_code_success_%s' % additional)
+        clean_depend_fields = getattr(self, 'clean_depend_fields_%s' % additional)
+        failures = {}
+        requests_count = 0
+        deadline = timeit.default_timer() + self.fuzzing_time_budget
+        max_requests = self.fuzzing_max_requests
+        while timeit.default_timer() < deadline and (max_requests is None or requests_count < max_requests):
+            sp = transaction.savepoint()
+            obj_for_edit = None
+            if additional == 'add':
+                self.prepare_for_add()
+                url = self.get_url(self.url_add)
+            else:
+                obj_for_edit = self.get_obj_for_edit()
+                url = self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,))
+            base_params = self.deepcopy(getattr(self, 'default_params_%s' % additional))
+            self.update_params(base_params)
+            batch = [
+                (case, self._get_fuzzing_value(random_instance, case[2]))
+                for case in [random_instance.choice(cases) for _ in xrange(self.fuzzing_batch_size)]
+            ]
+            for (field, description, _, is_valid), value in batch:
+                if timeit.default_timer() >= deadline or (max_requests is not None and requests_count >= max_requests):
+                    break
+                params = copy(base_params)
+                clean_depend_fields(params, field)
+                self.fill_with_related(params, field, value)
+                for v in viewvalues(params):
+                    if hasattr(v, 'seek'):
+                        v.seek(0)
+                if self.with_captcha:
+                    self.update_captcha_params(url, params)
+                request_sp = transaction.savepoint()
+                result = None
+                try:
+                    if additional == 'add':
+                        response = self.send_add_request(params)
+                    else:
+                        response = self.send_edit_request(obj_for_edit.pk, params)
+                    form_errors = self.get_all_form_errors(response)
+                    if is_valid and (response.status_code != status_code_success or form_errors):
+                        result = 'unexpected errors'
+                    elif not is_valid and (response.status_code != self.status_code_error or not form_errors):
+                        result = 'unexpected success'
+                except Exception:
+                    result = 'exception'
+                    form_errors = get_error()
+                finally:
+                    self.savepoint_rollback(request_sp)
+                requests_count += 1
+                if result is None:
+                    continue
+                key = (field, description, result)
+                if key in failures:
+                    failures[key]['count'] += 1
+                else:
+                    failures[key] = {'count': 1, 'value': value, 'details': form_errors}
+            self.savepoint_rollback(sp)
+        return failures, requests_count
+
     def get_existing_obj(self):
         if '_get_obj_for_edit' in dir(self):
             return self._get_obj_for_edit()
@@ -2699,7 +3771,7 @@ class FormCommonMixIn(object):
                 while n < 3 and not value:
                     n += 1
                     value = self.get_value_for_field(None, field)
-                    mro_names = [b.__name__ for b in field_class.__class__.__mro__]
+                    mro_names = get_mro_names(field_class.__class__)
                     if 'DateField' in mro_names:
                         try:
                             value = datetime.strptime(
@@ -2721,7 +3793,7 @@ class FormCommonMixIn(object):
                 params = {}
                 for f_name in self.get_object_fields(value):
                     f = self.get_field_by_name(value, f_name)
-                    mro_names = set([m.__name__ for m in f.__class__.__mro__])
+                    mro_names = get_mro_names(f.__class__)
                     if 'AutoField' in mro_names:
                         continue
                     if (
@@ -2837,6 +3909,8 @@ class FormTestMixIn(FormCommonMixIn, GlobalTestMixIn, ListPositiveCases, ListNeg
 
 
 class AddCommonMixIn(object):
+    form_class_add = None
+
     def clean_depend_fields_add(self, params, field):
         for field_for_clean in self._depend_one_of_fields_add.get(field, ()):
             self.set_empty_value_for_field(params, field_for_clean)
@@ -2844,8 +3918,13 @@ class AddCommonMixIn(object):
     def prepare_for_add(self):
         pass
 
+    def get_form_kwargs_add(self):
+        return {}
+
     def send_add_request(self, params):
-        return self.client.post(self.get_url(self.url_add), params, follow=True, **self.additional_params)
+        if self.is_form_validation_subcase('add', params):
+            return self.get_form_validation_response(self.form_class_add, params, 'add', **self.get_form_kwargs_add())
+        return self.send_post_request(self.get_url(self.url_add), params)
 
 
 class FormAddTestMixIn(AddCommonMixIn, FormTestMixIn, AddPositiveCases, AddNegativeCases):
@@ -2853,6 +3932,7 @@ class FormAddTestMixIn(AddCommonMixIn, FormTestMixIn, AddPositiveCases, AddNegat
 
 
 class EditCommonMixIn(object):
+    form_class_edit = None
     second_save_available = True
     url_edit = ''
 
@@ -2898,10 +3978,15 @@ class EditCommonMixIn(object):
         else:
             return self.create_copy(other_obj, param_names)
 
+    def get_form_kwargs_edit(self, obj):
+        return {'instance': obj}
+
     def send_edit_request(self, obj_pk, params):
-        return self.client.post(
-            self.get_url_for_negative(self.url_edit, (obj_pk,)), params, follow=True, **self.additional_params
-        )
+        if self.is_form_validation_subcase('edit', params):
+            return self.get_form_validation_response(
+                self.form_class_edit, params, 'edit', **self.get_form_kwargs_edit(self.get_obj_manager.get(pk=obj_pk))
+            )
+        return self.send_post_request(self.get_url_for_negative(self.url_edit, (obj_pk,)), params)
 
     def update_params_for_obj(self, obj):
         pass
@@ -2975,13 +4060,75 @@ class UserPermissionsTestMixIn(GlobalTestMixIn, LoginMixIn):
     links_redirect = ()
     method = 'GET'
     password = ''
+    profile_views = False
+    profile_views_dir = None
     redirect_to = ''
     urlpatterns = None
     username = ''
 
+    @classmethod
+    def setUpClass(cls):
+        super(UserPermissionsTestMixIn, cls).setUpClass()
+        cls._views_profiles = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        try:
+            if cls.profile_views and cls._views_profiles:
+                cls.dump_views_profiles()
+        finally:
+            super(UserPermissionsTestMixIn, cls).tearDownClass()
+
+    @classmethod
+    def dump_views_profiles(cls):
+        """
+        Writes .prof file for every url name and ranked by total time table
+        """
+        profile_dir = cls.profile_views_dir or os.path.join(tempfile.gettempdir(), 'ttoolly_profile')
+        if not os.path.exists(profile_dir):
+            os.makedirs(profile_dir)
+        rows = sorted(viewitems(cls._views_profiles), key=lambda item: item[1]['time'], reverse=True)
+        lines = ['%-60s %8s %12s %12s' % ('url name', 'calls', 'total, s', 'mean, s')]
+        for url_name, data in rows:
+            data['stats'].dump_stats(os.path.join(profile_dir, '%s.prof' % re.sub(r'[^\w.-]', '_', url_name)))
+            lines.append(
+                '%-60s %8d %12.4f %12.4f' % (url_name, data['calls'], data['time'], data['time'] / data['calls'])
+            )
+        with open(os.path.join(profile_dir, '%s.txt' % cls.__name__), 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+
     @property
     def get_method(self):
-        return getattr(self.client, self.method.lower())
+        method = getattr(self.client, self.method.lower())
+        if not self.profile_views:
+            return method
+
+        def profiled_method(url, *args, **kwargs):
+            try:
+                url_name = resolve(urlparse(url).path).view_name
+            except Exception:
+                url_name = urlparse(url).path
+            profile = cProfile.Profile()
+            start = timeit.default_timer()
+            try:
+                profile.enable()
+            except ValueError:
+                # other profiler is already active
+                return method(url, *args, **kwargs)
+            try:
+                return method(url, *args, **kwargs)
+            finally:
+                profile.disable()
+                spent = timeit.default_timer() - start
+                data = self._views_profiles.get(url_name)
+                if data is None:
+                    self._views_profiles[url_name] = {'calls': 1, 'time': spent, 'stats': pstats.Stats(profile)}
+                else:
+                    data['calls'] += 1
+                    data['time'] += spent
+                    data['stats'].add(profile)
+
+        return profiled_method
 
     def get_urls(self):
         # FIXME:
@@ -3553,6 +4700,16 @@ class LoginTestMixIn(LoginCommonMixIn, LoginPositiveCases, LoginNegativeCases):
 base_db_initialized = False
 
 
+def get_autocommit_isolation_level():
+    """psycopg2 is imported only when CustomTestCase is used"""
+    try:
+        import psycopg2.extensions
+    except ImportError as e:
+        e.msg += '\nNeed to install psycopg2-binary or psycopg2'
+        raise
+    return psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT
+
+
 class CustomTestCase(GlobalTestMixIn, TransactionTestCase):
 
     multi_db = True
@@ -3580,7 +4737,7 @@ class CustomTestCase(GlobalTestMixIn, TransactionTestCase):
             if not conn.settings_dict.get('TEST', {}).get('MIRROR', False):
                 cursor = conn.cursor()
                 conn.connection.rollback()
-                conn.connection.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+                conn.connection.set_isolation_level(get_autocommit_isolation_level())
                 try:
                     cursor.execute('CREATE DATABASE "%s" WITH TEMPLATE="%s"' % (db_name + '_', db_name))
                 except Exception:
@@ -3604,7 +4761,7 @@ class CustomTestCase(GlobalTestMixIn, TransactionTestCase):
             db_name = conn.settings_dict['NAME']
             cursor = conn.cursor()
             conn.connection.rollback()
-            conn.connection.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            conn.connection.set_isolation_level(get_autocommit_isolation_level())
             is_old_postgres = cursor.connection.server_version < 90200  # < 9.2.0
             pid_name = 'procpid' if is_old_postgres else 'pid'
             disconnect_sql = '''SELECT pg_terminate_backend(pg_stat_activity.{0})
@@ -3809,7 +4966,7 @@ class CustomTestCaseNew(CustomTestCase):
             if not conn.settings_dict.get('TEST', {}).get('MIRROR', False):
                 cursor = conn.cursor()
                 conn.connection.rollback()
-                conn.connection.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+                conn.connection.set_isolation_level(get_autocommit_isolation_level())
                 try:
                     cursor.execute('CREATE DATABASE "%s" WITH TEMPLATE="%s"' % (db_name + '_', db_name))
                 except Exception:
@@ -1,10 +1,13 @@
 # -*- coding=utf-8 -*-
+import json
+import os
 import re
 import sys
 import unittest
 from datetime import datetime
 
 from django.conf import settings
+from django.core.management.base import CommandError
 from django.test.runner import DiscoverRunner
 
 from ttoolly.utils.utils import reorder_suite
@@ -72,22 +75,25 @@ def get_runner():
 ParentRunner = get_runner()
 
 
+def get_skip_text(test):
+    """
+    Reason why test will be skipped by unittest.skip or only_with* decorators, None if test will run
+    """
+    fn = getattr(test, test._testMethodName)
+    if getattr(fn, '__unittest_skip__', False):
+        return fn.__unittest_skip_why__
+    for decorator in reversed(getattr(fn, 'decorators', ())):
+        check = getattr(decorator, 'check', None)
+        if check and not check(test):
+            return decorator.skip_text
+    return None
+
+
 def filter_suite_by_decorators(suite, verbosity=1):
     new_suite = unittest.TestSuite()
     for el in suite:
-        need_skip = False
-        fn = getattr(el, el._testMethodName)
-        if getattr(fn, '__unittest_skip__', False):
-            need_skip = True
-            skip_text = fn.__unittest_skip_why__
-        else:
-            for decorator in reversed(getattr(fn, 'decorators', ())):
-                check = getattr(decorator, 'check', None)
-                if check:
-                    need_skip = not (check(el))
-                    if need_skip:
-                        skip_text = decorator.skip_text
-                        break
+        skip_text = get_skip_text(el)
+        need_skip = skip_text is not None
         if not need_skip:
             new_suite.addTest(el)
         elif verbosity > 1:
@@ -101,6 +107,193 @@ def filter_suite_by_decorators(suite, verbosity=1):
     return new_suite
 
 
+class JournalTestCase(object):
+    """
+    Result from journal of interrupted run
+    """
+
+    failureException = AssertionError
+
+    def __init__(self, test_id, name=''):
+        self.test_id = test_id
+        self.name = name or test_id
+
+    def __str__(self):
+        return self.name
+
+    def id(self):
+        return self.test_id
+
+    def shortDescription(self):
+        return None
+
+
+class JournalResultMixIn(object):
+    """
+    Appends outcome of every finished test to journal. Outcomes from journal_entries are added to report
+    """
+
+    journal_entries = ()
+    journal_path = None
+
+    def startTestRun(self):
+        super(JournalResultMixIn, self).startTestRun()
+        self._journal_outcomes = {}
+        self._journal_file = open(self.journal_path, 'a') if self.journal_path else None
+        for entry in self.journal_entries:
+            test = JournalTestCase(entry['id'], entry.get('name'))
+            details = entry.get('details', '')
+            self.testsRun += 1
+            if entry['outcome'] == 'failure':
+                self.failures.append((test, details))
+            elif entry['outcome'] == 'error':
+                self.errors.append((test, details))
+            elif entry['outcome'] == 'skip':
+                self.skipped.append((test, details))
+            elif entry['outcome'] == 'expected_failure':
+                self.expectedFailures.append((test, details))
+            elif entry['outcome'] == 'unexpected_success':
+                self.unexpectedSuccesses.append(test)
+
+    def _set_journal_outcome(self, test, outcome, details=''):
+        if outcome == 'success' and test.id() in self._journal_outcomes:
+            return
+        self._journal_outcomes[test.id()] = (outcome, details)
+
+    def addSuccess(self, test):
+        super(JournalResultMixIn, self).addSuccess(test)
+        self._set_journal_outcome(test, 'success')
+
+    def addFailure(self, test, err):
+        super(JournalResultMixIn, self).addFailure(test, err)
+        self._set_journal_outcome(test, 'failure', self.failures[-1][1])
+
+    def addError(self, test, err):
+        super(JournalResultMixIn, self).addError(test, err)
+        self._set_journal_outcome(test, 'error', self.errors[-1][1])
+
+    def addSkip(self, test, reason):
+        super(JournalResultMixIn, self).addSkip(test, reason)
+        self._set_journal_outcome(test, 'skip', reason)
+
+    def addExpectedFailure(self, test, err):
+        super(JournalResultMixIn, self).addExpectedFailure(test, err)
+        self._set_journal_outcome(test, 'expected_failure', self.expectedFailures[-1][1])
+
+    def addUnexpectedSuccess(self, test):
+        super(JournalResultMixIn, self).addUnexpectedSuccess(test)
+        self._set_journal_outcome(test, 'unexpected_success')
+
+    def addSubTest(self, test, subtest, err):
+        super(JournalResultMixIn, self).addSubTest(test, subtest, err)
+        if err is not None:
+            if issubclass(err[0], test.failureException):
+                self._set_journal_outcome(test, 'failure', self.failures[-1][1])
+            else:
+                self._set_journal_outcome(test, 'error', self.errors[-1][1])
+
+    def stopTest(self, test):
+        super(JournalResultMixIn, self).stopTest(test)
+        outcome, details = self._journal_outcomes.pop(test.id(), ('success', ''))
+        journal_file = getattr(self, '_journal_file', None)
+        if journal_file:
+            journal_file.write(
+                json.dumps({'id': test.id(), 'name': str(test), 'outcome': outcome, 'details': details}) + '\n'
+            )
+            # outcome should be saved if run is interrupted
+            journal_file.flush()
+
+    def stopTestRun(self):
+        super(JournalResultMixIn, self).stopTestRun()
+        if getattr(self, '_journal_file', None):
+            self._journal_file.close()
+            self._journal_file = None
+
+
+class SubcasesResultMixIn(object):
+    """
+    Sets failed subcases for rerun labels on tests, which were run in other process (with --parallel)
+    """
+
+    def _set_failed_subcases(self, test, err):
+        failed_subcases = getattr(err[1], 'failed_subcases', None)
+        if failed_subcases and not getattr(test, '_failed_subcases', None):
+            test._failed_subcases = failed_subcases
+
+    def addFailure(self, test, err):
+        self._set_failed_subcases(test, err)
+        super(SubcasesResultMixIn, self).addFailure(test, err)
+
+    def addError(self, test, err):
+        self._set_failed_subcases(test, err)
+        super(SubcasesResultMixIn, self).addError(test, err)
+
+
+def read_journal(path):
+    entries = []
+    if not path or not os.path.exists(path):
+        return entries
+    with open(path) as f:
+        for line in f:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                # last line of interrupted run can be broken
+                continue
+    return entries
+
+
+def exclude_tests_by_ids(suite, test_ids):
+    suite_class = type(suite)
+    filtered_suite = suite_class()
+    for test in suite:
+        if isinstance(test, suite_class):
+            filtered_suite.addTests(exclude_tests_by_ids(test, test_ids))
+        elif test.id() not in test_ids:
+            filtered_suite.addTest(test)
+    return filtered_suite
+
+
+def split_subcases_labels(test_labels):
+    """
+    "path.to.test[field1,field2]" -> "path.to.test", {"path.to.test": ["field1", "field2"]}
+    """
+    labels = []
+    labels_subcases = {}
+    for label in test_labels:
+        subcases = re.findall(r'^(.+?)\[(.+)\]$', label)
+        if subcases:
+            label, fields = subcases[0]
+            labels_subcases.setdefault(label, []).extend(fields.split(','))
+        labels.append(label)
+    return labels, labels_subcases
+
+
+def set_selected_subcases(suite, labels_subcases, subcases):
+    if not labels_subcases and not subcases:
+        return
+    for test in suite:
+        selected = {k: set(v) for k, v in subcases.items()}
+        for label, fields in labels_subcases.items():
+            if test.id() == label or test.id().startswith(label + '.'):
+                selected.setdefault('field', set()).update(fields)
+        if selected:
+            test.selected_subcases = selected
+
+
+def get_rerun_label(test):
+    if isinstance(test, JournalTestCase):
+        return test.id()
+    label = '.'.join([test.__class__.__module__, test.__class__.__name__, test._testMethodName])
+    failed_subcases = []
+    for subcase in getattr(test, '_failed_subcases', None) or []:
+        if subcase is not None and subcase not in failed_subcases:
+            failed_subcases.append(subcase)
+    if failed_subcases:
+        label = "'%s[%s]'" % (label, ','.join(failed_subcases))
+    return label
+
+
 class RegexpTestSuiteRunner(ParentRunner):
 
     parallel = 1
@@ -121,6 +314,17 @@ class RegexpTestSuiteRunner(ParentRunner):
             self.tags = []
             self.exclude_tags = []
         self.parallelism = [int(el) for el in kwargs['parallelism'].split('/')] if kwargs['parallelism'] else None
+        self.journal = kwargs.get('journal', None)
+        if self.journal is None:
+            self.journal = getattr(settings, 'TEST_JOURNAL', None)
+        self.resume = kwargs.get('resume', False)
+        self.subcases = {}
+        for subcase in kwargs.get('subcases') or []:
+            key, _, value = subcase.partition('=')
+            if not key or not value:
+                raise CommandError('Subcase should be set as key=value1,value2, got "%s"' % subcase)
+            self.subcases.setdefault(key, set()).update(value.split(','))
+        self.journal_entries = []
         self.test_runner = self.get_test_runner()
 
     @classmethod
@@ -138,6 +342,28 @@ class RegexpTestSuiteRunner(ParentRunner):
             default=None,
             help='Part of tests (if parallel by ci). For example 2/5 - second part of five. Will be ignored if parallel > 1',
         )
+        parser.add_argument(
+            '--journal',
+            dest='journal',
+            default=None,
+            help='Path to journal of finished tests. Default: settings.TEST_JOURNAL, journal is not written if not set',
+        )
+        parser.add_argument(
+            '--subcase',
+            action='append',
+            dest='subcases',
+            default=None,
+            help='Run only selected subcases. Example: --subcase field=email_field. '
+            'Subcases for one test can be set in label: "path.to.TestCase.test_name[field1,field2]"',
+        )
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            dest='resume',
+            default=False,
+            help='Skip tests finished in interrupted run (from journal, set by --journal or settings.TEST_JOURNAL) '
+            'and add their results to report',
+        )
 
     def convert_by_parallel(self, suite):
         if self.parallel > 1 or not self.parallelism or self.parallelism[1] == 1:
@@ -156,12 +382,27 @@ class RegexpTestSuiteRunner(ParentRunner):
 
     def get_resultclass(self):
         if WITH_HTML_REPORT:
-            return CustomHtmlTestResult
-        return super(RegexpTestSuiteRunner, self).get_resultclass()
+            resultclass = CustomHtmlTestResult
+        else:
+            resultclass = super(RegexpTestSuiteRunner, self).get_resultclass()
+        mixins = ()
+        if self.parallel > 1:
+            mixins += (SubcasesResultMixIn,)
+        if self.journal:
+            mixins += (JournalResultMixIn,)
+        if not mixins:
+            return resultclass
+        resultclass = resultclass or unittest.TextTestResult
+        return type(
+            str(''.join(m.__name__[: -len('ResultMixIn')] for m in mixins) + resultclass.__name__),
+            mixins + (resultclass,),
+            {'journal_path': self.journal, 'journal_entries': self.journal_entries},
+        )
 
     def build_suite(self, test_labels, extra_tests=None, **kwargs):
         real_parallel = self.parallel
         self.parallel = 1
+        test_labels, labels_subcases = split_subcases_labels(test_labels or [])
 
         labels_for_suite = []
         for label in test_labels:
@@ -213,6 +454,15 @@ class RegexpTestSuiteRunner(ParentRunner):
             my_suite = filter_suite_by_decorators(my_suite, self.verbosity)
 
         suite = reorder_suite(my_suite, (unittest.TestCase,))
+        set_selected_subcases(suite, labels_subcases, self.subcases)
+
+        if self.journal and self.resume:
+            finished = {entry['id']: entry for entry in read_journal(self.journal)}
+            if finished:
+                self.journal_entries[:] = [finished[test.id()] for test in suite if test.id() in finished]
+                suite = exclude_tests_by_ids(suite, finished)
+        elif self.journal and os.path.exists(self.journal):
+            os.remove(self.journal)
 
         self.parallel = real_parallel
         if self.parallel > 1:
@@ -248,9 +498,9 @@ class RegexpTestSuiteRunner(ParentRunner):
                 'python manage.py test %s'
                 % ' '.join(
                     [
-                        '.'.join([test.__class__.__module__, test.__class__.__name__, test._testMethodName])
+                        get_rerun_label(test)
                         for test, _ in result.errors + result.failures
-                        if hasattr(test, '_testMethodName')
+                        if hasattr(test, '_testMethodName') or isinstance(test, JournalTestCase)
                     ]
                 )
                 + '\n\n'
@@ -20,12 +20,30 @@ except ImportError:
 
 from builtins import str
 
-from freezegun import freeze_time
 from future.utils import viewitems, viewkeys
 from past.builtins import basestring
 
-from .utils import convert_size_to_bytes, format_errors, get_field_from_response, get_randname, get_random_email_value
-from .utils.decorators import only_with, only_with_any_files_params, only_with_files_params, only_with_obj
+from .utils import (
+    convert_size_to_bytes,
+    format_errors,
+    get_field_from_response,
+    get_randname,
+    get_random_email_value,
+    normalize_field_name,
+)
+from .utils.decorators import (
+    form_validation_subcases,
+    only_with,
+    only_with_any_files_params,
+    only_with_files_params,
+    only_with_obj,
+)
+
+
+# default values for custom_wrong_values
+WRONG_CHOICE_VALUES = ('qwe', '12345678', 'йцу')
+WRONG_DIGITAL_VALUES = ('q', 'й', 'NaN', 'inf', '-inf', '²')
+WRONG_EMAIL_VALUES = ('q', 'й', 'qwe@rty', 'qw@йц', '@qwe', 'qwe@')
 
 
 class ListPositiveCases(object):
@@ -35,7 +53,7 @@ class ListPositiveCases(object):
         """
         View list with filter positive
         """
-        for field, value in viewitems(self.filter_params):
+        for field, value in self.get_subcases(viewitems(self.filter_params)):
             value = value if value else ''
             try:
                 response = self.client.get(
@@ -53,7 +71,7 @@ class ListNegativeCases(object):
         """
         View list with filter negative
         """
-        for field in viewkeys(self.filter_params):
+        for field in self.get_subcases(viewkeys(self.filter_params)):
             self.check_and_create_objects_for_filter(field)
             for value in ('qwe', '1', '0', 'йцу', '²'):
                 try:
@@ -94,7 +112,7 @@ class AddPositiveCases(object):
                 self.errors_append(text='For hidden fields')
 
         fields_helptext = getattr(self, 'fields_helptext_add', {})
-        for field_name, text in viewitems(fields_helptext):
+        for field_name, text in self.get_subcases(viewitems(fields_helptext)):
             if field_name not in self.all_fields_add:
                 continue
             try:
@@ -109,8 +127,7 @@ class AddPositiveCases(object):
         Create object: fill all fields
         """
         self.prepare_for_add()
-        params = self.deepcopy(self.default_params_add)
-        self.update_params(params)
+        params = self.get_default_params('add')
         self.update_captcha_params(self.get_url(self.url_add), params)
         prepared_depends_fields = (
             self.prepare_depend_from_one_of(self.one_of_fields_add) if self.one_of_fields_add else {}
@@ -155,10 +172,9 @@ class AddPositiveCases(object):
         Create object: fill all fields. Check with any filled field from one_of_fields groups
         """
         for group in self.one_of_fields_add:
-            for field in group:
+            for field in self.get_subcases(group):
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 self.update_captcha_params(self.get_url(self.url_add), params)
                 only_independent_fields = set(self.all_fields_add).difference(viewkeys(self._depend_one_of_fields_add))
 
@@ -216,10 +232,9 @@ class AddPositiveCases(object):
 
         """если хотя бы одно поле из группы заполнено, объект создается"""
         for group in self.not_empty_related_fields_add:
-            for field in group:
+            for field in self.get_subcases(group):
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 for f in group:
                     self.set_empty_value_for_field(params, f)
                 """if unique fields"""
@@ -247,9 +262,8 @@ class AddPositiveCases(object):
         Create object: send only required fields
         """
         self.prepare_for_add()
-        params = self.deepcopy(self.default_params_add)
+        params = self.get_default_params('add')
         required_fields = self.required_fields_add + self._get_required_from_related(self.required_related_fields_add)
-        self.update_params(params)
         for field in set(viewkeys(params)).difference(required_fields):
             self.pop_field_from_params(params, field)
         self.fill_all_fields(required_fields, params)
@@ -268,12 +282,11 @@ class AddPositiveCases(object):
 
         """если хотя бы одно поле из группы заполнено, объект создается"""
         for group in self.required_related_fields_add:
-            for field in group:
+            for field in self.get_subcases(group):
                 """if unique fields"""
                 mail.outbox = []
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 for f in group:
                     self.pop_field_from_params(params, f)
                 self.update_captcha_params(self.get_url(self.url_add), params)
@@ -301,9 +314,9 @@ class AddPositiveCases(object):
         other_fields = self.get_all_not_str_fields('add')
 
         fields_for_check = {
-            k: self.max_fields_length.get(re.sub(r'\-\d+\-', '-0-', k), 100000)
+            k: self.max_fields_length.get(normalize_field_name(k), 100000)
             for k in self.all_fields_add
-            if re.sub(r'\-\d+\-', '-0-', k) not in other_fields
+            if normalize_field_name(k) not in other_fields
         }
         if not fields_for_check:
             self.skipTest('No any string fields')
@@ -323,8 +336,7 @@ class AddPositiveCases(object):
         sp = transaction.savepoint()
         try:
             self.prepare_for_add()
-            params = self.deepcopy(self.default_params_add)
-            self.update_params(params)
+            params = self.get_default_params('add')
             self.update_captcha_params(self.get_url(self.url_add), params)
             params.update(only_if_values)
             params.update(max_length_params)
@@ -359,7 +371,7 @@ class AddPositiveCases(object):
         ИЛИ если среди проверяемых есть поля, зависящие от значений в других полях, и они требуют отдельной проверки
         """
         if (
-            not self.errors
+            not self.has_errors()
             and not set(viewkeys(fields_for_check)).intersection(viewkeys(self._depend_one_of_fields_add))
             and not need_one_by_one_check
         ):
@@ -367,48 +379,40 @@ class AddPositiveCases(object):
         if len(fields_for_check) == 1:
             self.formatted_assert_errors()
 
-        for k in set(viewkeys(max_length_params)).intersection((k for el in viewkeys(self.all_unique) for k in el)):
-            max_length_params[k] = self.get_value_for_field(fields_for_check[k], k)
+        values = {}
 
-        for field, length in viewitems(fields_for_check):
-            sp = transaction.savepoint()
-            """if unique fields"""
-            mail.outbox = []
-            try:
-                self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
-                self.update_captcha_params(self.get_url(self.url_add), params)
-                self.clean_depend_fields_add(params, field)
-                self.fill_with_related(params, field, self.get_value_for_field(length, field))
+        def check(group):
+            self.prepare_for_add()
+            params = self.get_default_params('add')
+            self.update_captcha_params(self.get_url(self.url_add), params)
+            for field in group:
+                self.fill_with_related(params, field, self.get_value_for_field(fields_for_check[field], field))
                 if self.is_file_field(field):
                     if self.is_file_list(field):
                         for f in params[field]:
                             f.seek(0)
                     else:
                         params[field].seek(0)
-                value = self.get_value_for_error_message(field, params[field])
-                initial_obj_count = self.get_obj_manager.count()
-                old_pks = list(self.get_obj_manager.values_list('pk', flat=True))
-                response = self.send_add_request(params)
-                self.check_on_add_success(response, initial_obj_count, locals())
-                new_object = self.get_obj_manager.exclude(pk__in=old_pks)[0]
-                exclude = set(getattr(self, 'exclude_from_check_add', [])).difference(
-                    [
-                        field,
-                    ]
-                )
-                self.assert_object_fields(new_object, params, exclude=exclude)
-            except Exception:
-                self.savepoint_rollback(sp)
-                self.errors_append(
-                    text='For field "%s" with length %d\n(value "%s")'
-                    % (
-                        field,
-                        length,
-                        value if len(str(value)) <= 1000 else str(value)[:1000] + '...',
-                    )
-                )
+                values[field] = self.get_value_for_error_message(field, params[field])
+            initial_obj_count = self.get_obj_manager.count()
+            old_pks = list(self.get_obj_manager.values_list('pk', flat=True))
+            response = self.send_add_request(params)
+            self.check_on_add_success(response, initial_obj_count, locals())
+            new_object = self.get_obj_manager.exclude(pk__in=old_pks)[0]
+            exclude = set(getattr(self, 'exclude_from_check_add', [])).difference(group)
+            self.assert_object_fields(new_object, params, exclude=exclude)
+
+        def error_text(field):
+            value = values.get(field, '')
+            return 'For field "%s" with length %d\n(value "%s")' % (
+                field,
+                fields_for_check[field],
+                value if len(str(value)) <= 1000 else str(value)[:1000] + '...',
+            )
+
+        groups = self.get_compatible_fields_groups(list(fields_for_check), 'add')
+        for group in groups:
+            self.check_fields_by_bisection(group, check, error_text, failed=self.has_errors() and len(groups) == 1)
 
     @only_with_obj
     def test_add_object_different_unique_values_positive(self):
@@ -442,11 +446,10 @@ class AddPositiveCases(object):
                 checks_list.append(list(set(fields_for_change)))
 
         checks_list = checks_list or ((),)
-        for fields_for_change in checks_list:
+        for fields_for_change in self.get_subcases(checks_list):
             self.prepare_for_add()
             existing_obj = self.get_existing_obj()
-            params = self.deepcopy(self.default_params_add)
-            self.update_params(params)
+            params = self.get_default_params('add')
             self.update_captcha_params(self.get_url(self.url_add), params)
 
             for field in fields_for_change:
@@ -554,8 +557,7 @@ class AddPositiveCases(object):
                 mail.outbox = []
                 self.prepare_for_add()
                 existing_obj = self.get_existing_obj_with_filled(el)
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 self.update_captcha_params(self.get_url(self.url_add), params)
                 for el_field in el:
                     if el_field not in self.all_fields_add:
@@ -639,8 +641,7 @@ class AddPositiveCases(object):
         sp = transaction.savepoint()
         try:
             self.prepare_for_add()
-            params = self.deepcopy(self.default_params_add)
-            self.update_params(params)
+            params = self.get_default_params('add')
             self.update_captcha_params(self.get_url(self.url_add), params)
             params.update(only_if_values)
             self.fill_required_if(params)
@@ -663,7 +664,7 @@ class AddPositiveCases(object):
         ИЛИ если среди проверяемых есть поля, зависящие от значений в других полях, и они требуют отдельной проверки
         """
         if (
-            not self.errors
+            not self.has_errors()
             and not set(fields_for_check).intersection(viewkeys(self._depend_one_of_fields_add))
             and not need_one_by_one_check
         ):
@@ -671,14 +672,13 @@ class AddPositiveCases(object):
         if len(fields_for_check) == 1:
             self.formatted_assert_errors()
 
-        for field in fields_for_check:
+        for field in self.get_subcases(fields_for_check):
             value = max_value_params[field]
             """if unique fields"""
             mail.outbox = []
             try:
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 self.update_captcha_params(self.get_url(self.url_add), params)
                 self.clean_depend_fields_add(params, field)
                 self.fill_with_related(params, field, max_value_params[field])
@@ -727,8 +727,7 @@ class AddPositiveCases(object):
         sp = transaction.savepoint()
         try:
             self.prepare_for_add()
-            params = self.deepcopy(self.default_params_add)
-            self.update_params(params)
+            params = self.get_default_params('add')
             self.update_captcha_params(self.get_url(self.url_add), params)
             params.update(only_if_values)
             self.fill_required_if(params)
@@ -752,7 +751,7 @@ class AddPositiveCases(object):
         ИЛИ если среди проверяемых есть поля, зависящие от значений в других полях, и они требуют отдельной проверки
         """
         if (
-            not self.errors
+            not self.has_errors()
             and not set(fields_for_check).intersection(viewkeys(self._depend_one_of_fields_add))
             and not need_one_by_one_check
         ):
@@ -760,15 +759,14 @@ class AddPositiveCases(object):
         if len(fields_for_check) == 1:
             self.formatted_assert_errors()
 
-        for field in fields_for_check:
+        for field in self.get_subcases(fields_for_check):
             value = min_value_params[field]
             sp = transaction.savepoint()
             """if unique fields"""
             mail.outbox = []
             try:
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 self.update_captcha_params(self.get_url(self.url_add), params)
                 self.clean_depend_fields_add(params, field)
                 self.fill_with_related(params, field, value)
@@ -794,8 +792,7 @@ class AddPositiveCases(object):
         Test max number of lines in inline block
         """
         self.prepare_for_add()
-        params = self.deepcopy(self.default_params_add)
-        self.update_params(params)
+        params = self.get_default_params('add')
         self.update_captcha_params(self.get_url(self.url_add), params)
         for name, max_count in viewitems(self.max_blocks):
             self.fill_all_block_fields(
@@ -823,15 +820,14 @@ class AddPositiveCases(object):
             mail.outbox = []
 
         """Дальнейшие отдельные проверки только если не прошла совместная и полей много"""
-        if not self.errors:
+        if not self.has_errors():
             return
         if len(self.max_blocks.keys()) == 1:
             self.formatted_assert_errors()
 
         for name, max_count in viewitems(self.max_blocks):
             self.prepare_for_add()
-            params = self.deepcopy(self.default_params_add)
-            self.update_params(params)
+            params = self.get_default_params('add')
             self.update_captcha_params(self.get_url(self.url_add), params)
             self.fill_all_block_fields(
                 name,
@@ -885,8 +881,7 @@ class AddPositiveCases(object):
         sp = transaction.savepoint()
         try:
             self.prepare_for_add()
-            params = self.deepcopy(self.default_params_add)
-            self.update_params(params)
+            params = self.get_default_params('add')
             self.update_captcha_params(self.get_url(self.url_add), params)
             params.update(only_if_values)
             self.fill_required_if(params)
@@ -909,7 +904,7 @@ class AddPositiveCases(object):
         ИЛИ если среди проверяемых есть поля, зависящие от значений в других полях, и они требуют отдельной проверки
         """
         if (
-            not self.errors
+            not self.has_errors()
             and not set(fields_for_check).intersection(viewkeys(self._depend_one_of_fields_add))
             and not need_one_by_one_check
         ):
@@ -917,13 +912,12 @@ class AddPositiveCases(object):
         if len(fields_for_check) == 1:
             self.formatted_assert_errors()
 
-        for field in fields_for_check:
+        for field in self.get_subcases(fields_for_check):
             sp = transaction.savepoint()
             mail.outbox = []
             try:
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 self.update_captcha_params(self.get_url(self.url_add), params)
                 self.clean_depend_fields_add(params, field)
                 self.fill_with_related(params, field, max_count_params[field])
@@ -971,8 +965,7 @@ class AddPositiveCases(object):
         sp = transaction.savepoint()
         try:
             self.prepare_for_add()
-            params = self.deepcopy(self.default_params_add)
-            self.update_params(params)
+            params = self.get_default_params('add')
             self.update_captcha_params(self.get_url(self.url_add), params)
             params.update(only_if_values)
             self.fill_required_if(params)
@@ -1008,7 +1001,7 @@ class AddPositiveCases(object):
         ИЛИ если среди проверяемых есть поля, зависящие от значений в других полях, и они требуют отдельной проверки
         """
         if (
-            not self.errors
+            not self.has_errors()
             and not set(fields_for_check).intersection(viewkeys(self._depend_one_of_fields_add))
             and not need_one_by_one_check
         ):
@@ -1016,40 +1009,35 @@ class AddPositiveCases(object):
         if len(fields_for_check) == 1:
             self.formatted_assert_errors()
 
-        for field, field_dict in viewitems(self.file_fields_params_add):
-            sp = transaction.savepoint()
-            mail.outbox = []
-            one_max_size = field_dict.get('one_max_size', '10M')
-            size = convert_size_to_bytes(one_max_size)
-            max_size = self.humanize_file_size(size)
-            try:
-                self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
-                self.update_captcha_params(self.get_url(self.url_add), params)
-                self.clean_depend_fields_add(params, field)
+        def check(group):
+            self.prepare_for_add()
+            params = self.get_default_params('add')
+            self.update_captcha_params(self.get_url(self.url_add), params)
+            for field in group:
                 self.fill_with_related(params, field, max_size_params[field])
                 if self.is_file_list(field):
                     for f in params[field]:
                         f.seek(0)
                 else:
                     params[field].seek(0)
-                initial_obj_count = self.get_obj_manager.count()
-                old_pks = list(self.get_obj_manager.values_list('pk', flat=True))
-                response = self.send_add_request(params)
-                self.check_on_add_success(response, initial_obj_count, locals())
-                new_object = self.get_obj_manager.exclude(pk__in=old_pks)[0]
-                exclude = set(getattr(self, 'exclude_from_check_add', [])).difference(
-                    [
-                        field,
-                    ]
-                )
-                self.assert_object_fields(new_object, params, exclude=exclude)
-            except Exception:
-                self.savepoint_rollback(sp)
-                self.errors_append(text='For file size %s (%s) in field %s' % (max_size, size, field))
-            finally:
-                self.del_files()
+            initial_obj_count = self.get_obj_manager.count()
+            old_pks = list(self.get_obj_manager.values_list('pk', flat=True))
+            response = self.send_add_request(params)
+            self.check_on_add_success(response, initial_obj_count, locals())
+            new_object = self.get_obj_manager.exclude(pk__in=old_pks)[0]
+            exclude = set(getattr(self, 'exclude_from_check_add', [])).difference(group)
+            self.assert_object_fields(new_object, params, exclude=exclude)
+
+        def error_text(field):
+            size = convert_size_to_bytes(self.file_fields_params_add[field].get('one_max_size', '10M'))
+            return 'For file size %s (%s) in field %s' % (self.humanize_file_size(size), size, field)
+
+        groups = self.get_compatible_fields_groups(fields_for_check, 'add')
+        try:
+            for group in groups:
+                self.check_fields_by_bisection(group, check, error_text, failed=self.has_errors() and len(groups) == 1)
+        finally:
+            self.del_files()
 
     @only_with_obj
     @only_with('file_fields_params_add')
@@ -1058,7 +1046,7 @@ class AddPositiveCases(object):
         """
         Create obj with summary files size == max summary files size
         """
-        for field, field_dict in viewitems(self.file_fields_params_add):
+        for field, field_dict in self.get_subcases(viewitems(self.file_fields_params_add)):
             sp = transaction.savepoint()
             mail.outbox = []
             sum_max_size = field_dict.get('sum_max_size', None)
@@ -1069,8 +1057,7 @@ class AddPositiveCases(object):
             one_size = size / field_dict['max_count']
             try:
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 self.update_captcha_params(self.get_url(self.url_add), params)
                 self.clean_depend_fields_add(params, field)
                 self.fill_with_related(
@@ -1106,7 +1093,7 @@ class AddPositiveCases(object):
         """
         Create obj with some available extensions
         """
-        for field, field_dict in viewitems(self.file_fields_params_add):
+        for field, field_dict in self.get_subcases(viewitems(self.file_fields_params_add)):
             extensions = copy(field_dict.get('extensions', ()))
             if not extensions:
                 extensions = (get_randname(3, 'wd'), '')
@@ -1117,8 +1104,7 @@ class AddPositiveCases(object):
                 filename = '.'.join([el for el in ['test', ext] if el])
                 self.prepare_for_add()
                 f = self.get_random_file(field, filename=filename)
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 self.update_captcha_params(self.get_url(self.url_add), params)
                 self.clean_depend_fields_add(params, field)
                 self.fill_with_related(params, field, f)
@@ -1141,15 +1127,14 @@ class AddPositiveCases(object):
         """
         Create obj with minimum image file dimensions
         """
-        for field, field_dict in viewitems(self.file_fields_params_add):
+        for field, field_dict in self.get_subcases(viewitems(self.file_fields_params_add)):
             width = field_dict.get('min_width', 1)
             height = field_dict.get('min_height', 1)
             sp = transaction.savepoint()
             mail.outbox = []
             try:
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 self.update_captcha_params(self.get_url(self.url_add), params)
                 self.clean_depend_fields_add(params, field)
                 f = self.get_random_file(field, width=width, height=height)
@@ -1172,15 +1157,14 @@ class AddPositiveCases(object):
         """
         Create obj with maximum image file dimensions
         """
-        for field, field_dict in viewitems(self.file_fields_params_add):
+        for field, field_dict in self.get_subcases(viewitems(self.file_fields_params_add)):
             width = field_dict.get('max_width', 10000)
             height = field_dict.get('max_height', 10000)
             sp = transaction.savepoint()
             mail.outbox = []
             try:
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 self.update_captcha_params(self.get_url(self.url_add), params)
                 self.clean_depend_fields_add(params, field)
                 f = self.get_random_file(field, width=width, height=height)
@@ -1209,7 +1193,7 @@ class AddPositiveCases(object):
         ] + self.get_all_not_str_fields('add')
         other_fields.extend(list(getattr(self, 'file_fields_params_add', {}).keys()))
 
-        fields_for_check = [k for k in self.all_fields_add if re.sub(r'\-\d+\-', '-0-', k) not in other_fields]
+        fields_for_check = [k for k in self.all_fields_add if normalize_field_name(k) not in other_fields]
         if not fields_for_check:
             self.skipTest('No any string fields')
 
@@ -1231,8 +1215,7 @@ class AddPositiveCases(object):
 
         try:
             self.prepare_for_add()
-            params = self.deepcopy(self.default_params_add)
-            self.update_params(params)
+            params = self.get_default_params('add')
             self.update_captcha_params(self.get_url(self.url_add), params)
             params.update(only_if_values)
             self.fill_required_if(params)
@@ -1257,7 +1240,7 @@ class AddPositiveCases(object):
         ИЛИ если среди проверяемых есть поля, зависящие от значений в других полях, и они требуют отдельной проверки
         """
         if (
-            not self.errors
+            not self.has_errors()
             and not set([el[0] for el in fields_for_check]).intersection(viewkeys(self._depend_one_of_fields_add))
             and not need_one_by_one_check
         ):
@@ -1265,13 +1248,12 @@ class AddPositiveCases(object):
         if len(fields_for_check) == 1:
             self.formatted_assert_errors()
 
-        for field in fields_for_check:
+        for field in self.get_subcases(fields_for_check):
             """if unique fields"""
             mail.outbox = []
             try:
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 self.update_captcha_params(self.get_url(self.url_add), params)
                 self.clean_depend_fields_add(params, field)
                 self.fill_with_related(params, field, test_params[field])
@@ -1329,8 +1311,7 @@ class AddPositiveCases(object):
 
         try:
             self.prepare_for_add()
-            params = self.deepcopy(self.default_params_add)
-            self.update_params(params)
+            params = self.get_default_params('add')
             self.update_captcha_params(self.get_url(self.url_add), params)
             params.update(only_if_values)
             self.fill_required_if(params)
@@ -1355,7 +1336,7 @@ class AddPositiveCases(object):
         ИЛИ если среди проверяемых есть поля, зависящие от значений в других полях, и они требуют отдельной проверки
         """
         if (
-            not self.errors
+            not self.has_errors()
             and not set(fields_for_check).intersection(viewkeys(self._depend_one_of_fields_add))
             and not need_one_by_one_check
         ):
@@ -1363,12 +1344,11 @@ class AddPositiveCases(object):
         if len(fields_for_check) == 1:
             self.formatted_assert_errors()
 
-        for field, field_dict in fields_for_check:
+        for field, field_dict in self.get_subcases(fields_for_check):
             mail.outbox = []
             try:
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 self.update_captcha_params(self.get_url(self.url_add), params)
                 self.clean_depend_fields_add(params, field)
                 self.fill_with_related(params, field, test_params[field])
@@ -1402,8 +1382,7 @@ class AddPositiveCases(object):
             values += (0,)
         for delta in values:
             self.prepare_for_add()
-            params = self.deepcopy(self.default_params_add)
-            self.update_params(params)
+            params = self.get_default_params('add')
             self.update_captcha_params(self.get_url(self.url_add), params)
             start_value = self.get_value_for_field(None, start_field)
             self.fill_field(params, start_field, start_value)
@@ -1455,8 +1434,7 @@ class AddPositiveCases(object):
 
             for date_diff, time_diff in values:
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 self.update_captcha_params(self.get_url(self.url_add), params)
                 start_value = self.get_value_for_field(None, start_field)
                 if self.is_datetime_field(start_field):
@@ -1516,8 +1494,7 @@ class AddPositiveCases(object):
         Проверка зависимых обязательных полей: поля-инициаторы не заполнены, зависимые поля не заполнены
         """
         self.prepare_for_add()
-        params = self.deepcopy(self.default_params_add)
-        self.update_params(params)
+        params = self.get_default_params('add')
 
         required_if = self.get_all_required_if_fields(self.required_if_add)
 
@@ -1545,8 +1522,7 @@ class AddPositiveCases(object):
         Проверка зависимых обязательных полей: поля-инициаторы не заполнены, зависимые поля заполнены
         """
         self.prepare_for_add()
-        params = self.deepcopy(self.default_params_add)
-        self.update_params(params)
+        params = self.get_default_params('add')
 
         required_if = self.get_all_required_if_fields(self.required_if_add)
 
@@ -1574,14 +1550,13 @@ class AddPositiveCases(object):
         """
         Проверка полей, возможность заполнения которых зависит от значения в другом поле
         """
-        for field, values in self.only_if_value_add.items():
+        for field, values in self.get_subcases(self.only_if_value_add.items()):
             if not isinstance(values, (list, tuple)):
                 values = [values]
 
             for value in values:
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
 
                 params.update(value)
                 params[field] = self.get_value_for_field(None, field)
@@ -1607,14 +1582,13 @@ class AddPositiveCases(object):
         """
         if self.required_if_value_add == self.only_if_value_add:
             self.skipTest("Проверка выполняется в тесте test_add_object_related_filled_lead_with_value_positive")
-        for field, values in self.required_if_value_add.items():
+        for field, values in self.get_subcases(self.required_if_value_add.items()):
             if not isinstance(values, (list, tuple)):
                 values = [values]
 
             for value in values:
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 for k in value.keys():
                     self.clean_depend_fields_add(params, k)
                 params.update(value)
@@ -1640,19 +1614,18 @@ class AddPositiveCases(object):
         Проверка полей, обязательность заполнения которых зависит от значения в другом поле.
         Поле, включающее обязательность, заполнено другим значением - связанное поле должно быть необязательным
         """
-        for fields, values in self.required_if_value_add.items():
+        for fields, values in self.get_subcases(self.required_if_value_add.items()):
             if not isinstance(values, (list, tuple)):
                 values = [values]
             if not isinstance(fields, (list, tuple)):
                 fields = (fields,)
 
-            for field in fields:
+            for field in self.get_subcases(fields):
                 for value in values:
                     for test_field, v in value.items():
                         additional_params = self.deepcopy(value)
                         self.prepare_for_add()
-                        params = self.deepcopy(self.default_params_add)
-                        self.update_params(params)
+                        params = self.get_default_params('add')
                         self.update_captcha_params(self.get_url(self.url_add), params)
                         test_value = value.copy()
                         n = 0
@@ -1704,15 +1677,14 @@ class AddPositiveCases(object):
             )
         ).difference(self.not_empty_fields_add):
             self.skipTest("Нет полей для проверки")
-        for field, values in self.required_if_value_add.items():
+        for field, values in self.get_subcases(self.required_if_value_add.items()):
             if not isinstance(values, (list, tuple)):
                 values = [values]
 
             for value in values:
                 for k in set(value.keys()).difference(self.not_empty_fields_add):
                     self.prepare_for_add()
-                    params = self.deepcopy(self.default_params_add)
-                    self.update_params(params)
+                    params = self.get_default_params('add')
 
                     additional_params = self.deepcopy(value)
                     self.set_empty_value_for_field(additional_params, k)
@@ -1735,18 +1707,18 @@ class AddPositiveCases(object):
 
 class AddNegativeCases(object):
     @only_with_obj
+    @form_validation_subcases
     def test_add_object_empty_required_fields_negative(self):
         """
         Try create object: empty required fields
         """
         message_type = 'empty_required'
         """обязательные поля должны быть заполнены"""
-        for field in [f for f in self.not_empty_fields_add if 'FORMS' not in f]:
+        for field in self.get_subcases([f for f in self.not_empty_fields_add if 'FORMS' not in f]):
             sp = transaction.savepoint()
             try:
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 self.update_captcha_params(self.get_url(self.url_add), params)
                 self.set_empty_value_for_field(params, field)
                 initial_obj_count = self.get_obj_manager.count()
@@ -1762,8 +1734,7 @@ class AddNegativeCases(object):
         for group in self.not_empty_related_fields_add:
             sp = transaction.savepoint()
             self.prepare_for_add()
-            params = self.deepcopy(self.default_params_add)
-            self.update_params(params)
+            params = self.get_default_params('add')
             for field in group:
                 self.set_empty_value_for_field(params, field)
             self.update_captcha_params(self.get_url(self.url_add), params)
@@ -1783,18 +1754,18 @@ class AddNegativeCases(object):
                 self.errors_append(text='For empty group "%s"' % force_text(group))
 
     @only_with_obj
+    @form_validation_subcases
     def test_add_object_without_required_fields_negative(self):
         """
         Try create object: required fields are not exists in params
         """
         message_type = 'without_required'
         """обязательные поля должны быть заполнены"""
-        for field in [f for f in self.required_fields_add if 'FORMS' not in f]:
+        for field in self.get_subcases([f for f in self.required_fields_add if 'FORMS' not in f]):
             sp = transaction.savepoint()
             try:
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 self.update_captcha_params(self.get_url(self.url_add), params)
                 self.pop_field_from_params(params, field)
                 initial_obj_count = self.get_obj_manager.count()
@@ -1810,8 +1781,7 @@ class AddNegativeCases(object):
         for group in self.required_related_fields_add:
             sp = transaction.savepoint()
             self.prepare_for_add()
-            params = self.deepcopy(self.default_params_add)
-            self.update_params(params)
+            params = self.get_default_params('add')
             for field in group:
                 self.pop_field_from_params(params, field)
             self.update_captcha_params(self.get_url(self.url_add), params)
@@ -1832,19 +1802,34 @@ class AddNegativeCases(object):
 
     @only_with_obj
     @only_with('max_fields_length')
+    @form_validation_subcases
     def test_add_object_values_length_gt_max_negative(self):
         """
         Create object: values length > maximum
         """
         message_type = 'max_length'
         other_fields = list(getattr(self, 'digital_fields_add', [])) + list(getattr(self, 'date_fields', []))
-        for field, length in [
+        fields_for_check = [
             (k, v) for k, v in viewitems(self.max_fields_length) if k in self.all_fields_add and k not in other_fields
-        ]:
+        ]
+        if self.combine_negative_checks or self.concurrent_negative_checks:
+            checked = self.check_batched_negative_cases(
+                [
+                    (
+                        field,
+                        self.get_value_for_field(length + 1, field),
+                        message_type,
+                        {'length': length, 'current_length': length + 1},
+                    )
+                    for field, length in fields_for_check
+                ],
+                'add',
+            )
+            fields_for_check = [(field, length) for field, length in fields_for_check if field not in dict(checked)]
+        for field, length in self.get_subcases(fields_for_check):
             sp = transaction.savepoint()
             self.prepare_for_add()
-            params = self.deepcopy(self.default_params_add)
-            self.update_params(params)
+            params = self.get_default_params('add')
             self.update_captcha_params(self.get_url(self.url_add), params)
             self.clean_depend_fields_add(params, field)
             current_length = length + 1
@@ -1868,19 +1853,23 @@ class AddNegativeCases(object):
 
     @only_with_obj
     @only_with('min_fields_length')
+    @form_validation_subcases
     def test_add_object_values_length_lt_min_negative(self):
         """
         Create object: values length < minimum
         """
         message_type = 'min_length'
         other_fields = list(getattr(self, 'digital_fields_add', [])) + list(getattr(self, 'date_fields', []))
-        for field, length in [
-            (k, v) for k, v in viewitems(self.min_fields_length) if k in self.all_fields_add and k not in other_fields
-        ]:
+        for field, length in self.get_subcases(
+            [
+                (k, v)
+                for k, v in viewitems(self.min_fields_length)
+                if k in self.all_fields_add and k not in other_fields
+            ]
+        ):
             sp = transaction.savepoint()
             self.prepare_for_add()
-            params = self.deepcopy(self.default_params_add)
-            self.update_params(params)
+            params = self.get_default_params('add')
             self.update_captcha_params(self.get_url(self.url_add), params)
             self.clean_depend_fields_add(params, field)
             current_length = length - 1
@@ -1898,16 +1887,34 @@ class AddNegativeCases(object):
                 )
 
     @only_with_obj
+    @form_validation_subcases
     def test_add_object_with_wrong_choices_negative(self):
         """
         Try create object with choices, that not exists
         """
         message_type = 'wrong_value'
-        for field in set(tuple(self.choice_fields_add) + tuple(self.choice_fields_add_with_value_in_error)):
-            for value in self.custom_wrong_values.get(field, ('qwe', '12345678', 'йцу')):
+        fields_for_check = set(tuple(self.choice_fields_add) + tuple(self.choice_fields_add_with_value_in_error))
+        checked = []
+        if self.combine_negative_checks or self.concurrent_negative_checks:
+            checked = self.check_batched_negative_cases(
+                [
+                    (
+                        field,
+                        value,
+                        message_type,
+                        {'value': value} if field in self.choice_fields_add_with_value_in_error else {},
+                    )
+                    for field in fields_for_check
+                    for value in self.custom_wrong_values.get(field, WRONG_CHOICE_VALUES)
+                ],
+                'add',
+            )
+        for field in self.get_subcases(fields_for_check):
+            for value in self.custom_wrong_values.get(field, WRONG_CHOICE_VALUES):
+                if (field, value) in checked:
+                    continue
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 self.update_captcha_params(self.get_url(self.url_add), params)
                 self.clean_depend_fields_add(params, field)
                 self.fill_with_related(params, field, value)
@@ -1929,16 +1936,16 @@ class AddNegativeCases(object):
 
     @only_with_obj
     @only_with(('multiselect_fields_add',))
+    @form_validation_subcases
     def test_add_object_with_wrong_multiselect_choices_negative(self):
         """
         Try create object with choices in multiselect, that not exists
         """
         message_type = 'wrong_value'
-        for field in self.multiselect_fields_add:
-            for value in self.custom_wrong_values.get(field, ('qwe', '12345678', 'йцу')):
+        for field in self.get_subcases(self.multiselect_fields_add):
+            for value in self.custom_wrong_values.get(field, WRONG_CHOICE_VALUES):
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 self.update_captcha_params(self.get_url(self.url_add), params)
                 self.clean_depend_fields_add(params, field)
                 self.fill_with_related(
@@ -1962,6 +1969,7 @@ class AddNegativeCases(object):
 
     @only_with_obj
     @only_with(('unique_fields_add',))
+    @form_validation_subcases
     def test_add_object_unique_already_exists_negative(self):
         """
         Try add object with unique field values, that already used in other objects
@@ -1973,8 +1981,7 @@ class AddNegativeCases(object):
             field = self.all_unique[el]
             existing_obj = self.get_existing_obj_with_filled(el)
             sp = transaction.savepoint()
-            params = self.deepcopy(self.default_params_add)
-            self.update_params(params)
+            params = self.get_default_params('add')
             self.update_captcha_params(self.get_url(self.url_add), params)
             for el_field in el:
                 if el_field not in self.all_fields_add:
@@ -2067,18 +2074,30 @@ class AddNegativeCases(object):
 
     @only_with_obj
     @only_with(('digital_fields_add',))
+    @form_validation_subcases
     def test_add_object_wrong_values_in_digital_negative(self):
         """
         Try add obj with wrong values in digital fields
         """
-        for field in [f for f in self.digital_fields_add]:
+        checked = []
+        if self.combine_negative_checks or self.concurrent_negative_checks:
+            checked = self.check_batched_negative_cases(
+                [
+                    (field, value, 'wrong_value_int' if field in self.int_fields_add else 'wrong_value_digital', {})
+                    for field in self.digital_fields_add
+                    for value in self.custom_wrong_values.get(field, WRONG_DIGITAL_VALUES)
+                ],
+                'add',
+            )
+        for field in self.get_subcases([f for f in self.digital_fields_add]):
             message_type = 'wrong_value_int' if field in self.int_fields_add else 'wrong_value_digital'
-            for value in self.custom_wrong_values.get(field, ('q', 'й', 'NaN', 'inf', '-inf', '²')):
+            for value in self.custom_wrong_values.get(field, WRONG_DIGITAL_VALUES):
+                if (field, value) in checked:
+                    continue
                 sp = transaction.savepoint()
                 try:
                     self.prepare_for_add()
-                    params = self.deepcopy(self.default_params_add)
-                    self.update_params(params)
+                    params = self.get_default_params('add')
                     self.update_captcha_params(self.get_url(self.url_add), params)
                     self.clean_depend_fields_add(params, field)
                     self.fill_with_related(params, field, value)
@@ -2093,18 +2112,18 @@ class AddNegativeCases(object):
 
     @only_with_obj
     @only_with(('email_fields_add',))
+    @form_validation_subcases
     def test_add_object_wrong_values_in_email_negative(self):
         """
         Try add obj with wrong values in email fields
         """
         message_type = 'wrong_value_email'
-        for field in [f for f in self.email_fields_add]:
-            for value in self.custom_wrong_values.get(field, ('q', 'й', 'qwe@rty', 'qw@йц', '@qwe', 'qwe@')):
+        for field in self.get_subcases([f for f in self.email_fields_add]):
+            for value in self.custom_wrong_values.get(field, WRONG_EMAIL_VALUES):
                 sp = transaction.savepoint()
                 try:
                     self.prepare_for_add()
-                    params = self.deepcopy(self.default_params_add)
-                    self.update_params(params)
+                    params = self.get_default_params('add')
                     self.update_captcha_params(self.get_url(self.url_add), params)
                     self.clean_depend_fields_add(params, field)
                     self.fill_with_related(params, field, value)
@@ -2119,19 +2138,19 @@ class AddNegativeCases(object):
 
     @only_with_obj
     @only_with(('digital_fields_add',))
+    @form_validation_subcases
     def test_add_object_value_gt_max_in_digital_negative(self):
         """
         Try add obj with value in digital fields > max
         """
         message_type = 'max_length_digital'
-        for field in [f for f in self.digital_fields_add]:
+        for field in self.get_subcases([f for f in self.digital_fields_add]):
             max_value = min(self.get_digital_values_range(field)['max_values'])
             for value in self.get_gt_max_list(field, self.get_digital_values_range(field)['max_values']):
                 sp = transaction.savepoint()
                 try:
                     self.prepare_for_add()
-                    params = self.deepcopy(self.default_params_add)
-                    self.update_params(params)
+                    params = self.get_default_params('add')
                     self.update_captcha_params(self.get_url(self.url_add), params)
                     self.clean_depend_fields_add(params, field)
                     self.fill_with_related(params, field, value)
@@ -2146,19 +2165,19 @@ class AddNegativeCases(object):
 
     @only_with_obj
     @only_with(('digital_fields_add',))
+    @form_validation_subcases
     def test_add_object_value_lt_min_in_digital_negative(self):
         """
         Try add obj with value in digital fields < min
         """
         message_type = 'min_length_digital'
-        for field in [f for f in self.digital_fields_add]:
+        for field in self.get_subcases([f for f in self.digital_fields_add]):
             min_value = max(self.get_digital_values_range(field)['min_values'])
             for value in self.get_lt_min_list(field, self.get_digital_values_range(field)['min_values']):
                 sp = transaction.savepoint()
                 try:
                     self.prepare_for_add()
-                    params = self.deepcopy(self.default_params_add)
-                    self.update_params(params)
+                    params = self.get_default_params('add')
                     self.update_captcha_params(self.get_url(self.url_add), params)
                     self.clean_depend_fields_add(params, field)
                     self.fill_with_related(params, field, value)
@@ -2177,13 +2196,12 @@ class AddNegativeCases(object):
         """
         Try add obj with filled disabled fields
         """
-        for field in self.disabled_fields_add:
+        for field in self.get_subcases(self.disabled_fields_add):
             sp = transaction.savepoint()
             mail.outbox = []
             try:
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 self.update_captcha_params(self.get_url(self.url_add), params)
                 self.clean_depend_fields_add(params, field)
                 params[field] = params.get(field, None) or self.get_value_for_field(None, field)
@@ -2202,6 +2220,7 @@ class AddNegativeCases(object):
 
     @only_with_obj
     @only_with(('one_of_fields_add',))
+    @form_validation_subcases
     def test_add_object_one_of_fields_all_filled_negative(self):
         """
         Try add object with all filled fields, that should be filled singly
@@ -2216,8 +2235,7 @@ class AddNegativeCases(object):
                 sp = transaction.savepoint()
                 try:
                     self.prepare_for_add()
-                    params = self.deepcopy(self.default_params_add)
-                    self.update_params(params)
+                    params = self.get_default_params('add')
                     self.update_captcha_params(self.get_url(self.url_add), params)
                     self.fill_all_fields(filled_group, params)
                     initial_obj_count = self.get_obj_manager.count()
@@ -2240,8 +2258,7 @@ class AddNegativeCases(object):
         message_type = 'max_block_count'
         for name, max_count in viewitems(self.max_blocks):
             self.prepare_for_add()
-            params = self.deepcopy(self.default_params_add)
-            self.update_params(params)
+            params = self.get_default_params('add')
             self.update_captcha_params(self.get_url(self.url_add), params)
             gt_max_count = max_count + 1
             self.fill_all_block_fields(
@@ -2267,12 +2284,13 @@ class AddNegativeCases(object):
     @only_with_obj
     @only_with('file_fields_params_add')
     @only_with_files_params('max_count')
+    @form_validation_subcases
     def test_add_object_many_files_negative(self):
         """
         Try create obj with files count > max files count
         """
         message_type = 'max_count_file'
-        for field, field_dict in viewitems(self.file_fields_params_add):
+        for field, field_dict in self.get_subcases(viewitems(self.file_fields_params_add)):
             if field_dict.get('max_count', 1) <= 1:
                 continue
             max_count = field_dict['max_count']
@@ -2281,8 +2299,7 @@ class AddNegativeCases(object):
             mail.outbox = []
             try:
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 self.update_captcha_params(self.get_url(self.url_add), params)
                 self.clean_depend_fields_add(params, field)
                 filename = '.'.join(
@@ -2315,12 +2332,13 @@ class AddNegativeCases(object):
     @only_with_obj
     @only_with('file_fields_params_add')
     @only_with_files_params('one_max_size')
+    @form_validation_subcases
     def test_add_object_big_file_negative(self):
         """
         Try create obj with file size > max one file size
         """
         message_type = 'max_size_file'
-        for field, field_dict in viewitems(self.file_fields_params_add):
+        for field, field_dict in self.get_subcases(viewitems(self.file_fields_params_add)):
             sp = transaction.savepoint()
             one_max_size = field_dict.get('one_max_size', None)
             if not one_max_size:
@@ -2331,8 +2349,7 @@ class AddNegativeCases(object):
             human_current_size = self.humanize_file_size(current_size)
             try:
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 self.update_captcha_params(self.get_url(self.url_add), params)
                 self.clean_depend_fields_add(params, field)
                 f = self.get_random_file(field, size=current_size)
@@ -2357,12 +2374,13 @@ class AddNegativeCases(object):
     @only_with_obj
     @only_with('file_fields_params_add')
     @only_with_files_params('sum_max_size')
+    @form_validation_subcases
     def test_add_object_big_summary_file_size_negative(self):
         """
         Try create obj with summary files size > max summary files size
         """
         message_type = 'max_sum_size_file'
-        for field, field_dict in viewitems(self.file_fields_params_add):
+        for field, field_dict in self.get_subcases(viewitems(self.file_fields_params_add)):
             sp = transaction.savepoint()
             sum_max_size = field_dict.get('sum_max_size', None)
             if not sum_max_size:
@@ -2374,8 +2392,7 @@ class AddNegativeCases(object):
             one_size = current_size / field_dict['max_count']
             try:
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 self.update_captcha_params(self.get_url(self.url_add), params)
                 self.clean_depend_fields_add(params, field)
                 f = self.get_random_file(field, size=one_size, count=field_dict['max_count'])
@@ -2404,18 +2421,18 @@ class AddNegativeCases(object):
 
     @only_with_obj
     @only_with('file_fields_params_add')
+    @form_validation_subcases
     def test_add_object_empty_file_negative(self):
         """
         Try create obj with file size = 0M
         """
         message_type = 'empty_file'
-        for field, field_dict in viewitems(self.file_fields_params_add):
+        for field, field_dict in self.get_subcases(viewitems(self.file_fields_params_add)):
             sp = transaction.savepoint()
             mail.outbox = []
             try:
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 self.update_captcha_params(self.get_url(self.url_add), params)
                 self.clean_depend_fields_add(params, field)
                 f = self.get_random_file(field, size=0)
@@ -2436,12 +2453,13 @@ class AddNegativeCases(object):
     @only_with_obj
     @only_with('file_fields_params_add')
     @only_with_files_params('extensions')
+    @form_validation_subcases
     def test_add_object_wrong_file_extensions_negative(self):
         """
         Create obj with wrong extensions
         """
         message_type = 'wrong_extension'
-        for field, field_dict in viewitems(self.file_fields_params_add):
+        for field, field_dict in self.get_subcases(viewitems(self.file_fields_params_add)):
             extensions = copy(field_dict.get('extensions', ()))
             if not extensions:
                 continue
@@ -2453,8 +2471,7 @@ class AddNegativeCases(object):
                 filename = '.'.join([el for el in ['test', ext] if el])
                 sp = transaction.savepoint()
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 self.update_captcha_params(self.get_url(self.url_add), params)
                 self.clean_depend_fields_add(params, field)
                 f = self.get_random_file(field, filename=filename)
@@ -2474,12 +2491,13 @@ class AddNegativeCases(object):
     @only_with_obj
     @only_with('file_fields_params_add')
     @only_with_any_files_params(['min_width', 'min_height'])
+    @form_validation_subcases
     def test_add_object_image_dimensions_lt_min_negative(self):
         """
         Create obj with image file dimensions < minimum
         """
         message_type = 'min_dimensions'
-        for field, field_dict in viewitems(self.file_fields_params_add):
+        for field, field_dict in self.get_subcases(viewitems(self.file_fields_params_add)):
             mail.outbox = []
             values = ()
             min_width = field_dict.get('min_width', None)
@@ -2493,8 +2511,7 @@ class AddNegativeCases(object):
                 sp = transaction.savepoint()
                 try:
                     self.prepare_for_add()
-                    params = self.deepcopy(self.default_params_add)
-                    self.update_params(params)
+                    params = self.get_default_params('add')
                     self.update_captcha_params(self.get_url(self.url_add), params)
                     self.clean_depend_fields_add(params, field)
                     f = self.get_random_file(field, width=width, height=height)
@@ -2515,12 +2532,13 @@ class AddNegativeCases(object):
     @only_with_obj
     @only_with('file_fields_params_add')
     @only_with_any_files_params(['max_width', 'max_height'])
+    @form_validation_subcases
     def test_add_object_image_dimensions_gt_max_negative(self):
         """
         Create obj with image file dimensions > maximum
         """
         message_type = 'max_dimensions'
-        for field, field_dict in viewitems(self.file_fields_params_add):
+        for field, field_dict in self.get_subcases(viewitems(self.file_fields_params_add)):
             mail.outbox = []
             values = ()
             max_width = field_dict.get('max_width', None)
@@ -2544,8 +2562,7 @@ class AddNegativeCases(object):
                 sp = transaction.savepoint()
                 try:
                     self.prepare_for_add()
-                    params = self.deepcopy(self.default_params_add)
-                    self.update_params(params)
+                    params = self.get_default_params('add')
                     self.update_captcha_params(self.get_url(self.url_add), params)
                     self.clean_depend_fields_add(params, field)
                     f = self.get_random_file(field, width=width, height=height)
@@ -2566,6 +2583,7 @@ class AddNegativeCases(object):
 
     @only_with_obj
     @only_with(('check_null', 'check_null_str_negative'))
+    @form_validation_subcases
     def test_add_object_str_with_null_negative(self):
         """
         Create object with \\x00 in str fields
@@ -2578,18 +2596,17 @@ class AddNegativeCases(object):
         ] + self.get_all_not_str_fields('add')
         other_fields.extend(list(getattr(self, 'file_fields_params_add', {}).keys()))
 
-        fields_for_check = [k for k in self.all_fields_add if re.sub(r'\-\d+\-', '-0-', k) not in other_fields]
+        fields_for_check = [k for k in self.all_fields_add if normalize_field_name(k) not in other_fields]
         if not fields_for_check:
             self.skipTest('No any string fields')
         test_params = {}
         for field in fields_for_check:
             test_params[field] = '\x00' + self.get_value_for_field(None, field)[1:]
 
-        for field in fields_for_check:
+        for field in self.get_subcases(fields_for_check):
             try:
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 self.update_captcha_params(self.get_url(self.url_add), params)
                 self.clean_depend_fields_add(params, field)
                 self.fill_with_related(params, field, test_params[field])
@@ -2605,15 +2622,15 @@ class AddNegativeCases(object):
 
     @only_with_obj
     @only_with(('check_null', 'file_fields_params_add', 'check_null_file_negative'))
+    @form_validation_subcases
     def test_add_object_with_null_in_file_negative(self):
         """
         Add object with \\x00 in filenames
         """
         message_type = 'with_null'
-        for field, field_dict in viewitems(self.file_fields_params_add):
+        for field, field_dict in self.get_subcases(viewitems(self.file_fields_params_add)):
             self.prepare_for_add()
-            params = self.deepcopy(self.default_params_add)
-            self.update_params(params)
+            params = self.get_default_params('add')
             self.update_captcha_params(self.get_url(self.url_add), params)
             self.clean_depend_fields_add(params, field)
             f = self.get_random_file(
@@ -2649,7 +2666,7 @@ class AddNegativeCases(object):
         Add object with \\x00 in captcha fields
         """
         message_type = 'with_null'
-        for field in ('captcha_0', 'captcha_1'):
+        for field in self.get_subcases(('captcha_0', 'captcha_1')):
             try:
                 self.prepare_for_add()
                 params = self.deepcopy(self.default_params_add)
@@ -2669,8 +2686,7 @@ class AddNegativeCases(object):
             values += (0,)
         for delta in values:
             self.prepare_for_add()
-            params = self.deepcopy(self.default_params_add)
-            self.update_params(params)
+            params = self.get_default_params('add')
             self.update_captcha_params(self.get_url(self.url_add), params)
             start_value = self.get_value_for_field(None, start_field)
             self.fill_field(params, start_field, start_value)
@@ -2694,6 +2710,7 @@ class AddNegativeCases(object):
 
     @only_with_obj
     @only_with('intervals')
+    @form_validation_subcases
     def test_add_object_some_intervals_negative(self):
         """
         Wrong intervals checks
@@ -2721,8 +2738,7 @@ class AddNegativeCases(object):
 
             for date_diff, time_diff in values:
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 self.update_captcha_params(self.get_url(self.url_add), params)
                 start_value = self.get_value_for_field(None, start_field)
                 if self.is_datetime_field(start_field):
@@ -2774,6 +2790,7 @@ class AddNegativeCases(object):
 
     @only_with_obj
     @only_with('required_if_add')
+    @form_validation_subcases
     def test_add_object_empty_related_required_negative(self):
         """
         Проверка зависимых обязательных полей: поля-инициаторы заполнены, зависимые поля не заполнены
@@ -2783,15 +2800,16 @@ class AddNegativeCases(object):
 
         for lead, dependent in viewitems(self.required_if_add):
             """только одиночные поля"""
-            for field in [
-                f
-                for f in (dependent if isinstance(dependent, (list, tuple)) else (dependent,))
-                if not isinstance(f, (list, tuple))
-            ]:
+            for field in self.get_subcases(
+                [
+                    f
+                    for f in (dependent if isinstance(dependent, (list, tuple)) else (dependent,))
+                    if not isinstance(f, (list, tuple))
+                ]
+            ):
                 try:
                     self.prepare_for_add()
-                    params = self.deepcopy(self.default_params_add)
-                    self.update_params(params)
+                    params = self.get_default_params('add')
                     self.update_captcha_params(self.get_url(self.url_add), params)
                     self.fill_all_fields(
                         (lead if isinstance(lead, (list, tuple)) else (lead,)) + related,
@@ -2813,8 +2831,7 @@ class AddNegativeCases(object):
                 if isinstance(f, (list, tuple))
             ]:
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 self.update_captcha_params(self.get_url(self.url_add), params)
                 self.fill_all_fields(
                     (lead if isinstance(lead, (list, tuple)) else (lead,)) + related,
@@ -2843,21 +2860,21 @@ class AddNegativeCases(object):
 
     @only_with_obj
     @only_with('only_if_value_add')
+    @form_validation_subcases
     def test_add_object_related_filled_lead_with_other_value_negative(self):
         """
         Проверка полей, возможность заполнения которых зависит от значения в другом поле.
         Поле-инициатор заполнено другим значением
         """
         message_type = 'wrong_only_if_value'
-        for field, values in self.only_if_value_add.items():
+        for field, values in self.get_subcases(self.only_if_value_add.items()):
             if not isinstance(values, (list, tuple)):
                 values = [values]
 
             for value in values:
                 for test_field, v in value.items():
                     self.prepare_for_add()
-                    params = self.deepcopy(self.default_params_add)
-                    self.update_params(params)
+                    params = self.get_default_params('add')
                     self.update_captcha_params(self.get_url(self.url_add), params)
                     additional_params = self.deepcopy(value)
 
@@ -2897,20 +2914,20 @@ class AddNegativeCases(object):
 
     @only_with_obj
     @only_with('required_if_value_add')
+    @form_validation_subcases
     def test_add_object_related_empty_lead_with_value_negative(self):
         """
         Проверка полей, возможность заполнения которых зависит от значения в другом поле.
         Поле-инициатор заполнено значением, зависимое поле не заполнено
         """
         message_type = 'empty_required'
-        for field, values in self.required_if_value_add.items():
+        for field, values in self.get_subcases(self.required_if_value_add.items()):
             if not isinstance(values, (list, tuple)):
                 values = [values]
 
             for value in values:
                 self.prepare_for_add()
-                params = self.deepcopy(self.default_params_add)
-                self.update_params(params)
+                params = self.get_default_params('add')
                 for k in value.keys():
                     self.clean_depend_fields_add(params, k)
                 params.update(value)
@@ -2929,6 +2946,14 @@ class AddNegativeCases(object):
                 except Exception:
                     self.errors_append(text='%s=%s\n%s' % (field, params.get(field), value))
 
+    @only_with_obj
+    @only_with('fuzzing_time_budget')
+    def test_add_object_fuzzing(self):
+        """
+        Create object: random valid and boundary invalid values during fuzzing_time_budget seconds
+        """
+        self.run_fuzzing('add')
+
 
 class EditPositiveCases(object):
     @only_with_obj
@@ -2962,7 +2987,7 @@ class EditPositiveCases(object):
                 self.errors_append(text='For hidden fields')
 
         fields_helptext = getattr(self, 'fields_helptext_edit', {})
-        for field_name, text in viewitems(fields_helptext):
+        for field_name, text in self.get_subcases(viewitems(fields_helptext)):
             if field_name not in self.all_fields_edit:
                 continue
             try:
@@ -2977,8 +3002,7 @@ class EditPositiveCases(object):
         Edit object: fill all fields
         """
         obj_for_edit = self.get_obj_for_edit()
-        params = self.deepcopy(self.default_params_edit)
-        self.update_params(params)
+        params = self.get_default_params('edit')
         self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
         prepared_depends_fields = (
             self.prepare_depend_from_one_of(self.one_of_fields_edit) if self.one_of_fields_edit else {}
@@ -3018,10 +3042,9 @@ class EditPositiveCases(object):
         Edit object: fill all fields. Check for any filled field from one_of_fields
         """
         for group in self.one_of_fields_edit:
-            for field in group:
+            for field in self.get_subcases(group):
                 obj_for_edit = self.get_obj_for_edit()
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
                 only_independent_fields = set(self.all_fields_edit).difference(
                     viewkeys(self._depend_one_of_fields_edit)
@@ -3078,10 +3101,9 @@ class EditPositiveCases(object):
 
         """если хотя бы одно поле из группы заполнено, объект редактируется"""
         for group in self.not_empty_related_fields_edit:
-            for field in group:
+            for field in self.get_subcases(group):
                 obj_for_edit = self.get_obj_for_edit()
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 for f in group:
                     self.set_empty_value_for_field(params, f)
                 self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
@@ -3130,10 +3152,9 @@ class EditPositiveCases(object):
 
         """если хотя бы одно поле из группы заполнено, объект редактируется"""
         for group in self.required_related_fields_edit:
-            for field in group:
+            for field in self.get_subcases(group):
                 obj_for_edit = self.get_obj_for_edit()
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 for f in group:
                     self.pop_field_from_params(params, f)
                 self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
@@ -3162,9 +3183,9 @@ class EditPositiveCases(object):
         other_fields = self.get_all_not_str_fields('edit')
 
         fields_for_check = {
-            k: self.max_fields_length.get(re.sub(r'\-\d+\-', '-0-', k), 100000)
+            k: self.max_fields_length.get(normalize_field_name(k), 100000)
             for k in self.all_fields_edit
-            if re.sub(r'\-\d+\-', '-0-', k) not in other_fields
+            if normalize_field_name(k) not in other_fields
         }
         if not fields_for_check:
             self.skipTest('No any string fields')
@@ -3187,8 +3208,7 @@ class EditPositiveCases(object):
 
         sp = transaction.savepoint()
         try:
-            params = self.deepcopy(self.default_params_edit)
-            self.update_params(params)
+            params = self.get_default_params('edit')
             self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
             params.update(only_if_values)
             params.update(max_length_params)
@@ -3245,7 +3265,7 @@ class EditPositiveCases(object):
         ИЛИ если среди проверяемых есть поля, зависящие от значений в других полях, и они требуют отдельной проверки
         """
         if (
-            not self.errors
+            not self.has_errors()
             and not set(viewkeys(fields_for_check)).intersection(viewkeys(self._depend_one_of_fields_edit))
             and not need_one_by_one_check
         ):
@@ -3253,76 +3273,60 @@ class EditPositiveCases(object):
         if len(fields_for_check) == 1:
             self.formatted_assert_errors()
 
-        for k in set(viewkeys(max_length_params)).intersection((k for el in viewkeys(self.all_unique) for k in el)):
-            max_length_params[k] = self.get_value_for_field(fields_for_check[k], k)
+        values = {}
 
-        for field, length in viewitems(fields_for_check):
-            sp = transaction.savepoint()
-            try:
-                obj_for_edit = self.get_obj_for_edit()
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
-                self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
-                self.clean_depend_fields_edit(params, field)
-                self.fill_with_related(params, field, self.get_value_for_field(length, field))
+        def check(group):
+            obj_for_edit = self.get_obj_for_edit()
+            params = self.get_default_params('edit')
+            self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
+            for field in group:
+                self.fill_with_related(params, field, self.get_value_for_field(fields_for_check[field], field))
                 if field in file_fields:
                     if self.is_file_list(field):
                         for f in params[field]:
                             f.seek(0)
                     else:
                         params[field].seek(0)
-                value = self.get_value_for_error_message(field, params[field])
-                response = self.send_edit_request(obj_for_edit.pk, params)
-                self.check_on_edit_success(response, locals())
-                new_object = self.get_obj_manager.get(pk=obj_for_edit.pk)
-                exclude = set(getattr(self, 'exclude_from_check_edit', [])).difference(
-                    [
-                        field,
-                    ]
-                )
-                self.assert_object_fields(new_object, params, exclude=exclude)
+                values[field] = self.get_value_for_error_message(field, params[field])
+            response = self.send_edit_request(obj_for_edit.pk, params)
+            self.check_on_edit_success(response, locals())
+            new_object = self.get_obj_manager.get(pk=obj_for_edit.pk)
+            exclude = set(getattr(self, 'exclude_from_check_edit', [])).difference(group)
+            self.assert_object_fields(new_object, params, exclude=exclude)
 
-                if self.second_save_available and self.is_file_field(field):
-                    obj_for_edit = self.get_obj_manager.get(pk=obj_for_edit.pk)
-                    self.update_params(params)
+            group_file_fields = [field for field in group if field in file_fields]
+            if self.second_save_available and group_file_fields:
+                obj_for_edit = self.get_obj_manager.get(pk=obj_for_edit.pk)
+                self.update_params(params)
+                for field in group_file_fields:
                     params[field] = ''
-                    self.update_captcha_params(
-                        self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)),
-                        params,
-                    )
-                    _errors = []
-                    other_values = {field: self._get_field_value_by_name(obj_for_edit, field)}
-                    try:
-                        response = self.send_edit_request(obj_for_edit.pk, params)
-                        self.check_on_edit_success(response, locals())
-                        new_object = self.get_obj_manager.get(pk=obj_for_edit.pk)
-                        exclude = set(getattr(self, 'exclude_from_check_edit', [])).difference(
-                            [
-                                field,
-                            ]
-                        )
-                        self.assert_object_fields(
-                            new_object,
-                            params,
-                            exclude=exclude,
-                            other_values=other_values,
-                        )
-                    except Exception:
-                        self.errors_append(_errors, text='Second save with file max length')
-                    if _errors:
-                        raise Exception(format_errors(_errors))
-            except Exception:
-                self.savepoint_rollback(sp)
-                self.errors_append(
-                    text='For field "%s" with length %d\n(value "%s")'
-                    % (
-                        field,
-                        length,
-                        value if len(str(value)) <= 1000 else str(value)[:1000] + '...',
-                    )
-                )
-            finally:
-                mail.outbox = []
+                self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
+                _errors = []
+                other_values = {
+                    field: self._get_field_value_by_name(obj_for_edit, field) for field in group_file_fields
+                }
+                try:
+                    response = self.send_edit_request(obj_for_edit.pk, params)
+                    self.check_on_edit_success(response, locals())
+                    new_object = self.get_obj_manager.get(pk=obj_for_edit.pk)
+                    exclude = set(getattr(self, 'exclude_from_check_edit', [])).difference(group_file_fields)
+                    self.assert_object_fields(new_object, params, exclude=exclude, other_values=other_values)
+                except Exception:
+                    self.errors_append(_errors, text='Second save with file max length')
+                if _errors:
+                    raise Exception(format_errors(_errors))
+
+        def error_text(field):
+            value = values.get(field, '')
+            return 'For field "%s" with length %d\n(value "%s")' % (
+                field,
+                fields_for_check[field],
+                value if len(str(value)) <= 1000 else str(value)[:1000] + '...',
+            )
+
+        groups = self.get_compatible_fields_groups(list(fields_for_check), 'edit')
+        for group in groups:
+            self.check_fields_by_bisection(group, check, error_text, failed=self.has_errors() and len(groups) == 1)
 
     @only_with_obj
     def test_edit_object_different_unique_values_positive(self):
@@ -3356,11 +3360,10 @@ class EditPositiveCases(object):
                 checks_list.append(list(set(fields_for_change)))
 
         checks_list = checks_list or ((),)
-        for fields_for_change in checks_list:
+        for fields_for_change in self.get_subcases(checks_list):
             obj_for_edit = self.get_obj_for_edit()
             existing_obj = self.get_other_obj_with_filled(fields_for_change, obj_for_edit)
-            params = self.deepcopy(self.default_params_edit)
-            self.update_params(params)
+            params = self.get_default_params('edit')
             self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
 
             for field in fields_for_change:
@@ -3465,8 +3468,7 @@ class EditPositiveCases(object):
                 obj_for_edit = self.get_obj_for_edit()
                 sp = transaction.savepoint()
                 existing_obj = self.get_other_obj_with_filled(el, obj_for_edit)
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
                 for el_field in el:
                     if el_field not in self.all_fields_edit:
@@ -3549,8 +3551,7 @@ class EditPositiveCases(object):
 
         sp = transaction.savepoint()
         try:
-            params = self.deepcopy(self.default_params_edit)
-            self.update_params(params)
+            params = self.get_default_params('edit')
             self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
             params.update(min_value_params)
             response = self.send_edit_request(obj_for_edit.pk, params)
@@ -3571,7 +3572,7 @@ class EditPositiveCases(object):
         ИЛИ если среди проверяемых есть поля, зависящие от значений в других полях, и они требуют отдельной проверки
         """
         if (
-            not self.errors
+            not self.has_errors()
             and not set(fields_for_check).intersection(viewkeys(self._depend_one_of_fields_edit))
             and not need_one_by_one_check
         ):
@@ -3579,13 +3580,12 @@ class EditPositiveCases(object):
         if len(fields_for_check) == 1:
             self.formatted_assert_errors()
 
-        for field in fields_for_check:
+        for field in self.get_subcases(fields_for_check):
             value = min_value_params[field]
             sp = transaction.savepoint()
             obj_for_edit = self.get_obj_for_edit()
             try:
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
                 self.clean_depend_fields_edit(params, field)
                 self.fill_with_related(params, field, value)
@@ -3633,8 +3633,7 @@ class EditPositiveCases(object):
 
         sp = transaction.savepoint()
         try:
-            params = self.deepcopy(self.default_params_edit)
-            self.update_params(params)
+            params = self.get_default_params('edit')
             self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
             params.update(only_if_values)
             self.fill_required_if(params)
@@ -3657,7 +3656,7 @@ class EditPositiveCases(object):
         ИЛИ если среди проверяемых есть поля, зависящие от значений в других полях, и они требуют отдельной проверки
         """
         if (
-            not self.errors
+            not self.has_errors()
             and not set(fields_for_check).intersection(viewkeys(self._depend_one_of_fields_edit))
             and not need_one_by_one_check
         ):
@@ -3665,13 +3664,12 @@ class EditPositiveCases(object):
         if len(fields_for_check) == 1:
             self.formatted_assert_errors()
 
-        for field in fields_for_check:
+        for field in self.get_subcases(fields_for_check):
             value = max_value_params[field]
             sp = transaction.savepoint()
             obj_for_edit = self.get_obj_for_edit()
             try:
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
                 self.clean_depend_fields_edit(params, field)
                 self.fill_with_related(params, field, value)
@@ -3697,8 +3695,7 @@ class EditPositiveCases(object):
         Test max number of line in inline blocks
         """
         obj_for_edit = self.get_obj_for_edit()
-        params = self.deepcopy(self.default_params_edit)
-        self.update_params(params)
+        params = self.get_default_params('edit')
         self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
         for name, max_count in viewitems(self.max_blocks):
             self.fill_all_block_fields(
@@ -3724,15 +3721,14 @@ class EditPositiveCases(object):
             mail.outbox = []
 
         """Дальнейшие отдельные проверки только если не прошла совместная и полей много"""
-        if not self.errors:
+        if not self.has_errors():
             return
         if len(self.max_blocks.keys()) == 1:
             self.formatted_assert_errors()
 
         for name, max_count in viewitems(self.max_blocks):
             obj_for_edit = self.get_obj_for_edit()
-            params = self.deepcopy(self.default_params_edit)
-            self.update_params(params)
+            params = self.get_default_params('edit')
             self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
             self.fill_all_block_fields(
                 name,
@@ -3785,8 +3781,7 @@ class EditPositiveCases(object):
 
         sp = transaction.savepoint()
         try:
-            params = self.deepcopy(self.default_params_edit)
-            self.update_params(params)
+            params = self.get_default_params('edit')
             self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
             params.update(only_if_values)
             self.fill_required_if(params)
@@ -3809,7 +3804,7 @@ class EditPositiveCases(object):
         ИЛИ если среди проверяемых есть поля, зависящие от значений в других полях, и они требуют отдельной проверки
         """
         if (
-            not self.errors
+            not self.has_errors()
             and not set(fields_for_check).intersection(viewkeys(self._depend_one_of_fields_edit))
             and not need_one_by_one_check
         ):
@@ -3817,12 +3812,11 @@ class EditPositiveCases(object):
         if len(fields_for_check) == 1:
             self.formatted_assert_errors()
 
-        for field in fields_for_check:
+        for field in self.get_subcases(fields_for_check):
             sp = transaction.savepoint()
             try:
                 obj_for_edit = self.get_obj_for_edit()
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
                 self.clean_depend_fields_edit(params, field)
                 self.fill_with_related(params, field, max_count_params[field])
@@ -3876,8 +3870,7 @@ class EditPositiveCases(object):
 
         sp = transaction.savepoint()
         try:
-            params = self.deepcopy(self.default_params_edit)
-            self.update_params(params)
+            params = self.get_default_params('edit')
             self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
             params.update(only_if_values)
             self.fill_required_if(params)
@@ -3914,7 +3907,7 @@ class EditPositiveCases(object):
         ИЛИ если среди проверяемых есть поля, зависящие от значений в других полях, и они требуют отдельной проверки
         """
         if (
-            not self.errors
+            not self.has_errors()
             and not set(fields_for_check).intersection(viewkeys(self._depend_one_of_fields_edit))
             and not need_one_by_one_check
         ):
@@ -3922,39 +3915,33 @@ class EditPositiveCases(object):
         if len(fields_for_check) == 1:
             self.formatted_assert_errors()
 
-        for field in fields_for_check:
-            sp = transaction.savepoint()
-            try:
-                obj_for_edit = self.get_obj_for_edit()
-                field_dict = self.file_fields_params[field]
-                one_max_size = field_dict.get('one_max_size', '10M')
-                size = convert_size_to_bytes(one_max_size)
-                max_size = self.humanize_file_size(size)
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
-                self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
-                self.clean_depend_fields_edit(params, field)
+        def check(group):
+            obj_for_edit = self.get_obj_for_edit()
+            params = self.get_default_params('edit')
+            self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
+            for field in group:
                 self.fill_with_related(params, field, max_size_params[field])
                 if self.is_file_list(field):
                     for f in params[field]:
                         f.seek(0)
                 else:
                     params[field].seek(0)
-                response = self.send_edit_request(obj_for_edit.pk, params)
-                self.check_on_edit_success(response, locals())
-                new_object = self.get_obj_manager.get(pk=obj_for_edit.pk)
-                exclude = set(getattr(self, 'exclude_from_check_edit', [])).difference(
-                    [
-                        field,
-                    ]
-                )
-                self.assert_object_fields(new_object, params, exclude=exclude)
-            except Exception:
-                self.savepoint_rollback(sp)
-                self.errors_append(text='For file size %s (%s) in field %s' % (max_size, size, field))
-            finally:
-                self.del_files()
-                mail.outbox = []
+            response = self.send_edit_request(obj_for_edit.pk, params)
+            self.check_on_edit_success(response, locals())
+            new_object = self.get_obj_manager.get(pk=obj_for_edit.pk)
+            exclude = set(getattr(self, 'exclude_from_check_edit', [])).difference(group)
+            self.assert_object_fields(new_object, params, exclude=exclude)
+
+        def error_text(field):
+            size = convert_size_to_bytes(self.file_fields_params_edit[field].get('one_max_size', '10M'))
+            return 'For file size %s (%s) in field %s' % (self.humanize_file_size(size), size, field)
+
+        groups = self.get_compatible_fields_groups(fields_for_check, 'edit')
+        try:
+            for group in groups:
+                self.check_fields_by_bisection(group, check, error_text, failed=self.has_errors() and len(groups) == 1)
+        finally:
+            self.del_files()
 
     @only_with_obj
     @only_with('file_fields_params_edit')
@@ -3968,7 +3955,7 @@ class EditPositiveCases(object):
             for field, field_dict in viewitems(self.file_fields_params_edit)
             if field_dict.get('sum_max_size', None)
         ]
-        for field in fields_for_check:
+        for field in self.get_subcases(fields_for_check):
             sp = transaction.savepoint()
             try:
                 obj_for_edit = self.get_obj_for_edit()
@@ -3977,8 +3964,7 @@ class EditPositiveCases(object):
                 size = convert_size_to_bytes(sum_max_size)
                 max_size = self.humanize_file_size(size)
                 one_size = size / field_dict['max_count']
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
                 self.clean_depend_fields_edit(params, field)
                 f = self.get_random_file(field, size=one_size, count=field_dict['max_count'])
@@ -4014,7 +4000,7 @@ class EditPositiveCases(object):
         """
         Edit obj with some available extensions
         """
-        for field in list(self.file_fields_params_edit.keys()):
+        for field in self.get_subcases(list(self.file_fields_params_edit.keys())):
             field_dict = self.file_fields_params_edit[field]
             extensions = copy(field_dict.get('extensions', ()))
             if not extensions:
@@ -4025,8 +4011,7 @@ class EditPositiveCases(object):
                 filename = '.'.join([el for el in ['test', ext] if el])
                 f = self.get_random_file(field, filename=filename)
                 obj_for_edit = self.get_obj_for_edit()
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
                 self.clean_depend_fields_edit(params, field)
                 self.fill_with_related(params, field, f)
@@ -4053,15 +4038,14 @@ class EditPositiveCases(object):
         """
         Edit obj with minimum image file dimensions
         """
-        for field in list(self.file_fields_params_edit.keys()):
+        for field in self.get_subcases(list(self.file_fields_params_edit.keys())):
             field_dict = self.file_fields_params_edit[field]
             width = field_dict.get('min_width', 1)
             height = field_dict.get('min_height', 1)
             sp = transaction.savepoint()
             try:
                 obj_for_edit = self.get_obj_for_edit()
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
                 self.clean_depend_fields_edit(params, field)
                 f = self.get_random_file(field, width=width, height=height)
@@ -4088,15 +4072,14 @@ class EditPositiveCases(object):
         """
         Edit obj with maximum image file dimensions
         """
-        for field in list(self.file_fields_params_edit.keys()):
+        for field in self.get_subcases(list(self.file_fields_params_edit.keys())):
             field_dict = self.file_fields_params_edit[field]
             width = field_dict.get('max_width', 10000)
             height = field_dict.get('max_height', 10000)
             sp = transaction.savepoint()
             try:
                 obj_for_edit = self.get_obj_for_edit()
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
                 f = self.get_random_file(field, width=width, height=height)
                 self.clean_depend_fields_edit(params, field)
@@ -4129,7 +4112,7 @@ class EditPositiveCases(object):
         ] + self.get_all_not_str_fields('edit')
         other_fields.extend(list(getattr(self, 'file_fields_params_edit', {}).keys()))
 
-        fields_for_check = [k for k in self.all_fields_edit if re.sub(r'\-\d+\-', '-0-', k) not in other_fields]
+        fields_for_check = [k for k in self.all_fields_edit if normalize_field_name(k) not in other_fields]
         if not fields_for_check:
             self.skipTest('No any string fields')
 
@@ -4151,8 +4134,7 @@ class EditPositiveCases(object):
 
         try:
             obj_for_edit = self.get_obj_for_edit()
-            params = self.deepcopy(self.default_params_edit)
-            self.update_params(params)
+            params = self.get_default_params('edit')
             self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
             params.update(only_if_values)
             self.fill_required_if(params)
@@ -4174,7 +4156,7 @@ class EditPositiveCases(object):
         ИЛИ если среди проверяемых есть поля, зависящие от значений в других полях, и они требуют отдельной проверки
         """
         if (
-            not self.errors
+            not self.has_errors()
             and not set([el[0] for el in fields_for_check]).intersection(viewkeys(self._depend_one_of_fields_edit))
             and not need_one_by_one_check
         ):
@@ -4182,13 +4164,12 @@ class EditPositiveCases(object):
         if len(fields_for_check) == 1:
             self.formatted_assert_errors()
 
-        for field in fields_for_check:
+        for field in self.get_subcases(fields_for_check):
             """if unique fields"""
             mail.outbox = []
             try:
                 obj_for_edit = self.get_obj_for_edit()
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
                 self.clean_depend_fields_edit(params, field)
                 self.fill_with_related(params, field, test_params[field])
@@ -4243,8 +4224,7 @@ class EditPositiveCases(object):
 
         try:
             obj_for_edit = self.get_obj_for_edit()
-            params = self.deepcopy(self.default_params_edit)
-            self.update_params(params)
+            params = self.get_default_params('edit')
             self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
             params.update(only_if_values)
             self.fill_required_if(params)
@@ -4272,7 +4252,7 @@ class EditPositiveCases(object):
         ИЛИ если среди проверяемых есть поля, зависящие от значений в других полях, и они требуют отдельной проверки
         """
         if (
-            not self.errors
+            not self.has_errors()
             and not set(fields_for_check).intersection(viewkeys(self._depend_one_of_fields_edit))
             and not need_one_by_one_check
         ):
@@ -4280,12 +4260,11 @@ class EditPositiveCases(object):
         if len(fields_for_check) == 1:
             self.formatted_assert_errors()
 
-        for field, field_dict in fields_for_check:
+        for field, field_dict in self.get_subcases(fields_for_check):
             mail.outbox = []
             try:
                 obj_for_edit = self.get_obj_for_edit()
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
                 self.clean_depend_fields_edit(params, field)
                 self.fill_with_related(params, field, test_params[field])
@@ -4317,8 +4296,7 @@ class EditPositiveCases(object):
             values += (0,)
         for delta in values:
             obj_for_edit = self.get_obj_for_edit()
-            params = self.deepcopy(self.default_params_edit)
-            self.update_params(params)
+            params = self.get_default_params('edit')
             self.update_captcha_params(self.get_url(self.url_edit, (obj_for_edit.pk,)), params)
             start_value = self.get_value_for_field(None, start_field)
             self.fill_field(params, start_field, start_value)
@@ -4368,8 +4346,7 @@ class EditPositiveCases(object):
 
             for date_diff, time_diff in values:
                 obj_for_edit = self.get_obj_for_edit()
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 self.update_captcha_params(self.get_url(self.url_edit, (obj_for_edit.pk,)), params)
                 start_value = self.get_value_for_field(None, start_field)
                 if self.is_datetime_field(start_field):
@@ -4427,8 +4404,7 @@ class EditPositiveCases(object):
         Dependent required fields: main and dependent fields are empty
         """
         obj_for_edit = self.get_obj_for_edit()
-        params = self.deepcopy(self.default_params_edit)
-        self.update_params(params)
+        params = self.get_default_params('edit')
 
         required_if = self.get_all_required_if_fields(self.required_if_edit)
         for field in required_if['lead'] + required_if['dependent'] + required_if['related']:
@@ -4452,8 +4428,7 @@ class EditPositiveCases(object):
         Dependent required fields: empty main fields, filled dependent fields
         """
         obj_for_edit = self.get_obj_for_edit()
-        params = self.deepcopy(self.default_params_edit)
-        self.update_params(params)
+        params = self.get_default_params('edit')
 
         required_if = self.get_all_required_if_fields(self.required_if_edit)
 
@@ -4478,14 +4453,13 @@ class EditPositiveCases(object):
         """
         Проверка полей, возможность заполнения которых зависит от значения в другом поле
         """
-        for field, values in self.only_if_value_edit.items():
+        for field, values in self.get_subcases(self.only_if_value_edit.items()):
             if not isinstance(values, (list, tuple)):
                 values = [values]
 
             for value in values:
                 obj_for_edit = self.get_obj_for_edit()
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
 
                 params.update(value)
                 params[field] = self.get_value_for_field(None, field)
@@ -4509,14 +4483,13 @@ class EditPositiveCases(object):
         """
         if self.required_if_value_edit == self.only_if_value_edit:
             self.skipTest("Проверка выполняется в тесте test_add_object_related_filled_lead_with_value_positive")
-        for field, values in self.required_if_value_edit.items():
+        for field, values in self.get_subcases(self.required_if_value_edit.items()):
             if not isinstance(values, (list, tuple)):
                 values = [values]
 
             for value in values:
                 obj_for_edit = self.get_obj_for_edit()
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 for k in value.keys():
                     self.clean_depend_fields_edit(params, k)
 
@@ -4541,7 +4514,7 @@ class EditPositiveCases(object):
         Проверка полей, обязательность заполнения которых зависит от значения в другом поле.
         Поле, включающее обязательность, заполнено другим значением - связанное поле должно быть необязательным
         """
-        for field, values in self.required_if_value_edit.items():
+        for field, values in self.get_subcases(self.required_if_value_edit.items()):
             if not isinstance(values, (list, tuple)):
                 values = [values]
 
@@ -4549,8 +4522,7 @@ class EditPositiveCases(object):
                 for test_field, v in value.items():
                     additional_params = self.deepcopy(value)
                     obj_for_edit = self.get_obj_for_edit()
-                    params = self.deepcopy(self.default_params_edit)
-                    self.update_params(params)
+                    params = self.get_default_params('edit')
                     self.update_captcha_params(self.get_url(self.url_edit, (obj_for_edit.pk,)), params)
                     test_value = value.copy()
 
@@ -4599,15 +4571,14 @@ class EditPositiveCases(object):
             )
         ).difference(self.not_empty_fields_edit):
             self.skipTest("Нет полей для проверки")
-        for field, values in self.required_if_value_edit.items():
+        for field, values in self.get_subcases(self.required_if_value_edit.items()):
             if not isinstance(values, (list, tuple)):
                 values = [values]
 
             for value in values:
                 for k in set(value.keys()).difference(self.not_empty_fields_edit):
                     obj_for_edit = self.get_obj_for_edit()
-                    params = self.deepcopy(self.default_params_edit)
-                    self.update_params(params)
+                    params = self.get_default_params('edit')
 
                     additional_params = self.deepcopy(value)
                     self.set_empty_value_for_field(additional_params, k)
@@ -4628,17 +4599,17 @@ class EditPositiveCases(object):
 
 class EditNegativeCases(object):
     @only_with_obj
+    @form_validation_subcases
     def test_edit_object_empty_required_fields_negative(self):
         """
         Try edit object: empty required fields
         """
         message_type = 'empty_required'
-        for field in [f for f in self.not_empty_fields_edit if 'FORMS' not in f]:
+        for field in self.get_subcases([f for f in self.not_empty_fields_edit if 'FORMS' not in f]):
             sp = transaction.savepoint()
             obj_for_edit = self.get_obj_for_edit()
             try:
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
                 self.set_empty_value_for_field(params, field)
                 obj_for_edit = self.get_obj_manager.get(pk=obj_for_edit.pk)
@@ -4654,8 +4625,7 @@ class EditNegativeCases(object):
         for group in self.not_empty_related_fields_edit:
             sp = transaction.savepoint()
             obj_for_edit = self.get_obj_for_edit()
-            params = self.deepcopy(self.default_params_edit)
-            self.update_params(params)
+            params = self.get_default_params('edit')
             for field in group:
                 self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
                 self.set_empty_value_for_field(params, field)
@@ -4675,17 +4645,19 @@ class EditNegativeCases(object):
                 self.errors_append(text='For empty group "%s"' % force_text(group))
 
     @only_with_obj
+    @form_validation_subcases
     def test_edit_object_without_required_fields_negative(self):
         """
         Try edit object: required fields are not exists in params
         """
         message_type = 'without_required'
-        for field in [f for f in self.required_fields_edit if 'FORMS' not in f and not re.findall(r'.+?\-\d+\-.+?', f)]:
+        for field in self.get_subcases(
+            [f for f in self.required_fields_edit if 'FORMS' not in f and not re.findall(r'.+?\-\d+\-.+?', f)]
+        ):
             sp = transaction.savepoint()
             try:
                 obj_for_edit = self.get_obj_for_edit()
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
                 self.pop_field_from_params(params, field)
                 obj_for_edit = self.get_obj_manager.get(pk=obj_for_edit.pk)
@@ -4701,8 +4673,7 @@ class EditNegativeCases(object):
         for group in self.required_related_fields_edit:
             obj_for_edit = self.get_obj_for_edit()
             sp = transaction.savepoint()
-            params = self.deepcopy(self.default_params_edit)
-            self.update_params(params)
+            params = self.get_default_params('edit')
             for field in group:
                 self.pop_field_from_params(params, field)
             self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
@@ -4737,7 +4708,7 @@ class EditNegativeCases(object):
                     """for Django 1.11 admin"""
                     self.assertEqual(
                         self.get_all_form_messages(response),
-                        self.get_error_message('not_exist', '')[''],
+                        self.get_error_message('not_exist', '', locals=locals())[''],
                     )
             except Exception:
                 self.savepoint_rollback(sp)
@@ -4753,7 +4724,7 @@ class EditNegativeCases(object):
                     """for Django 1.11 admin"""
                     self.assertEqual(
                         self.get_all_form_messages(response),
-                        self.get_error_message('not_exist', '')[''],
+                        self.get_error_message('not_exist', '', locals=locals())[''],
                     )
             except Exception:
                 self.savepoint_rollback(sp)
@@ -4761,21 +4732,36 @@ class EditNegativeCases(object):
 
     @only_with_obj
     @only_with('max_fields_length')
+    @form_validation_subcases
     def test_edit_object_values_length_gt_max_negative(self):
         """
         Try edit object: values length > maximum
         """
         message_type = 'max_length'
         other_fields = list(getattr(self, 'digital_fields_edit', [])) + list(getattr(self, 'date_fields', []))
-        for field, length in [
+        fields_for_check = [
             (k, v) for k, v in viewitems(self.max_fields_length) if k in self.all_fields_edit and k not in other_fields
-        ]:
+        ]
+        if self.combine_negative_checks or self.concurrent_negative_checks:
+            checked = self.check_batched_negative_cases(
+                [
+                    (
+                        field,
+                        self.get_value_for_field(length + 1, field),
+                        message_type,
+                        {'length': length, 'current_length': length + 1},
+                    )
+                    for field, length in fields_for_check
+                ],
+                'edit',
+            )
+            fields_for_check = [(field, length) for field, length in fields_for_check if field not in dict(checked)]
+        for field, length in self.get_subcases(fields_for_check):
             current_length = length + 1
             sp = transaction.savepoint()
             try:
                 obj_for_edit = self.get_obj_for_edit()
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
                 self.clean_depend_fields_edit(params, field)
                 self.fill_with_related(params, field, self.get_value_for_field(current_length, field))
@@ -4797,21 +4783,25 @@ class EditNegativeCases(object):
 
     @only_with_obj
     @only_with('min_fields_length')
+    @form_validation_subcases
     def test_edit_object_values_length_lt_min_negative(self):
         """
         Try edit object: values length < minimum
         """
         message_type = 'min_length'
         other_fields = list(getattr(self, 'digital_fields_edit', [])) + list(getattr(self, 'date_fields', []))
-        for field, length in [
-            (k, v) for k, v in viewitems(self.min_fields_length) if k in self.all_fields_edit and k not in other_fields
-        ]:
+        for field, length in self.get_subcases(
+            [
+                (k, v)
+                for k, v in viewitems(self.min_fields_length)
+                if k in self.all_fields_edit and k not in other_fields
+            ]
+        ):
             current_length = length - 1
             sp = transaction.savepoint()
             try:
                 obj_for_edit = self.get_obj_for_edit()
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
                 self.clean_depend_fields_edit(params, field)
                 self.fill_with_related(params, field, self.get_value_for_field(current_length, field))
@@ -4827,13 +4817,32 @@ class EditNegativeCases(object):
                 )
 
     @only_with_obj
+    @form_validation_subcases
     def test_edit_object_with_wrong_choices_negative(self):
         """
         Try edit object: choice values to choices, that not exists
         """
         message_type = 'wrong_value'
-        for field in set(tuple(self.choice_fields_edit) + tuple(self.choice_fields_edit_with_value_in_error)):
-            for value in self.custom_wrong_values.get(field, ('qwe', '12345678', 'йцу')):
+        fields_for_check = set(tuple(self.choice_fields_edit) + tuple(self.choice_fields_edit_with_value_in_error))
+        checked = []
+        if self.combine_negative_checks or self.concurrent_negative_checks:
+            checked = self.check_batched_negative_cases(
+                [
+                    (
+                        field,
+                        value,
+                        message_type,
+                        {'value': value} if field in self.choice_fields_edit_with_value_in_error else {},
+                    )
+                    for field in fields_for_check
+                    for value in self.custom_wrong_values.get(field, WRONG_CHOICE_VALUES)
+                ],
+                'edit',
+            )
+        for field in self.get_subcases(fields_for_check):
+            for value in self.custom_wrong_values.get(field, WRONG_CHOICE_VALUES):
+                if (field, value) in checked:
+                    continue
                 obj_for_edit = self.get_obj_for_edit()
                 params = self.deepcopy(self.default_params_edit)
                 self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
@@ -4854,13 +4863,14 @@ class EditNegativeCases(object):
 
     @only_with_obj
     @only_with(('multiselect_fields_edit',))
+    @form_validation_subcases
     def test_edit_object_with_wrong_multiselect_choices_negative(self):
         """
         Try edit object: choice values to multiselect, that not exists
         """
         message_type = 'wrong_value'
-        for field in self.multiselect_fields_edit:
-            for value in self.custom_wrong_values.get(field, ('qwe', '12345678', 'йцу')):
+        for field in self.get_subcases(self.multiselect_fields_edit):
+            for value in self.custom_wrong_values.get(field, WRONG_CHOICE_VALUES):
                 obj_for_edit = self.get_obj_for_edit()
                 params = self.deepcopy(self.default_params_edit)
                 self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
@@ -4885,6 +4895,7 @@ class EditNegativeCases(object):
 
     @only_with_obj
     @only_with(('unique_fields_edit',))
+    @form_validation_subcases
     def test_edit_object_unique_already_exists_negative(self):
         """
         Try change object unique field values, to values, that already used in other objects
@@ -4896,8 +4907,7 @@ class EditNegativeCases(object):
             obj_for_edit = self.get_obj_for_edit()
             existing_obj = self.get_other_obj_with_filled(el, obj_for_edit)
             sp = transaction.savepoint()
-            params = self.deepcopy(self.default_params_edit)
-            self.update_params(params)
+            params = self.get_default_params('edit')
             self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
             for el_field in el:
                 if el_field not in self.all_fields_edit:
@@ -4914,6 +4924,7 @@ class EditNegativeCases(object):
                     message_type,
                     field if not field.endswith(self.non_field_error_key) else el,
                     error_field=field,
+                    locals=locals(),
                 )
                 self.assert_errors(response, error_message)
                 self.check_on_edit_error(response, obj_for_edit, locals())
@@ -4967,6 +4978,7 @@ class EditNegativeCases(object):
                     message_type,
                     field if not field.endswith(self.non_field_error_key) else el,
                     error_field=field,
+                    locals=locals(),
                 )
                 self.assert_errors(response, error_message)
                 self.check_on_edit_error(response, obj_for_edit, locals())
@@ -4990,18 +5002,30 @@ class EditNegativeCases(object):
 
     @only_with_obj
     @only_with(('digital_fields_edit',))
+    @form_validation_subcases
     def test_edit_object_wrong_values_in_digital_negative(self):
         """
         Try edit object: wrong values in digital fields
         """
-        for field in self.digital_fields_edit:
+        checked = []
+        if self.combine_negative_checks or self.concurrent_negative_checks:
+            checked = self.check_batched_negative_cases(
+                [
+                    (field, value, 'wrong_value_int' if field in self.int_fields_edit else 'wrong_value_digital', {})
+                    for field in self.digital_fields_edit
+                    for value in self.custom_wrong_values.get(field, WRONG_DIGITAL_VALUES)
+                ],
+                'edit',
+            )
+        for field in self.get_subcases(self.digital_fields_edit):
             message_type = 'wrong_value_int' if field in self.int_fields_edit else 'wrong_value_digital'
-            for value in self.custom_wrong_values.get(field, ('q', 'й', 'NaN', 'inf', '-inf', '²')):
+            for value in self.custom_wrong_values.get(field, WRONG_DIGITAL_VALUES):
+                if (field, value) in checked:
+                    continue
                 sp = transaction.savepoint()
                 try:
                     obj_for_edit = self.get_obj_for_edit()
-                    params = self.deepcopy(self.default_params_edit)
-                    self.update_params(params)
+                    params = self.get_default_params('edit')
                     self.update_captcha_params(
                         self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)),
                         params,
@@ -5019,18 +5043,18 @@ class EditNegativeCases(object):
 
     @only_with_obj
     @only_with(('email_fields_edit',))
+    @form_validation_subcases
     def test_edit_object_wrong_values_in_email_negative(self):
         """
         Try edit object: wrong values in email fields
         """
         message_type = 'wrong_value_email'
-        for field in self.email_fields_edit:
-            for value in self.custom_wrong_values.get(field, ('q', 'й', 'qwe@rty', 'qw@йц', '@qwe', 'qwe@')):
+        for field in self.get_subcases(self.email_fields_edit):
+            for value in self.custom_wrong_values.get(field, WRONG_EMAIL_VALUES):
                 sp = transaction.savepoint()
                 try:
                     obj_for_edit = self.get_obj_for_edit()
-                    params = self.deepcopy(self.default_params_edit)
-                    self.update_params(params)
+                    params = self.get_default_params('edit')
                     self.update_captcha_params(
                         self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)),
                         params,
@@ -5048,19 +5072,19 @@ class EditNegativeCases(object):
 
     @only_with_obj
     @only_with(('digital_fields_edit',))
+    @form_validation_subcases
     def test_edit_object_value_gt_max_in_digital_negative(self):
         """
         Try edit object: value in digital fields > max
         """
         message_type = 'max_length_digital'
-        for field in [f for f in self.digital_fields_edit]:
+        for field in self.get_subcases([f for f in self.digital_fields_edit]):
             max_value = min(self.get_digital_values_range(field)['max_values'])
             for value in self.get_gt_max_list(field, self.get_digital_values_range(field)['max_values']):
                 sp = transaction.savepoint()
                 try:
                     obj_for_edit = self.get_obj_for_edit()
-                    params = self.deepcopy(self.default_params_edit)
-                    self.update_params(params)
+                    params = self.get_default_params('edit')
                     self.update_captcha_params(
                         self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)),
                         params,
@@ -5078,19 +5102,19 @@ class EditNegativeCases(object):
 
     @only_with_obj
     @only_with(('digital_fields_edit',))
+    @form_validation_subcases
     def test_edit_object_value_lt_min_in_digital_negative(self):
         """
         Try edit object: value in digital fields < min
         """
         message_type = 'min_length_digital'
-        for field in [f for f in self.digital_fields_edit]:
+        for field in self.get_subcases([f for f in self.digital_fields_edit]):
             min_value = max(self.get_digital_values_range(field)['min_values'])
             for value in self.get_lt_min_list(field, self.get_digital_values_range(field)['min_values']):
                 sp = transaction.savepoint()
                 try:
                     obj_for_edit = self.get_obj_for_edit()
-                    params = self.deepcopy(self.default_params_edit)
-                    self.update_params(params)
+                    params = self.get_default_params('edit')
                     self.update_captcha_params(
                         self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)),
                         params,
@@ -5112,12 +5136,11 @@ class EditNegativeCases(object):
         """
         Try change values in disabled fields
         """
-        for field in self.disabled_fields_edit:
+        for field in self.get_subcases(self.disabled_fields_edit):
             sp = transaction.savepoint()
             try:
                 obj_for_edit = self.get_obj_for_edit()
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
                 self.clean_depend_fields_edit(params, field)
                 value = params.get(field, None)
@@ -5143,6 +5166,7 @@ class EditNegativeCases(object):
 
     @only_with_obj
     @only_with(('one_of_fields_edit',))
+    @form_validation_subcases
     def test_edit_object_one_of_fields_all_filled_negative(self):
         """
         Try edit object: fill all fields, that should be filled singly
@@ -5157,8 +5181,7 @@ class EditNegativeCases(object):
                 sp = transaction.savepoint()
                 try:
                     obj_for_edit = self.get_obj_for_edit()
-                    params = self.deepcopy(self.default_params_edit)
-                    self.update_params(params)
+                    params = self.get_default_params('edit')
                     self.fill_all_fields(filled_group, params)
                     self.update_captcha_params(
                         self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)),
@@ -5184,8 +5207,7 @@ class EditNegativeCases(object):
         message_type = 'max_block_count'
         for name, max_count in viewitems(self.max_blocks):
             obj_for_edit = self.get_obj_for_edit()
-            params = self.deepcopy(self.default_params_edit)
-            self.update_params(params)
+            params = self.get_default_params('edit')
             self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
             gt_max_count = max_count + 1
             self.fill_all_block_fields(
@@ -5208,6 +5230,7 @@ class EditNegativeCases(object):
     @only_with_obj
     @only_with('file_fields_params_edit')
     @only_with_files_params('max_count')
+    @form_validation_subcases
     def test_edit_object_many_files_negative(self):
         """
         Try edit obj with files count > max files count
@@ -5216,15 +5239,14 @@ class EditNegativeCases(object):
         fields_for_check = [
             field for field, field_dict in viewitems(self.file_fields_params_edit) if field_dict.get('max_count', 1) > 1
         ]
-        for field in fields_for_check:
+        for field in self.get_subcases(fields_for_check):
             sp = transaction.savepoint()
             try:
                 obj_for_edit = self.get_obj_for_edit()
                 field_dict = self.file_fields_params_edit[field]
                 max_count = field_dict['max_count']
                 current_count = max_count + 1
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
                 self.clean_depend_fields_edit(params, field)
                 filename = '.'.join(
@@ -5253,6 +5275,7 @@ class EditNegativeCases(object):
     @only_with_obj
     @only_with('file_fields_params_edit')
     @only_with_files_params('one_max_size')
+    @form_validation_subcases
     def test_edit_object_big_file_negative(self):
         """
         Try edit obj with file size > max one file size
@@ -5263,7 +5286,7 @@ class EditNegativeCases(object):
             for field, field_dict in viewitems(self.file_fields_params_edit)
             if field_dict.get('one_max_size', None)
         ]
-        for field in fields_for_check:
+        for field in self.get_subcases(fields_for_check):
             sp = transaction.savepoint()
             try:
                 obj_for_edit = self.get_obj_for_edit()
@@ -5273,8 +5296,7 @@ class EditNegativeCases(object):
                 max_size = self.humanize_file_size(size)
                 current_size = size + 100
                 human_current_size = self.humanize_file_size(current_size)
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
                 self.clean_depend_fields_edit(params, field)
                 f = self.get_random_file(field, size=current_size)
@@ -5299,6 +5321,7 @@ class EditNegativeCases(object):
     @only_with_obj
     @only_with('file_fields_params_edit')
     @only_with_files_params('sum_max_size')
+    @form_validation_subcases
     def test_edit_object_big_summary_file_size_negative(self):
         """
         Try edit obj with summary files size > max summary file size
@@ -5309,7 +5332,7 @@ class EditNegativeCases(object):
             for field, field_dict in viewitems(self.file_fields_params_edit)
             if field_dict.get('sum_max_size', None)
         ]
-        for field in fields_for_check:
+        for field in self.get_subcases(fields_for_check):
             sp = transaction.savepoint()
             try:
                 obj_for_edit = self.get_obj_for_edit()
@@ -5320,8 +5343,7 @@ class EditNegativeCases(object):
                 max_size = self.humanize_file_size(size)
                 one_size = current_size / field_dict['max_count']
                 human_current_size = self.humanize_file_size(current_size)
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
                 self.clean_depend_fields_edit(params, field)
                 params[field] = []
@@ -5351,17 +5373,17 @@ class EditNegativeCases(object):
 
     @only_with_obj
     @only_with('file_fields_params_edit')
+    @form_validation_subcases
     def test_edit_object_empty_file_negative(self):
         """
         Try edit obj with file size = 0M
         """
         message_type = 'empty_file'
-        for field in list(self.file_fields_params_edit.keys()):
+        for field in self.get_subcases(list(self.file_fields_params_edit.keys())):
             sp = transaction.savepoint()
             try:
                 obj_for_edit = self.get_obj_for_edit()
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
                 self.clean_depend_fields_edit(params, field)
                 f = self.get_random_file(field, size=0)
@@ -5381,12 +5403,13 @@ class EditNegativeCases(object):
     @only_with_obj
     @only_with('file_fields_params_edit')
     @only_with_files_params('extensions')
+    @form_validation_subcases
     def test_edit_object_wrong_file_extensions_negative(self):
         """
         Edit obj with wrong extensions
         """
         message_type = 'wrong_extension'
-        for field in list(self.file_fields_params_edit.keys()):
+        for field in self.get_subcases(list(self.file_fields_params_edit.keys())):
             field_dict = self.file_fields_params_edit[field]
             extensions = copy(field_dict.get('extensions', ()))
             if not extensions:
@@ -5399,8 +5422,7 @@ class EditNegativeCases(object):
                 filename = '.'.join([el for el in ['test', ext] if el])
                 sp = transaction.savepoint()
                 obj_for_edit = self.get_obj_for_edit()
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 self.update_captcha_params(self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)), params)
                 self.clean_depend_fields_edit(params, field)
                 f = self.get_random_file(field, filename=filename)
@@ -5420,12 +5442,13 @@ class EditNegativeCases(object):
     @only_with_obj
     @only_with('file_fields_params_edit')
     @only_with_any_files_params(['min_width', 'min_height'])
+    @form_validation_subcases
     def test_edit_object_image_dimensions_lt_min_negative(self):
         """
         Edit obj with image file dimensions < minimum
         """
         message_type = 'min_dimensions'
-        for field in list(self.file_fields_params_edit.keys()):
+        for field in self.get_subcases(list(self.file_fields_params_edit.keys())):
             field_dict = self.file_fields_params_edit[field]
             values = ()
             min_width = field_dict.get('min_width', None)
@@ -5439,8 +5462,7 @@ class EditNegativeCases(object):
                 sp = transaction.savepoint()
                 try:
                     obj_for_edit = self.get_obj_for_edit()
-                    params = self.deepcopy(self.default_params_edit)
-                    self.update_params(params)
+                    params = self.get_default_params('edit')
                     self.update_captcha_params(
                         self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)),
                         params,
@@ -5463,12 +5485,13 @@ class EditNegativeCases(object):
     @only_with_obj
     @only_with('file_fields_params_edit')
     @only_with_any_files_params(['max_width', 'max_height'])
+    @form_validation_subcases
     def test_edit_object_image_dimensions_gt_max_negative(self):
         """
         Edit obj with image file dimensions > maximum
         """
         message_type = 'max_dimensions'
-        for field in list(self.file_fields_params_edit.keys()):
+        for field in self.get_subcases(list(self.file_fields_params_edit.keys())):
             field_dict = self.file_fields_params_edit[field]
             values = ()
             max_width = field_dict.get('max_width', None)
@@ -5492,8 +5515,7 @@ class EditNegativeCases(object):
                 sp = transaction.savepoint()
                 try:
                     obj_for_edit = self.get_obj_for_edit()
-                    params = self.deepcopy(self.default_params_edit)
-                    self.update_params(params)
+                    params = self.get_default_params('edit')
                     self.update_captcha_params(
                         self.get_url_for_negative(self.url_edit, (obj_for_edit.pk,)),
                         params,
@@ -5519,8 +5541,7 @@ class EditNegativeCases(object):
             values += (0,)
         for delta in values:
             obj_for_edit = self.get_obj_for_edit()
-            params = self.deepcopy(self.default_params_edit)
-            self.update_params(params)
+            params = self.get_default_params('edit')
             self.update_captcha_params(self.get_url(self.url_edit, (obj_for_edit.pk,)), params)
             start_value = self.get_value_for_field(None, start_field)
             self.fill_field(params, start_field, start_value)
@@ -5543,6 +5564,7 @@ class EditNegativeCases(object):
 
     @only_with_obj
     @only_with('intervals')
+    @form_validation_subcases
     def test_edit_object_some_intervals_negative(self):
         """
         Wrong intervals checks
@@ -5570,8 +5592,7 @@ class EditNegativeCases(object):
 
             for date_diff, time_diff in values:
                 obj_for_edit = self.get_obj_for_edit()
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 self.update_captcha_params(self.get_url(self.url_edit, (obj_for_edit.pk,)), params)
                 start_value = self.get_value_for_field(None, start_field)
                 if self.is_datetime_field(start_field):
@@ -5622,6 +5643,7 @@ class EditNegativeCases(object):
 
     @only_with_obj
     @only_with('required_if_edit')
+    @form_validation_subcases
     def test_edit_object_empty_related_required_negative(self):
         """
         Dependent required fields: filled main fields, not filled dependent fields
@@ -5632,15 +5654,16 @@ class EditNegativeCases(object):
         for lead, dependent in viewitems(self.required_if_edit):
 
             """only simple fields"""
-            for field in [
-                f
-                for f in (dependent if isinstance(dependent, (list, tuple)) else (dependent,))
-                if not isinstance(f, (list, tuple))
-            ]:
+            for field in self.get_subcases(
+                [
+                    f
+                    for f in (dependent if isinstance(dependent, (list, tuple)) else (dependent,))
+                    if not isinstance(f, (list, tuple))
+                ]
+            ):
                 try:
                     obj_for_edit = self.get_obj_for_edit()
-                    params = self.deepcopy(self.default_params_edit)
-                    self.update_params(params)
+                    params = self.get_default_params('edit')
                     self.update_captcha_params(self.get_url(self.url_edit, (obj_for_edit.pk,)), params)
                     self.fill_all_fields(
                         (lead if isinstance(lead, (list, tuple)) else (lead,)) + related,
@@ -5662,8 +5685,7 @@ class EditNegativeCases(object):
                 if isinstance(f, (list, tuple))
             ]:
                 obj_for_edit = self.get_obj_for_edit()
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 self.update_captcha_params(self.get_url(self.url_edit, (obj_for_edit.pk,)), params)
                 self.fill_all_fields(
                     (lead if isinstance(lead, (list, tuple)) else (lead,)) + related,
@@ -5682,21 +5704,21 @@ class EditNegativeCases(object):
 
     @only_with_obj
     @only_with('only_if_value_edit')
+    @form_validation_subcases
     def test_edit_object_related_filled_lead_with_other_value_negative(self):
         """
         Проверка полей, возможность заполнения которых зависит от значения в другом поле.
         Поле-инициатор заполнено другим значением
         """
         message_type = 'wrong_only_if_value'
-        for field, values in self.only_if_value_edit.items():
+        for field, values in self.get_subcases(self.only_if_value_edit.items()):
             if not isinstance(values, (list, tuple)):
                 values = [values]
 
             for value in values:
                 for test_field, v in value.items():
                     obj_for_edit = self.get_obj_for_edit()
-                    params = self.deepcopy(self.default_params_edit)
-                    self.update_params(params)
+                    params = self.get_default_params('edit')
                     additional_params = self.deepcopy(value)
                     test_value = value.copy()
                     n = 0
@@ -5724,20 +5746,20 @@ class EditNegativeCases(object):
 
     @only_with_obj
     @only_with('required_if_value_edit')
+    @form_validation_subcases
     def test_edit_object_related_empty_lead_with_value_negative(self):
         """
         Проверка полей, обязательность заполнения которых зависит от значения в другом поле.
         Поле-инициатор заполнено значением, зависимое поле не заполнено
         """
         message_type = 'empty_required'
-        for field, values in self.required_if_value_edit.items():
+        for field, values in self.get_subcases(self.required_if_value_edit.items()):
             if not isinstance(values, (list, tuple)):
                 values = [values]
 
             for value in values:
                 obj_for_edit = self.get_obj_for_edit()
-                params = self.deepcopy(self.default_params_edit)
-                self.update_params(params)
+                params = self.get_default_params('edit')
                 for k in value.keys():
                     self.clean_depend_fields_edit(params, k)
                 params.update(value)
@@ -5752,6 +5774,14 @@ class EditNegativeCases(object):
                 except Exception:
                     self.errors_append(text='%s=%s\n%s' % (field, params.get(field), value))
 
+    @only_with_obj
+    @only_with('fuzzing_time_budget')
+    def test_edit_object_fuzzing(self):
+        """
+        Edit object: random valid and boundary invalid values during fuzzing_time_budget seconds
+        """
+        self.run_fuzzing('edit')
+
 
 class DeletePositiveCases(object):
     @only_with_obj
@@ -5821,7 +5851,7 @@ class DeleteNegativeCases(object):
                     """for Django 1.11 admin"""
                     self.assertEqual(
                         self.get_all_form_messages(response),
-                        self.get_error_message('not_exist', '')[''],
+                        self.get_error_message('not_exist', '', locals=locals())[''],
                     )
             except Exception:
                 self.savepoint_rollback(sp)
@@ -5933,7 +5963,7 @@ class RemoveNegativeCases(object):
                     'Redirect was %s' % response.redirect_chain[0][0],
                 )
                 self.assert_status_code(response.status_code, 200)
-                error_message = self.get_error_message('delete_not_exists', None)
+                error_message = self.get_error_message('delete_not_exists', None, locals=locals())
                 self.assertEqual(self.get_all_form_messages(response), [error_message])
             except Exception:
                 self.errors_append(text='For value "%s" error' % value)
@@ -5954,7 +5984,7 @@ class RemoveNegativeCases(object):
                     'Redirect was %s' % response.redirect_chain[0][0],
                 )
                 self.assert_status_code(response.status_code, 200)
-                error_message = self.get_error_message('recovery_not_exists', None)
+                error_message = self.get_error_message('recovery_not_exists', None, locals=locals())
                 self.assertEqual(self.get_all_form_messages(response), [error_message])
             except Exception:
                 self.errors_append(text='For value "%s" error' % value)
@@ -5997,7 +6027,7 @@ class RemoveNegativeCases(object):
                 """for Django 1.11 admin"""
                 self.assertEqual(
                     self.get_all_form_messages(response),
-                    self.get_error_message('not_exist', '')[''],
+                    self.get_error_message('not_exist', '', locals=locals())[''],
                 )
         except Exception:
             self.errors_append()
@@ -6169,9 +6199,11 @@ class ChangePasswordNegativeCases(object):
         Try change password: empty required fields
         """
         message_type = 'empty_required'
-        for field in filter(
-            None,
-            [self.field_old_password, self.field_password, self.field_password_repeat],
+        for field in self.get_subcases(
+            filter(
+                None,
+                [self.field_old_password, self.field_password, self.field_password_repeat],
+            )
         ):
             user = self.get_obj_for_edit()
             try:
@@ -6196,9 +6228,11 @@ class ChangePasswordNegativeCases(object):
         Try change password: without required fields
         """
         message_type = 'without_required'
-        for field in filter(
-            None,
-            [self.field_old_password, self.field_password, self.field_password_repeat],
+        for field in self.get_subcases(
+            filter(
+                None,
+                [self.field_old_password, self.field_password, self.field_password_repeat],
+            )
         ):
             user = self.get_obj_for_edit()
             try:
@@ -6238,7 +6272,7 @@ class ChangePasswordNegativeCases(object):
             self.check_negative(user, params, response)
             self.assert_errors(
                 response,
-                self.get_error_message('wrong_password_repeat', self.field_password_repeat),
+                self.get_error_message('wrong_password_repeat', self.field_password_repeat, locals=locals()),
             )
         except Exception:
             self.errors_append(
@@ -6266,6 +6300,7 @@ class ChangePasswordNegativeCases(object):
             error_message = self.get_error_message(
                 'min_length',
                 self.field_password,
+                locals=locals(),
             )
             self.assert_errors(response, error_message)
         except Exception:
@@ -6292,6 +6327,7 @@ class ChangePasswordNegativeCases(object):
             error_message = self.get_error_message(
                 'max_length',
                 self.field_password,
+                locals=locals(),
             )
             self.assert_errors(response, error_message)
         except Exception:
@@ -6316,6 +6352,7 @@ class ChangePasswordNegativeCases(object):
                 error_message = self.get_error_message(
                     'wrong_value',
                     self.field_password,
+                    locals=locals(),
                 )
                 self.assert_errors(response, error_message)
             except Exception:
@@ -6339,7 +6376,7 @@ class ChangePasswordNegativeCases(object):
             self.check_negative(user, params, response)
             self.assert_errors(
                 response,
-                self.get_error_message('wrong_old_password', self.field_old_password),
+                self.get_error_message('wrong_old_password', self.field_old_password, locals=locals()),
             )
         except Exception:
             self.errors_append()
@@ -6360,7 +6397,7 @@ class ChangePasswordNegativeCases(object):
             if change_type == 'add_after':
                 return value + get_randname(1, 'w')
 
-        for field in self.password_similar_fields:
+        for field in self.get_subcases(self.password_similar_fields):
             user_field_name = getattr(self.get_field_by_name(self.obj, field), 'verbose_name', field)
             for change_type in ('', 'swapcase', 'add_before', 'add_after'):
                 user = self.get_obj_for_edit()
@@ -6491,6 +6528,8 @@ class ResetPasswordPositiveCases(object):
         """
         Reset password before code expired
         """
+        from freezegun import freeze_time
+
         user = self.get_obj_for_edit()
         now = datetime.now()
         old_date = datetime.now() - timedelta(days=self.code_lifedays)
@@ -6533,7 +6572,7 @@ class ResetPasswordPositiveCases(object):
                 self.errors_append(text='For visible fields')
 
             fields_helptext = getattr(self, 'fields_helptext_add', {})
-            for field_name, text in viewitems(fields_helptext):
+            for field_name, text in self.get_subcases(viewitems(fields_helptext)):
                 if field_name not in self.change_fields:
                     continue
                 try:
@@ -6550,7 +6589,7 @@ class ResetPasswordNegativeCases(object):
         """
         Request password change code with empty required fields
         """
-        for field in self.request_fields:
+        for field in self.get_subcases(self.request_fields):
             params = self.deepcopy(self.request_password_params)
             self.update_captcha_params(self.get_url(self.url_reset_password_request), params)
             self.set_empty_value_for_field(params, field)
@@ -6558,7 +6597,7 @@ class ResetPasswordNegativeCases(object):
                 response = self.send_reset_password_request(params)
                 self.assert_errors(
                     response,
-                    self.get_error_message('required', field),
+                    self.get_error_message('required', field, locals=locals()),
                 )
             except Exception:
                 self.errors_append(text='For empty field %s' % field)
@@ -6567,7 +6606,7 @@ class ResetPasswordNegativeCases(object):
         """
         Request password change code without required fields
         """
-        for field in self.request_fields:
+        for field in self.get_subcases(self.request_fields):
             params = self.deepcopy(self.request_password_params)
             self.update_captcha_params(self.get_url(self.url_reset_password_request), params)
             self.pop_field_from_params(params, field)
@@ -6575,7 +6614,7 @@ class ResetPasswordNegativeCases(object):
                 response = self.send_reset_password_request(params)
                 self.assert_errors(
                     response,
-                    self.get_error_message('required', field),
+                    self.get_error_message('required', field, locals=locals()),
                 )
             except Exception:
                 self.errors_append(text='Without field %s' % field)
@@ -6585,7 +6624,7 @@ class ResetPasswordNegativeCases(object):
         """
         Try reset password with wrong email value
         """
-        for value in self.custom_wrong_values.get(self.field_username, ('q', 'й', 'qwe@rty', 'qw@йц', '@qwe', 'qwe@')):
+        for value in self.custom_wrong_values.get(self.field_username, WRONG_EMAIL_VALUES):
             params = self.deepcopy(self.request_password_params)
             self.update_captcha_params(self.get_url(self.url_reset_password_request), params)
             params[self.field_username] = value
@@ -6593,7 +6632,7 @@ class ResetPasswordNegativeCases(object):
                 response = self.send_reset_password_request(params)
                 self.assert_errors(
                     response,
-                    self.get_error_message('wrong_value_email', self.field_username),
+                    self.get_error_message('wrong_value_email', self.field_username, locals=locals()),
                 )
             except Exception:
                 self.errors_append(text='For email %s' % value)
@@ -6612,7 +6651,7 @@ class ResetPasswordNegativeCases(object):
             response = self.send_reset_password_request(params)
             self.assert_errors(
                 response,
-                self.get_error_message('wrong_value_email', self.field_username),
+                self.get_error_message('wrong_value_email', self.field_username, locals=locals()),
             )
             self.check_blacklist_on_negative(response, False)
         except Exception:
@@ -6647,7 +6686,7 @@ class ResetPasswordNegativeCases(object):
             response = self.send_reset_password_request(params)
             self.assert_errors(
                 response,
-                self.get_error_message('user_not_exists', self.field_username),
+                self.get_error_message('user_not_exists', self.field_username, locals=locals()),
             )
             self.assert_mail_count(mail.outbox, 0)
         except Exception:
@@ -6684,7 +6723,7 @@ class ResetPasswordNegativeCases(object):
             response = self.send_reset_password_request(params)
             self.assert_errors(
                 response,
-                self.get_error_message('inactive_user', self.field_username),
+                self.get_error_message('inactive_user', self.field_username, locals=locals()),
             )
             self.assert_mail_count(mail.outbox, 0)
         except Exception:
@@ -6695,7 +6734,7 @@ class ResetPasswordNegativeCases(object):
         """
         Try reset password with wrong captcha value
         """
-        for field in ('captcha_0', 'captcha_1'):
+        for field in self.get_subcases(('captcha_0', 'captcha_1')):
             for value in self.custom_wrong_values.get(field, (u'йцу', u'\r', u'\n', u' ', ':')):
                 self.clean_blacklist()
                 self.set_host_blacklist(host='127.0.0.1', count=self.request_reset_retries or 1)
@@ -6709,7 +6748,7 @@ class ResetPasswordNegativeCases(object):
                     response = self.send_reset_password_request(params)
                     self.assert_errors(
                         response,
-                        self.get_error_message('wrong_captcha', 'captcha'),
+                        self.get_error_message('wrong_captcha', 'captcha', locals=locals()),
                     )
                     self.assert_mail_count(mail.outbox, 0)
                 except Exception:
@@ -6744,7 +6783,7 @@ class ResetPasswordNegativeCases(object):
         """
         Try change password with empty required fields
         """
-        for field in self.change_fields:
+        for field in self.get_subcases(self.change_fields):
             user = self.get_obj_for_edit()
             user.set_password(self.current_password)
             user.save()
@@ -6756,7 +6795,7 @@ class ResetPasswordNegativeCases(object):
                 response = self.send_change_after_reset_password_request(codes, params)
                 self.assert_errors(
                     response,
-                    self.get_error_message('required', field),
+                    self.get_error_message('required', field, locals=locals()),
                 )
                 new_user = self.get_obj_manager.get(pk=user.pk)
                 self.assert_objects_equal(new_user, user)
@@ -6767,7 +6806,7 @@ class ResetPasswordNegativeCases(object):
         """
         Try change password without required fields
         """
-        for field in self.change_fields:
+        for field in self.get_subcases(self.change_fields):
             user = self.get_obj_for_edit()
             user.set_password(self.current_password)
             user.save()
@@ -6779,7 +6818,7 @@ class ResetPasswordNegativeCases(object):
                 response = self.send_change_after_reset_password_request(codes, params)
                 self.assert_errors(
                     response,
-                    self.get_error_message('required', field),
+                    self.get_error_message('required', field, locals=locals()),
                 )
                 new_user = self.get_obj_manager.get(pk=user.pk)
                 self.assert_objects_equal(new_user, user)
@@ -6806,7 +6845,7 @@ class ResetPasswordNegativeCases(object):
             self.assert_objects_equal(new_user, user)
             self.assert_errors(
                 response,
-                self.get_error_message('wrong_password_repeat', self.field_password_repeat),
+                self.get_error_message('wrong_password_repeat', self.field_password_repeat, locals=locals()),
             )
         except Exception:
             self.errors_append(
@@ -6832,7 +6871,7 @@ class ResetPasswordNegativeCases(object):
             self.assert_objects_equal(new_user, user)
             self.assert_errors(
                 response,
-                self.get_error_message('min_length', self.field_password),
+                self.get_error_message('min_length', self.field_password, locals=locals()),
             )
         except Exception:
             self.errors_append(text='New password "%s"' % params[self.field_password])
@@ -6856,7 +6895,7 @@ class ResetPasswordNegativeCases(object):
             self.assert_objects_equal(new_user, user)
             self.assert_errors(
                 response,
-                self.get_error_message('max_length', self.field_password),
+                self.get_error_message('max_length', self.field_password, locals=locals()),
             )
         except Exception:
             self.errors_append(text='New password "%s"' % params[self.field_password])
@@ -6878,7 +6917,7 @@ class ResetPasswordNegativeCases(object):
                 self.assert_objects_equal(new_user, user)
                 self.assert_errors(
                     response,
-                    self.get_error_message('wrong_value', self.field_password),
+                    self.get_error_message('wrong_value', self.field_password, locals=locals()),
                 )
             except Exception:
                 self.errors_append(text='New password "%s"' % value)
@@ -6898,7 +6937,7 @@ class ResetPasswordNegativeCases(object):
             self.assert_objects_equal(new_user, user)
             self.assert_errors(
                 response,
-                self.get_error_message('inactive_user', self.field_password),
+                self.get_error_message('inactive_user', self.field_password, locals=locals()),
             )
         except Exception:
             self.errors_append()
@@ -6908,6 +6947,8 @@ class ResetPasswordNegativeCases(object):
         """
         Try reset password by old link
         """
+        from freezegun import freeze_time
+
         user = self.get_obj_for_edit()
         old_date = datetime.now() - timedelta(days=self.code_lifedays + 1)
         with freeze_time(old_date):
@@ -6934,7 +6975,7 @@ class ResetPasswordNegativeCases(object):
             if change_type == 'add_after':
                 return value + get_randname(1, 'w')
 
-        for field in self.password_similar_fields:
+        for field in self.get_subcases(self.password_similar_fields):
             user_field_name = getattr(self.get_field_by_name(self.obj, field), 'verbose_name', field)
             for change_type in ('', 'swapcase', 'add_before', 'add_after'):
                 user = self.get_obj_for_edit()
@@ -7073,7 +7114,7 @@ class LoginNegativeCases(object):
         self.set_host_pre_blacklist_login(host='127.0.0.1')
         try:
             response = self.send_login_request(params)
-            message = self.get_error_message('wrong_login', self.field_username)
+            message = self.get_error_message('wrong_login', self.field_username, locals=locals())
             self.assertEqual(self.get_all_form_errors(response), message)
             self.check_is_not_authenticated()
             self.check_response_on_negative(response)
@@ -7091,7 +7132,7 @@ class LoginNegativeCases(object):
         self.set_host_pre_blacklist_login(host='127.0.0.1')
         try:
             response = self.send_login_request(params)
-            message = self.get_error_message('wrong_login', self.field_username)
+            message = self.get_error_message('wrong_login', self.field_username, locals=locals())
             self.assertEqual(self.get_all_form_errors(response), message)
             self.check_response_on_negative(response)
             self.check_blacklist_on_negative(response)
@@ -7110,7 +7151,7 @@ class LoginNegativeCases(object):
         self.set_host_blacklist(host='127.0.0.1', count=self.login_retries - 2)
         try:
             response = self.send_login_request(params)
-            message = self.get_error_message('wrong_login', self.field_username)
+            message = self.get_error_message('wrong_login', self.field_username, locals=locals())
             self.assertEqual(self.get_all_form_errors(response), message)
             self.check_response_on_negative(response)
             self.check_blacklist_on_negative(response, False)
@@ -7132,7 +7173,7 @@ class LoginNegativeCases(object):
 
             self.assert_errors(
                 response,
-                self.get_error_message('empty_required', 'captcha'),
+                self.get_error_message('empty_required', 'captcha', locals=locals()),
             )
             self.check_is_not_authenticated()
             self.check_response_on_negative(response)
@@ -7145,7 +7186,7 @@ class LoginNegativeCases(object):
         """
         login as user from blacklist with wrong captcha
         """
-        for field in ('captcha_0', 'captcha_1'):
+        for field in self.get_subcases(('captcha_0', 'captcha_1')):
             for value in self.custom_wrong_values.get(field, (u'йцу', u'\r', u'\n', u' ', ':')):
                 self.client = self.client_class()
                 self.clean_blacklist()
@@ -7158,7 +7199,7 @@ class LoginNegativeCases(object):
                     response = self.send_login_request(params)
                     self.assert_errors(
                         response,
-                        self.get_error_message('wrong_captcha', 'captcha'),
+                        self.get_error_message('wrong_captcha', 'captcha', locals=locals()),
                     )
                     self.check_is_not_authenticated()
                     self.check_response_on_negative(response)
@@ -7178,7 +7219,7 @@ class LoginNegativeCases(object):
             response = self.send_login_request(params)
             self.assert_errors(
                 response,
-                self.get_error_message('inactive_user', self.field_username),
+                self.get_error_message('inactive_user', self.field_username, locals=locals()),
             )
             self.check_is_not_authenticated()
             self.check_response_on_negative(response)
@@ -7198,7 +7239,7 @@ class LoginNegativeCases(object):
         self.set_host_pre_blacklist_login(host='127.0.0.1')
         try:
             response = self.send_login_request(params)
-            message = self.get_error_message('wrong_login', self.field_username)
+            message = self.get_error_message('wrong_login', self.field_username, locals=locals())
             self.assertEqual(self.get_all_form_errors(response), message)
             self.check_is_not_authenticated()
             self.check_response_on_negative(response)
@@ -7211,7 +7252,7 @@ class LoginNegativeCases(object):
         login with empty fields
         """
         _params = self.deepcopy(self.default_params)
-        for field in (self.field_password, self.field_username):
+        for field in self.get_subcases((self.field_password, self.field_username)):
             self.client = self.client_class()
             params = self.deepcopy(_params)
             self.add_csrf(params)
@@ -7222,7 +7263,7 @@ class LoginNegativeCases(object):
                 response = self.send_login_request(params)
                 self.assert_errors(
                     response,
-                    self.get_error_message('empty_required', field),
+                    self.get_error_message('empty_required', field, locals=locals()),
                 )
                 self.check_is_not_authenticated()
                 self.check_response_on_negative(response)
@@ -7235,7 +7276,7 @@ class LoginNegativeCases(object):
         login without required fields
         """
         _params = self.deepcopy(self.default_params)
-        for field in (self.field_password, self.field_username):
+        for field in self.get_subcases((self.field_password, self.field_username)):
             self.client = self.client_class()
             params = self.deepcopy(_params)
             self.add_csrf(params)
@@ -7246,7 +7287,7 @@ class LoginNegativeCases(object):
                 response = self.send_login_request(params)
                 self.assert_errors(
                     response,
-                    self.get_error_message('without_required', field),
+                    self.get_error_message('without_required', field, locals=locals()),
                 )
                 self.check_is_not_authenticated()
                 self.check_response_on_negative(response)
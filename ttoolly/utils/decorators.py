@@ -141,22 +141,31 @@ class only_with_any_files_params(object):
         return to_run
 
 
+def form_validation_subcases(fn):
+    """
+    Negative subcases of test can be checked by validation of form_class_add/form_class_edit instead of request
+    """
+    fn.form_validation_subcases = True
+    return fn
+
+
+def get_test_attrs_names(klass):
+    """names of test* attributes from class __dict__"""
+    return tuple(attr for attr in klass.__dict__ if attr.startswith('test'))
+
+
 def use_in_all_tests(decorator):
-    def decorate(cls, child=None):
-        if child is None:
-            child = cls
-
-        for attr in cls.__dict__:
-            if attr.startswith('test_') and callable(getattr(cls, attr)):
-                fn = getattr(child, attr, getattr(cls, attr))
-                if fn and decorator not in getattr(fn, 'decorators', ()):
-                    decorated = decorator(fn)
-                    decorated.__name__ = fn.__name__
-                    decorated.decorators = tuple(set(getattr(fn, 'decorators', ()))) + (decorator,)
-                    setattr(child, attr, decorated)
-        bases = cls.__bases__
-        for base in bases:
-            decorate(base, child)
+    def decorate(cls):
+        attrs = set()
+        for klass in cls.__mro__:
+            attrs.update(attr for attr in get_test_attrs_names(klass) if attr.startswith('test_'))
+        for attr in attrs:
+            fn = getattr(cls, attr)
+            if callable(fn) and decorator not in getattr(fn, 'decorators', ()):
+                decorated = decorator(fn)
+                decorated.__name__ = fn.__name__
+                decorated.decorators = tuple(set(getattr(fn, 'decorators', ()))) + (decorator,)
+                setattr(cls, attr, decorated)
         return cls
 
     return decorate
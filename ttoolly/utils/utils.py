@@ -11,21 +11,23 @@ import string
 import sys
 import traceback
 from builtins import str
+from collections import deque, namedtuple
 from datetime import date, datetime, time
 from decimal import Decimal
 from io import StringIO
 from shutil import copyfile
 from time import mktime
+from contextlib import contextmanager
 from uuid import uuid4
+from weakref import WeakKeyDictionary
 from xml.etree import ElementTree as et
 
-import pytz
 from django.conf import settings
 from django.core.cache import cache
 from django.core.files.base import ContentFile
 from django.core.files.uploadhandler import MemoryFileUploadHandler
+from django.db.models.signals import class_prepared
 from django.utils.datastructures import OrderedSet
-from lxml.html import document_fromstring
 
 try:
     from django.core.urlresolvers import NoReverseMatch, Resolver404, resolve, reverse
@@ -36,6 +38,8 @@ except ImportError:
 from django.forms.forms import NON_FIELD_ERRORS
 from django.template.context import Context
 from django.test import Client
+from django.test import client as test_client
+from django.test.utils import ContextList
 
 try:
     from django.utils.encoding import force_str as force_text
@@ -43,8 +47,26 @@ except ImportError:
     # Django < 4.0
     from django.utils.encoding import force_text
 
+try:
+    from functools import lru_cache
+except ImportError:
+    # python 2
+    from functools32 import lru_cache
+
+try:
+    from types import MappingProxyType
+except ImportError:
+    # python 2
+    MappingProxyType = dict
+
 import rstr
-from future.utils import viewitems, viewkeys, viewvalues
+
+try:
+    from traceback import TracebackException
+except ImportError:
+    # python 2
+    TracebackException = None
+from future.utils import python_2_unicode_compatible, viewitems, viewkeys, viewvalues
 from past.builtins import basestring, xrange
 
 __all__ = (
@@ -65,6 +87,10 @@ __all__ = (
     'get_real_fields_list_from_response',
     'get_fixtures_data',
     'get_keys_from_context',
+    'get_model_meta',
+    'get_mro_names',
+    'normalize_field_name',
+    'parse_field_name',
     'get_randname',
     'get_randname_from_file',
     'get_random_bmp_content',
@@ -90,11 +116,14 @@ __all__ = (
     'get_value_for_obj_field',
     'prepare_custom_file_for_tests',
     'prepare_file_for_tests',
+    'forms_only_capture',
+    'store_rendered_forms',
     'to_bytes',
     'unicode_to_readable',
     'update_filter_params',
     'FILE_TYPES',
     'FakeSizeMemoryFileUploadHandler',
+    'LazyError',
 )
 
 
@@ -139,7 +168,7 @@ def fill_all_obj_fields(obj, fields=(), save=True, get_value_method=None):
 
 
 def format_errors(errors, space_count=0):
-    joined_errors = '\n\n'.join(errors)
+    joined_errors = '\n\n'.join([force_text(error) for error in errors])
     if space_count > 0:
         spaces = ' ' * space_count
         joined_errors = spaces + ('\n' + spaces).join(joined_errors.splitlines())
@@ -204,20 +233,92 @@ def generate_sql(data):
 
 
 def get_all_field_names_from_model(model_name):
-    """from django docs"""
+    return list(get_model_meta(model_name).field_names)
+
+
+class ModelMeta(
+    namedtuple('ModelMeta', ('model', 'fields', 'field_names', 'object_fields', 'related_objects', 'values_ranges'))
+):
+    """
+    Model fields data for tests helpers, built once per model:
+    fields - {name or attname: field}, object_fields - names with accessor names for related objects,
+    related_objects - {accessor name: var name}, values_ranges - {name: (max values, min values)} for numeric fields
+    """
+
+    __slots__ = ()
+
+    def get_field(self, name):
+        field = self.fields.get(name, None)
+        return field if field is not None else self.model._meta.get_field(name)
+
+
+def _get_field_values_range(field):
+    class_name = field.__class__.__name__
+    if 'SmallInteger' in class_name:
+        return (32767,), (0,) if 'Positive' in class_name else (-32767 - 1,)
+    if 'Integer' in class_name:
+        return (
+            (2147483647, sys.maxsize),
+            (0,) if 'Positive' in class_name else (-2147483647 - 1, -sys.maxsize - 1),
+        )
+    if 'Float' in class_name or 'Decimal' in class_name:
+        return (sys.float_info.max,), (-sys.float_info.max,)
+    return (), ()
+
+
+def _build_model_meta(model):
     from itertools import chain
 
-    return list(
-        set(
-            chain.from_iterable(
-                (field.name, field.attname) if hasattr(field, 'attname') else (field.name,)
-                for field in model_name._meta.get_fields()
-                # For complete backwards compatibility, you may want to exclude
-                # GenericForeignKey from the results.
-                if not (field.many_to_one and field.related_model is None)
-            )
+    all_fields = model._meta.get_fields()
+    field_names = frozenset(
+        chain.from_iterable(
+            (field.name, field.attname) if hasattr(field, 'attname') else (field.name,)
+            for field in all_fields
+            # For complete backwards compatibility, you may want to exclude
+            # GenericForeignKey from the results.
+            if not (field.many_to_one and field.related_model is None)
         )
     )
+    fields = {name: model._meta.get_field(name) for name in field_names}
+    object_fields = tuple(
+        force_text(field.get_accessor_name())
+        if field.__class__.__name__ in ('RelatedObject', 'ManyToOneRel', 'OneToOneRel')
+        else force_text(field.name)
+        for field in all_fields
+    )
+    related_objects = {
+        field.get_accessor_name(): getattr(field, 'var_name', field.get_accessor_name())
+        for field in all_fields
+        if (field.one_to_many or field.one_to_one) and field.auto_created and not field.concrete
+    }
+    values_ranges = {name: _get_field_values_range(field) for name, field in viewitems(fields)}
+    return ModelMeta(
+        model,
+        MappingProxyType(fields),
+        field_names,
+        object_fields,
+        MappingProxyType(related_objects),
+        MappingProxyType(values_ranges),
+    )
+
+
+_models_meta = {}
+
+
+def get_model_meta(model):
+    """model class or object"""
+    model = model if isinstance(model, type) else model.__class__
+    if model not in _models_meta:
+        _models_meta[model] = _build_model_meta(model)
+    return _models_meta[model]
+
+
+def clear_models_meta(**kwargs):
+    """New model can add related objects to existing models"""
+    _models_meta.clear()
+
+
+class_prepared.connect(clear_models_meta, dispatch_uid='ttoolly-clear-models-meta')
 
 
 def get_all_form_errors(response):
@@ -324,7 +425,7 @@ def get_all_form_errors(response):
             value = subcontext[key]
             value = value if isinstance(value, list) else [value]
             for v in value:
-                mro_names = [cn.__name__ for cn in getattr(v.__class__, '__mro__', [])]
+                mro_names = get_mro_names(v.__class__)
                 if 'BaseFormSet' in mro_names:
                     form_errors.update(get_formset_errors(v))
                 elif 'BaseForm' in mro_names:
@@ -406,6 +507,37 @@ def get_error(tr_limit=None):
     return result
 
 
+@python_2_unicode_compatible
+class LazyError(object):
+    """
+    Current exception as type, message and frames summary without locals. Formatted only on output
+    """
+
+    def __init__(self, text='', tr_limit=None):
+        self.text = text
+        self.exception = None
+        self._formatted = None
+        etype, value, tb = sys.exc_info()
+        if TracebackException is None:
+            self._formatted = text + get_error(tr_limit)
+        elif any([etype, value, tb]):
+            self.exception = TracebackException(
+                etype, value, tb, limit=tr_limit or getattr(settings, 'TEST_TRACEBACK_LIMIT', None), lookup_lines=False
+            )
+
+    def __bool__(self):
+        return bool(self._formatted or self.text or self.exception)
+
+    __nonzero__ = __bool__
+
+    def __str__(self):
+        if self._formatted is None:
+            err = ''.join([force_text(el) for el in self.exception.format()]) if self.exception else ''
+            self._formatted = self.text + unicode_to_readable(err)
+            self.exception = None
+        return self._formatted
+
+
 def get_field_from_response(response, field_name):
     def get_form_fields(form):
         fields = dict(form.fields)
@@ -450,7 +582,7 @@ def get_field_from_response(response, field_name):
             value = subcontext[key]
             value = value if isinstance(value, list) else [value]
             for v in value:
-                mro_names = [cn.__name__ for cn in getattr(v.__class__, '__mro__', [])]
+                mro_names = get_mro_names(v.__class__)
                 if 'BaseFormSet' in mro_names:
                     formset = v
                     for form in getattr(formset, 'forms', formset):
@@ -577,7 +709,7 @@ def get_fields_list_from_response(response, only_success=True):
             value = subcontext[key]
             value = value if isinstance(value, list) else [value]
             for v in value:
-                mro_names = [cn.__name__ for cn in getattr(v.__class__, '__mro__', [])]
+                mro_names = get_mro_names(v.__class__)
                 if 'BaseFormSet' in mro_names:
                     formset = v
                     for form in getattr(formset, 'forms', formset):
@@ -641,6 +773,8 @@ def get_real_fields_list_from_response(response, only_success=True):
     if only_success and response.status_code != 200:
         raise Exception('Response status code %s (expect 200 for getting fields list)' % response.status_code)
 
+    from lxml.html import document_fromstring
+
     doc = document_fromstring(response.content.decode('utf-8'))
     fields = []
     visible_fields = []
@@ -679,10 +813,10 @@ def get_fixtures_data(filename):
 
 
 def get_keys_from_context(subcontext):
-    context_list = [subcontext]
+    context_list = deque([subcontext])
     all_keys = []
     while context_list:
-        subcontext = context_list.pop(0)
+        subcontext = context_list.popleft()
         for d in getattr(subcontext, 'dicts', []) or [subcontext]:
             if isinstance(d, Context):
                 context_list.append(d)
@@ -691,6 +825,32 @@ def get_keys_from_context(subcontext):
     return all_keys
 
 
+_mro_names = WeakKeyDictionary()
+
+
+def get_mro_names(cls):
+    if cls not in _mro_names:
+        _mro_names[cls] = frozenset(cn.__name__ for cn in getattr(cls, '__mro__', []))
+    return _mro_names[cls]
+
+
+@lru_cache(maxsize=4096)
+def parse_field_name(name):
+    """
+    Returns (block name, index, subfield, name with -0- instead of all inline indexes).
+    Example: 'block-2-field' -> ('block', 2, 'field', 'block-0-field')
+    """
+    match = re.match(r'^(.*?)\-(\d+)\-(.*)$', name)
+    if match:
+        return (match.group(1), int(match.group(2)), match.group(3), re.sub(r'\-\d+\-', '-0-', name))
+    return (name, None, None, name)
+
+
+def normalize_field_name(field):
+    """for inline fields use name with -0-"""
+    return parse_field_name(field)[3] if isinstance(field, basestring) else field
+
+
 def get_randname(l=10, _type='a', length_of_chunk=10):
     """
     a - all
@@ -812,6 +972,8 @@ def get_value_for_obj_field(f, filename=None):
             return get_randname(length)
     elif 'DateTimeField' in mro_names:
         if getattr(settings, 'USE_TZ', False) and getattr(settings, 'TIME_ZONE', None):
+            import pytz
+
             return datetime.now(pytz.timezone(settings.TIME_ZONE))
         return datetime.now()
     elif 'DateField' in mro_names:
@@ -1309,3 +1471,50 @@ def reorder_suite(suite, classes, reverse=False):
     for i in range(class_count + 1):
         reordered_suite.addTests(bins[i])
     return reordered_suite
+
+
+FORMS_CONTEXT_KEYS = ('adminform', 'form', 'form_set', 'forms', 'inline_admin_formsets', 'messages', 'wizard')
+
+
+def store_rendered_forms(store, signal, sender, template, context, **kwargs):
+    """
+    Replacement for django.test.client.store_rendered_templates. Stores only forms, formsets
+    and values with them instead of copies of all rendered contexts
+    """
+    store.setdefault('templates', []).append(template)
+    if 'context' not in store:
+        store['context'] = ContextList()
+    # included, extended and nested templates are rendered with the same forms, they are already stored.
+    # Stored values are referenced from store, so their ids can't be reused by other objects
+    stored_ids = store.setdefault('forms_ids', set())
+    forms_context = {}
+    seen = set()
+    for d in reversed(getattr(context, 'dicts', [context])):
+        for key, value in viewitems(d):
+            if key in seen:
+                continue
+            seen.add(key)
+            if key in FORMS_CONTEXT_KEYS:
+                forms_context[key] = value
+                continue
+            for v in value if isinstance(value, list) else [value]:
+                if get_mro_names(type(v)).intersection(('BaseForm', 'BaseFormSet')):
+                    forms_context[key] = value
+                    break
+    forms_context = {k: v for k, v in viewitems(forms_context) if id(v) not in stored_ids}
+    stored_ids.update(id(v) for v in viewvalues(forms_context))
+    if forms_context or not store['context']:
+        store['context'].append(Context(forms_context))
+
+
+@contextmanager
+def forms_only_capture():
+    """
+    Store only forms in response.context of test client
+    """
+    original = test_client.store_rendered_templates
+    test_client.store_rendered_templates = store_rendered_forms
+    try:
+        yield
+    finally:
+        test_client.store_rendered_templates = original